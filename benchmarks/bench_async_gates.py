@@ -0,0 +1,88 @@
+"""
+Async Gates Benchmark - thousands of gate coroutines on one AsyncParkingLot
+
+Each gate coroutine parks a vehicle, looks it up and removes it. Reports
+throughput and per-operation latency percentiles for two cases: many gates on
+a lot sized to the gate count, and a few gates on a large lot (the cost of
+publishing reads grows with the lot, not the number of gates).
+Run: python benchmarks/bench_async_gates.py [gates] [rounds] [large_lot_slots]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from AsyncParkingLot import AsyncParkingLot
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def gate(lot, gate_number, rounds, latencies, errors):
+    is_electric = gate_number % 4 == 0
+    for n in range(rounds):
+        registration = f"G{gate_number}-{n}"
+
+        start = time.perf_counter()
+        slot_number = await lot.park_vehicle(registration, "Make", "Model", "Blue", is_electric, False)
+        latencies["park"].append(time.perf_counter() - start)
+        if slot_number == -1:
+            errors.append(f"{registration}: not parked")
+            continue
+
+        start = time.perf_counter()
+        found = await lot.find_slot_by_registration(registration)
+        latencies["read"].append(time.perf_counter() - start)
+        if found.get("slot_number") != slot_number:
+            errors.append(f"{registration}: snapshot shows {found}")
+
+        start = time.perf_counter()
+        await lot.remove_vehicle(slot_number, is_electric)
+        latencies["remove"].append(time.perf_counter() - start)
+
+
+async def run(gates, rounds, capacity):
+    latencies = {"park": [], "read": [], "remove": []}
+    errors = []
+    async with AsyncParkingLot() as lot:
+        await lot.create_parking_lot(capacity, capacity, 1)
+        # Fill all but room for the gates, so the lot is as large as capacity says
+        filler = [(f"F{n}", "Make", "Model", "Red", False, False) for n in range(capacity - gates)]
+        await lot.park_vehicles(filler)
+        start = time.perf_counter()
+        await asyncio.gather(*(gate(lot, number, rounds, latencies, errors) for number in range(gates)))
+        elapsed = time.perf_counter() - start
+    return elapsed, latencies, errors
+
+
+def report(gates, rounds, capacity):
+    elapsed, latencies, errors = asyncio.run(run(gates, rounds, capacity))
+    operations = sum(len(samples) for samples in latencies.values())
+
+    print(f"{gates} gate coroutines x {rounds} rounds, {capacity:,}-slot pools - {operations / elapsed:,.0f} ops/s")
+    print(f"{'Operation':<10}{'Count':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    print("-" * 40)
+    for name, samples in latencies.items():
+        print(f"{name:<10}{len(samples):>10}{percentile(samples, 0.5) * 1000:>10.2f}{percentile(samples, 0.99) * 1000:>10.2f}")
+    print(f"Errors: {len(errors)}")
+    for error in errors[:5]:
+        print(f"  {error}")
+
+
+def main():
+    gates = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    large_lot = int(sys.argv[3]) if len(sys.argv) > 3 else 100000
+
+    report(gates, rounds, gates)
+    print()
+    report(4, 500, large_lot)
+
+
+if __name__ == "__main__":
+    main()
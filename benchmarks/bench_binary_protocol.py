@@ -0,0 +1,100 @@
+"""
+Binary Protocol Benchmark - plate-read throughput over the binary protocol
+
+Starts BinaryParkingServer in-process, then each client thread runs
+park -> find -> remove rounds three ways: one request at a time, pipelined
+(a whole wave of requests sent before reading) and as BATCH frames.
+Reports operations/second and p50/p99 latency per round trip.
+Run: python benchmarks/bench_binary_protocol.py [clients] [rounds_per_client]
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from BinaryProtocol import BinaryParkingClient, BinaryParkingServer
+
+WAVE = 50
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def park_request(registration):
+    return ("park", registration, "Make", "Model", "Blue", False, False)
+
+
+def single_client(client, client_number, rounds, latencies):
+    for n in range(rounds):
+        registration = f"C{client_number}-{n}"
+        start = time.perf_counter()
+        slot_number = client.park(*park_request(registration)[1:])
+        client.find(registration)
+        client.remove(slot_number)
+        latencies.append((time.perf_counter() - start) / 3)
+
+
+def wave_client(send):
+    # Each wave is two round trips: parks + finds, then removes
+    def run(client, client_number, rounds, latencies):
+        for wave in range(0, rounds, WAVE):
+            registrations = [f"C{client_number}-{n}" for n in range(wave, min(wave + WAVE, rounds))]
+            start = time.perf_counter()
+            results = send(client, [park_request(r) for r in registrations] + [("find", r) for r in registrations])
+            latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            send(client, [("remove", slot_number, False) for slot_number in results[:len(registrations)]])
+            latencies.append(time.perf_counter() - start)
+    return run
+
+
+def measure(client_fn, clients, rounds):
+    server = BinaryParkingServer(("127.0.0.1", 0))
+    server.parking_lot.create_parking_lot(clients * WAVE, 0, 1)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    connections = [BinaryParkingClient(server.server_address) for _ in range(clients)]
+    latencies = []
+    threads = [threading.Thread(target=client_fn, args=(connection, number, rounds, latencies))
+               for number, connection in enumerate(connections)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    for connection in connections:
+        connection.close()
+    server.shutdown()
+    server.server_close()
+    return elapsed, latencies
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    operations = clients * rounds * 3
+
+    modes = (
+        ("single", single_client, "per request"),
+        ("pipelined", wave_client(BinaryParkingClient.pipeline), f"per {WAVE}-round wave half"),
+        ("batch", wave_client(BinaryParkingClient.batch), f"per {WAVE}-round wave half"),
+    )
+    print(f"{clients} clients x {rounds} park/find/remove rounds")
+    print(f"{'Mode':<11}{'Ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}  Latency measured")
+    print("-" * 70)
+    for mode, client_fn, unit in modes:
+        elapsed, latencies = measure(client_fn, clients, rounds)
+        print(f"{mode:<11}{operations / elapsed:>10,.0f}{percentile(latencies, 0.5) * 1000:>10.3f}"
+              f"{percentile(latencies, 0.99) * 1000:>10.3f}  {unit}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Concurrent Gates Benchmark - park/remove throughput vs gate thread count
+
+Every gate thread parks and removes its own vehicles on one shared thread_safe
+ParkingLot. Before removing, a gate checks the slot still holds its vehicle, so
+any double allocation fails the run. Half the gates park EVs, half regular cars,
+so the two pool locks are both exercised.
+CPython threads share the GIL - expect correctness, not linear scaling.
+Run: python benchmarks/bench_concurrent_gates.py [operations_per_gate]
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from ParkingLot import ParkingLot
+
+GATE_COUNTS = (1, 2, 4, 8)
+CAPACITY = 500
+# Vehicles each gate holds at once - overlapping waves keep the allocators contended
+WAVE_SIZE = 25
+
+
+def run_gate(lot, gate, operations, is_electric, errors):
+    # Park a wave of vehicles, check each still owns its slot, then remove the wave
+    slots = lot.ev_slots if is_electric else lot.regular_slots
+    for wave_start in range(0, operations, WAVE_SIZE):
+        parked = []
+        for n in range(wave_start, min(wave_start + WAVE_SIZE, operations)):
+            registration = f"G{gate}-{n}"
+            slot_number = lot.park_vehicle(registration, "Make", "Model", "Blue", is_electric, False)
+            if slot_number != -1:
+                parked.append((registration, slot_number))
+
+        for registration, slot_number in parked:
+            vehicle = slots[slot_number - 1]
+            if vehicle is None or vehicle.regnum != registration:
+                errors.append(f"{registration}: slot {slot_number} holds {vehicle and vehicle.regnum}")
+            lot.remove_vehicle(slot_number, is_electric)
+
+
+def check_consistency(lot):
+    # Empty lot afterwards - every slot free, every index empty
+    problems = []
+    if lot.regular_allocator.occupied_count or lot.ev_allocator.occupied_count:
+        problems.append("allocator still reports occupied slots")
+    if list(lot.regular_slots.occupied_indexes()) or list(lot.ev_slots.occupied_indexes()):
+        problems.append("slots still occupied")
+    if len(lot.registration_index):
+        problems.append("registration index not empty")
+    return problems
+
+
+def measure(gates, operations):
+    lot = ParkingLot(thread_safe=True)
+    lot.create_parking_lot(CAPACITY, CAPACITY, 1)
+    errors = []
+    threads = [
+        threading.Thread(target=run_gate, args=(lot, gate, operations, gate % 2 == 1, errors))
+        for gate in range(gates)
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    errors.extend(check_consistency(lot))
+    return gates * operations * 2 / elapsed, errors
+
+
+def main():
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    # Short switch interval so gates interleave mid-operation
+    sys.setswitchinterval(1e-5)
+
+    print(f"{'Gates':>6}{'Ops/s':>14}  Double allocations / inconsistencies")
+    print("-" * 60)
+    failed = False
+    for gates in GATE_COUNTS:
+        ops_per_second, errors = measure(gates, operations)
+        failed = failed or bool(errors)
+        print(f"{gates:>6}{ops_per_second:>14,.0f}  {len(errors)}")
+        for error in errors[:5]:
+            print(f"        {error}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
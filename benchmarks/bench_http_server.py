@@ -0,0 +1,105 @@
+"""
+HTTP Server Benchmark - load generator for the HTTP/JSON API
+
+Starts ParkingHTTPServer in-process on a free localhost port, then each client
+thread holds one keep-alive connection and loops park -> lookup -> remove.
+A second pass sends the same work as POST /batch requests.
+Reports requests/second, operations/second and p50/p99 request latency.
+Run: python benchmarks/bench_http_server.py [clients] [rounds_per_client]
+"""
+
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from ParkingServer import ParkingHTTPServer
+
+BATCH_ROUNDS = 25
+HEADERS = {"Content-Type": "application/json"}
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def timed_request(connection, method, path, latencies, body=None):
+    start = time.perf_counter()
+    # Bytes body so http.client sends headers and body in one segment
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    connection.request(method, path, body=data, headers=HEADERS)
+    response = connection.getresponse()
+    payload = json.loads(response.read())
+    latencies.append(time.perf_counter() - start)
+    return payload
+
+
+def park_body(registration):
+    return {"registration": registration, "make": "Make", "model": "Model", "color": "Blue"}
+
+
+def single_client(port, client, rounds, latencies):
+    # One request per operation: 3 requests per round
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    for n in range(rounds):
+        registration = f"C{client}-{n}"
+        parked = timed_request(connection, "POST", "/park", latencies, park_body(registration))
+        timed_request(connection, "GET", f"/registration/{registration}", latencies)
+        timed_request(connection, "POST", "/remove", latencies, {"slot_number": parked["slot_number"]})
+    connection.close()
+
+
+def batch_client(port, client, rounds, latencies):
+    # BATCH_ROUNDS rounds per request: all parks, all lookups, then all removes
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    for wave in range(0, rounds, BATCH_ROUNDS):
+        registrations = [f"C{client}-{n}" for n in range(wave, min(wave + BATCH_ROUNDS, rounds))]
+        operations = [dict(park_body(registration), op="park") for registration in registrations]
+        operations += [{"op": "find", "registration": registration} for registration in registrations]
+        results = timed_request(connection, "POST", "/batch", latencies, {"operations": operations})["results"]
+        removes = [{"op": "remove", "slot_number": result["slot_number"]} for result in results[:len(registrations)]]
+        timed_request(connection, "POST", "/batch", latencies, {"operations": removes})
+    connection.close()
+
+
+def measure(client_fn, clients, rounds):
+    server = ParkingHTTPServer(("127.0.0.1", 0))
+    server.service.parking_lot.create_parking_lot(clients * BATCH_ROUNDS, 0, 1)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    latencies = []
+    threads = [threading.Thread(target=client_fn, args=(port, client, rounds, latencies)) for client in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    server.shutdown()
+    server.server_close()
+    return elapsed, latencies
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    operations = clients * rounds * 3
+
+    print(f"{clients} keep-alive clients x {rounds} park/lookup/remove rounds")
+    print(f"{'Mode':<10}{'Requests':>10}{'Req/s':>10}{'Ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    print("-" * 60)
+    for mode, client_fn in (("single", single_client), ("batch", batch_client)):
+        elapsed, latencies = measure(client_fn, clients, rounds)
+        print(f"{mode:<10}{len(latencies):>10}{len(latencies) / elapsed:>10,.0f}{operations / elapsed:>10,.0f}"
+              f"{percentile(latencies, 0.5) * 1000:>10.2f}{percentile(latencies, 0.99) * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Journal Benchmark - sustained journaled write throughput and replay speed
+
+Write side: park/remove pairs on a journaled lot, fsync on, with 1/4/16 gate
+threads sharing group commits, and with park_vehicles() batches. Shows how
+many records each fsync covered.
+Replay side: recover_lot() on a journal of N records.
+Run: python benchmarks/bench_journal.py [seconds_per_case] [replay_records]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from ParkingJournal import recover_lot
+
+BATCH = 50
+
+
+def gate_loop(lot, gate, deadline, counts):
+    operations = 0
+    n = 0
+    while time.perf_counter() < deadline:
+        slot_number = lot.park_vehicle(f"G{gate}-{n}", "Make", "Model", "Blue", False, False)
+        lot.remove_vehicle(slot_number, False)
+        operations += 2
+        n += 1
+    counts.append(operations)
+
+
+def batch_loop(lot, gate, deadline, counts):
+    operations = 0
+    n = 0
+    while time.perf_counter() < deadline:
+        batch = [(f"G{gate}-{n + i}", "Make", "Model", "Blue", False, False) for i in range(BATCH)]
+        results = lot.park_vehicles(batch)
+        lot.remove_vehicles([(result["slot_number"], False) for result in results])
+        operations += 2 * BATCH
+        n += BATCH
+    counts.append(operations)
+
+
+def measure_writes(loop, gates, seconds):
+    with tempfile.TemporaryDirectory() as directory:
+        lot, journal = recover_lot(directory, thread_safe=True)
+        lot.create_parking_lot(gates * BATCH, 0, 1)
+        start_commits = journal.commits
+        counts = []
+        deadline = time.perf_counter() + seconds
+        threads = [threading.Thread(target=loop, args=(lot, gate, deadline, counts)) for gate in range(gates)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        commits = journal.commits - start_commits
+        journal.close()
+    operations = sum(counts)
+    return operations / elapsed, operations / max(commits, 1)
+
+
+def measure_replay(records):
+    with tempfile.TemporaryDirectory() as directory:
+        lot, journal = recover_lot(directory, fsync=False)
+        lot.create_parking_lot(records, 0, 1)
+        # Park everything, then free every other slot - replay mixes parks and removes
+        results = lot.park_vehicles([(f"R{n}", "Make", "Model", "Blue", False, False) for n in range(records // 3 * 2)])
+        lot.remove_vehicles([(result["slot_number"], False) for result in results[::2]])
+        journal.close()
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+        start = time.perf_counter()
+        recovered, journal = recover_lot(directory)
+        elapsed = time.perf_counter() - start
+        journal.close()
+    assert len(recovered.get_all_regular_vehicles()) == len(lot.get_all_regular_vehicles())
+    return journal.last_sequence, size, elapsed
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    replay_records = int(sys.argv[2]) if len(sys.argv) > 2 else 300000
+
+    print(f"Journaled writes, fsync on, {seconds:.0f}s per case")
+    print(f"{'Case':<24}{'Ops/s':>12}{'Records/fsync':>16}")
+    print("-" * 52)
+    cases = [("1 gate", gate_loop, 1), ("4 gates", gate_loop, 4), ("16 gates", gate_loop, 16),
+             (f"1 gate, batches of {BATCH}", batch_loop, 1)]
+    for name, loop, gates in cases:
+        ops_per_second, per_commit = measure_writes(loop, gates, seconds)
+        print(f"{name:<24}{ops_per_second:>12,.0f}{per_commit:>16.1f}")
+
+    records, size, elapsed = measure_replay(replay_records)
+    print()
+    print(f"Replay: {records:,} records ({size / records:.1f} bytes each) in {elapsed * 1000:.0f} ms"
+          f" - {records / elapsed:,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
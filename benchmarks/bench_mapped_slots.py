@@ -0,0 +1,88 @@
+"""
+Mapped Slot Benchmark - warm restart and report reads on a memory-mapped slot table
+
+Fills one large lot (default 100,000 slots, 10% EV) whose pools live in mapped
+files, then compares getting a restarted process back to serving: mapping the
+files again (open_mapped_lot) against loading a LotSnapshot of the same lot.
+Also times status/charge report reads - rows read straight from the mapping
+against building every Vehicle through get_all_*_vehicles().
+Run: python benchmarks/bench_mapped_slots.py [slots]
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from LotSnapshot import load_lot, save_snapshot
+from MappedSlotStore import flush_lot, open_mapped_lot
+
+COLORS = ("Red", "Blue", "White", "Black", "Silver", "Green")
+MAKES = (("Toyota", "Corolla"), ("Honda", "Civic"), ("Tesla", "Model 3"), ("Ford", "Focus"), ("BMW", "i3"))
+
+
+def fill(lot, slots):
+    ev_capacity = slots // 10
+    lot.create_parking_lot(slots - ev_capacity, ev_capacity, 1)
+    for n in range(slots - ev_capacity):
+        make, model = MAKES[n % len(MAKES)]
+        lot.park_vehicle(f"R{n:07d}", make, model, COLORS[n % len(COLORS)], False, n % 7 == 0)
+    for n in range(ev_capacity):
+        make, model = MAKES[n % len(MAKES)]
+        lot.park_vehicle(f"E{n:07d}", make, model, COLORS[n % len(COLORS)], True, n % 5 == 0)
+
+
+def best_of(runs, action):
+    best = None
+    for _ in range(runs):
+        gc.collect()
+        start = time.perf_counter()
+        result = action()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    slots = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    with tempfile.TemporaryDirectory() as directory:
+        mapped_directory = os.path.join(directory, "slots")
+        lot = open_mapped_lot(mapped_directory)
+        fill(lot, slots)
+        flush_lot(lot)
+        snapshot_path = os.path.join(directory, "lot.snap")
+        save_snapshot(lot, snapshot_path)
+
+        map_seconds, mapped = best_of(5, lambda: open_mapped_lot(mapped_directory))
+        load_seconds, loaded = best_of(5, lambda: load_lot(snapshot_path))
+        assert mapped.get_regular_rows() == loaded.get_regular_rows() and mapped.get_ev_rows() == loaded.get_ev_rows()
+        assert mapped.find_slot_by_registration("E0000001") == loaded.find_slot_by_registration("E0000001")
+
+        print(f"{slots:,}-slot lot, fully parked")
+        print(f"{'Warm restart':<28}{'ms':>10}")
+        print("-" * 38)
+        print(f"{'map slot files':<28}{map_seconds * 1000:>10.1f}")
+        print(f"{'load snapshot':<28}{load_seconds * 1000:>10.1f}")
+        print()
+
+        rows_seconds, _ = best_of(5, lambda: (mapped.get_regular_rows(), mapped.get_ev_rows()))
+        vehicles_seconds, _ = best_of(5, lambda: (mapped.get_all_regular_vehicles(), mapped.get_all_ev_vehicles()))
+        charge_rows_seconds, _ = best_of(5, mapped.get_ev_rows)
+        charge_vehicles_seconds, _ = best_of(5, mapped.get_all_ev_vehicles)
+
+        print(f"{'Report read (mapped lot)':<28}{'rows ms':>10}{'vehicles ms':>14}")
+        print("-" * 52)
+        print(f"{'status (all slots)':<28}{rows_seconds * 1000:>10.1f}{vehicles_seconds * 1000:>14.1f}")
+        print(f"{'charge (EV pool)':<28}{charge_rows_seconds * 1000:>10.1f}{charge_vehicles_seconds * 1000:>14.1f}")
+
+        # Unmap before the directory is removed
+        for store in (lot.regular_slots, lot.ev_slots, mapped.regular_slots, mapped.ev_slots):
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
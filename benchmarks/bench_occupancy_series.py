@@ -0,0 +1,134 @@
+"""
+Occupancy Series Benchmark - recording overhead, footprint and dashboard queries
+
+Times park/remove throughput with and without an attached OccupancySeries,
+then feeds a recorder simulated traffic for one pool (default 90 days,
+simulated clock, an arrival or departure every few seconds) and compares
+dashboard queries - the 90-day hourly graph and the last week per minute -
+against replaying the event log into the same buckets. Ring memory is
+reported after one day and at the end.
+Run: python benchmarks/bench_occupancy_series.py [days]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from OccupancySeries import OccupancySeries
+from ParkingLot import ParkingLot
+from VehicleIndex import REGULAR_SLOT
+
+SLOTS = 2000
+LOT_OPERATIONS = 100000
+
+
+def lot_rate(occupancy):
+    # Park then remove LOT_OPERATIONS vehicles - operations per second
+    lot = ParkingLot()
+    if occupancy is not None:
+        lot.attach_occupancy(occupancy)
+    lot.create_parking_lot(LOT_OPERATIONS, 0, 1)
+    start = time.perf_counter()
+    for n in range(LOT_OPERATIONS):
+        lot.park_vehicle(f"V{n:07d}", "Make", "Model", "Color", False, False)
+    for slot_number in range(1, LOT_OPERATIONS + 1):
+        lot.remove_vehicle(slot_number, False)
+    return 2 * LOT_OPERATIONS / (time.perf_counter() - start)
+
+
+def simulate(occupancy, days, clock):
+    # Occupancy drifts with a daily cycle - events are (time, occupied) as a log would keep them
+    rng = random.Random(7)
+    events = []
+    occupied = 0
+    occupancy.reset(1, [(REGULAR_SLOT, 0, SLOTS)])
+    end = days * 86400
+    while clock[0] < end:
+        clock[0] += rng.expovariate(1 / 4.0)
+        hour = clock[0] % 86400 / 3600
+        target = SLOTS * (0.85 if 8 <= hour < 18 else 0.2)
+        if occupied < SLOTS and (occupied == 0 or rng.random() < 0.5 + (target - occupied) / SLOTS):
+            occupied += 1
+        else:
+            occupied -= 1
+        occupancy.record(1, REGULAR_SLOT, occupied, SLOTS)
+        events.append((clock[0], occupied))
+    return events
+
+
+def replay(events, seconds, start, end):
+    # Time-weighted mean per bucket from the raw event log - what a dashboard does without the rings
+    areas = {}
+    for (at, occupied), (until, _) in zip(events, events[1:] + [(end, 0)]):
+        at, until = max(at, start), min(until, end)
+        while at < until:
+            bucket = int(at // seconds)
+            step_end = min(until, (bucket + 1) * seconds)
+            areas[bucket] = areas.get(bucket, 0.0) + occupied * (step_end - at)
+            at = step_end
+    return [(bucket * seconds, area / seconds) for bucket, area in sorted(areas.items())]
+
+
+def ring_bytes(occupancy):
+    return sum(column.itemsize * len(column) for floor in occupancy._levels.values() for series in floor.values()
+               for ring in series.rings.values() for column in (ring.means, ring.peaks, ring.lows))
+
+
+def best_of(runs, action):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = action()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 90
+
+    plain_rate = lot_rate(None)
+    recorded_rate = lot_rate(OccupancySeries())
+    print(f"{'ParkingLot park/remove':<28}{'ops/s':>12}")
+    print("-" * 40)
+    print(f"{'no recorder':<28}{plain_rate:>12,.0f}")
+    print(f"{'OccupancySeries attached':<28}{recorded_rate:>12,.0f}")
+    print()
+
+    clock = [0.0]
+    occupancy = OccupancySeries(clock=lambda: clock[0])
+    simulate(occupancy, 1, clock)
+    day_bytes = ring_bytes(occupancy)
+    clock[0] = 0.0
+    occupancy = OccupancySeries(clock=lambda: clock[0])
+    start = time.perf_counter()
+    events = simulate(occupancy, days, clock)
+    simulate_seconds = time.perf_counter() - start
+    now = clock[0]
+
+    print(f"{len(events):,} events over {days} simulated days ({simulate_seconds:.1f} s incl. recording)")
+    print(f"ring memory: {day_bytes / 1024:,.0f} KiB after 1 day, {ring_bytes(occupancy) / 1024:,.0f} KiB after {days} days "
+          f"(3 series); event log {len(events):,} entries")
+    print()
+
+    week = now - 7 * 86400
+    hourly_seconds, hourly = best_of(5, lambda: occupancy.series(1, REGULAR_SLOT, "hour"))
+    minute_seconds, minutes = best_of(5, lambda: occupancy.series(1, REGULAR_SLOT, "minute", week, now))
+    oldest_hour = hourly["points"][0][0]
+    replay_hourly_seconds, replayed = best_of(1, lambda: replay(events, 3600, oldest_hour, now))
+    replay_minute_seconds, _ = best_of(1, lambda: replay(events, 60, minutes["points"][0][0], now))
+    # Closed hours agree with the replay
+    for (bucket_start, mean, _, _), (replay_start, replay_mean) in zip(hourly["points"][1:-1], replayed[1:-1]):
+        assert bucket_start == replay_start and abs(mean - replay_mean) < 1e-6 * SLOTS
+
+    print(f"{'Dashboard query':<28}{'points':>8}{'rings ms':>12}{'replay ms':>12}")
+    print("-" * 60)
+    print(f"{'hourly, all kept':<28}{len(hourly['points']):>8}{hourly_seconds * 1000:>12.2f}{replay_hourly_seconds * 1000:>12.1f}")
+    print(f"{'per minute, last week':<28}{len(minutes['points']):>8}{minute_seconds * 1000:>12.2f}{replay_minute_seconds * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Report Render Benchmark - lot status / EV charge report time vs lot size
+
+Compares the previous per-line rendering (one insert and tag_config per row) with
+the single-insert report builders. Tk rendering is measured when a display is
+available; otherwise only report building is timed.
+Run: python benchmarks/bench_report_render.py
+"""
+
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from ParkingLot import ParkingLot
+from StatusView import build_status_report, build_charge_report, format_status_row, charge_color
+
+LOT_SIZES = (100, 1000, 5000, 20000)
+
+
+def make_lot(size):
+    # Half regular, half EV - every slot occupied
+    lot = ParkingLot()
+    lot.create_parking_lot(size // 2, size // 2, 1)
+    for i in range(size // 2):
+        lot.park_vehicle(f"REG{i}", "Toyota", "Corolla", "Red", False, False)
+        lot.park_vehicle(f"EV{i}", "Tesla", "Model 3", "White", True, False)
+    for i, (_, vehicle) in enumerate(lot.get_all_ev_vehicles()):
+        vehicle.charge = i % 101
+    return lot
+
+
+def legacy_render(text_widget, regular, ev, level):
+    # Previous GUIObserver behaviour - one insert per line, tag_config per colored row
+    for title, vehicles in (("REGULAR VEHICLES", regular), ("ELECTRIC VEHICLES", ev)):
+        text_widget.insert(tk.INSERT, "\n" + "=" * 70 + "\n")
+        text_widget.insert(tk.INSERT, title + "\n")
+        for slot_num, vehicle in vehicles:
+            text_widget.insert(tk.INSERT, format_status_row(slot_num, level, vehicle) + "\n")
+    for slot_num, vehicle in ev:
+        color = charge_color(vehicle.charge)
+        text_widget.tag_config(f"color_{color}", foreground=color)
+        text_widget.insert(tk.INSERT, f"{slot_num:<6}{level:<8}{vehicle.regnum:<15}{vehicle.charge}%\n", f"color_{color}")
+
+
+def batched_render(text_widget, regular, ev, level):
+    # Current GUIObserver behaviour - one insert per report
+    text_widget.insert(tk.INSERT, build_status_report(regular, ev, level))
+    chunks = []
+    for text, color in build_charge_report(ev, level):
+        chunks.extend((text, f"color_{color}" if color else ()))
+    text_widget.insert(tk.INSERT, *chunks)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    try:
+        root = tk.Tk()
+        root.withdraw()
+    except tk.TclError:
+        root = None
+        print("No display available - timing report building only\n")
+
+    if root is None:
+        print(f"{'Lot size':>10}{'Build ms':>12}")
+        print("-" * 22)
+    else:
+        print(f"{'Lot size':>10}{'Build ms':>12}{'Per-line render ms':>21}{'Batched render ms':>20}")
+        print("-" * 63)
+
+    for size in LOT_SIZES:
+        lot = make_lot(size)
+        regular = lot.get_all_regular_vehicles()
+        ev = lot.get_all_ev_vehicles()
+
+        build_ms = timed(lambda: (build_status_report(regular, ev, 1), build_charge_report(ev, 1)))
+        if root is None:
+            print(f"{size:>10}{build_ms:>12.2f}")
+            continue
+
+        legacy_widget = tk.Text(root)
+        batched_widget = tk.Text(root)
+        for color in ("red", "orange", "green"):
+            batched_widget.tag_config(f"color_{color}", foreground=color)
+
+        legacy_ms = timed(legacy_render, legacy_widget, regular, ev, 1)
+        batched_ms = timed(batched_render, batched_widget, regular, ev, 1)
+        print(f"{size:>10}{build_ms:>12.2f}{legacy_ms:>21.2f}{batched_ms:>20.2f}")
+
+        legacy_widget.destroy()
+        batched_widget.destroy()
+
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Session History Benchmark - recording rate, footprint and indexed queries
+
+Feeds SessionHistory simulated traffic (default 500,000 stays on a 2,000-slot
+lot, simulated clock - about seven weeks) and times registration and time-window
+queries against a linear scan over the same sessions kept as tuples. Both sides
+answer the same question - completed stays plus the stays still in progress,
+returned as the same result dicts - and their result counts are checked to match.
+Run: python benchmarks/bench_session_history.py [sessions]
+"""
+
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from SessionHistory import SessionHistory
+from Vehicle import VehicleFactory
+from VehicleIndex import REGULAR_SLOT
+
+SLOTS = 2000
+VEHICLES = 50000
+QUERIES = 200
+
+
+def simulate(history, sessions, clock):
+    # Arrivals fill free slots; each stay lasts 10 minutes to 10 hours
+    rng = random.Random(7)
+    vehicles = [VehicleFactory.create_vehicle(f"V{n:06d}", "Make", "Model", "Color") for n in range(VEHICLES)]
+    free = list(range(SLOTS))
+    departures = []
+    scan = []
+    parked = {}
+    parked_registrations = set()
+    recorded = 0
+    while recorded < sessions:
+        clock[0] += rng.expovariate(1 / 5.0)
+        # Depart everyone whose stay is over
+        while departures and departures[0][0] <= clock[0]:
+            _, slot_index = heapq.heappop(departures)
+            vehicle, arrival = parked.pop(slot_index)
+            parked_registrations.discard(vehicle.regnum)
+            history.record_departure(REGULAR_SLOT, slot_index)
+            scan.append((vehicle.regnum, arrival, clock[0], slot_index))
+            free.append(slot_index)
+            recorded += 1
+        vehicle = vehicles[rng.randrange(VEHICLES)]
+        if free and vehicle.regnum not in parked_registrations:
+            slot_index = free.pop()
+            history.record_arrival(REGULAR_SLOT, slot_index, vehicle)
+            parked[slot_index] = (vehicle, clock[0])
+            parked_registrations.add(vehicle.regnum)
+            heapq.heappush(departures, (clock[0] + rng.uniform(600, 36000), slot_index))
+    return scan, parked
+
+
+def best_of(runs, action):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        action()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    clock = [0.0]
+    history = SessionHistory(chunk_seconds=3600, clock=lambda: clock[0])
+
+    start = time.perf_counter()
+    scan, parked = simulate(history, sessions, clock)
+    simulate_seconds = time.perf_counter() - start
+    end_time = clock[0]
+
+    column_bytes = sum(column.itemsize * len(column) for chunk in history._chunks
+                       for column in (chunk.arrivals, chunk.departures, chunk.registrations, chunk.pools, chunk.slots))
+    posting_bytes = sum(postings.itemsize * len(postings) for postings in history._postings.values())
+
+    rng = random.Random(11)
+    registrations = [f"V{rng.randrange(VEHICLES):06d}" for _ in range(QUERIES)]
+    windows = [(t, t + 3600) for t in (rng.uniform(0, end_time - 3600) for _ in range(QUERIES))]
+
+    # Stays in progress as (registration, arrival, None, slot index) - the scan checks them too
+    in_progress = [(vehicle.regnum, arrival, None, slot_index) for slot_index, (vehicle, arrival) in parked.items()]
+
+    def result(row):
+        registration, arrival, departure, slot_index = row
+        return {"registration": registration, "slot_number": slot_index + 1, "type": REGULAR_SLOT, "arrived_at": arrival,
+                "departed_at": departure, "dwell": (end_time if departure is None else departure) - arrival}
+
+    def scan_for(registration):
+        return ([result(row) for row in scan if row[0] == registration] +
+                [result(stay) for stay in in_progress if stay[0] == registration])
+
+    def scan_overlapping(a, b):
+        return ([result(row) for row in scan if row[1] < b and row[2] > a] +
+                [result(stay) for stay in in_progress if stay[1] < b])
+
+    scan_count = min(QUERIES, 20)
+    for registration in registrations[:scan_count]:
+        assert len(history.sessions_for(registration)) == len(scan_for(registration))
+    for a, b in windows[:scan_count]:
+        assert len(history.sessions_overlapping(a, b)) == len(scan_overlapping(a, b))
+
+    history_registration = best_of(3, lambda: [history.sessions_for(registration) for registration in registrations])
+    scan_registration = best_of(3, lambda: [scan_for(registration) for registration in registrations[:scan_count]]) * QUERIES / scan_count
+    history_window = best_of(3, lambda: [history.sessions_overlapping(a, b) for a, b in windows])
+    scan_window = best_of(3, lambda: [scan_overlapping(a, b) for a, b in windows[:scan_count]]) * QUERIES / scan_count
+
+    print(f"{len(history):,} completed sessions over {end_time / 86400:.1f} simulated days, {len(history._chunks)} chunks")
+    print(f"simulation incl. recording: {simulate_seconds:.1f} s")
+    print(f"columns {column_bytes / len(history):.1f} B/session, registration postings {posting_bytes / len(history):.1f} B/session")
+    print()
+    print(f"{'Query':<26}{'indexed ms':>12}{'scan ms':>12}")
+    print("-" * 50)
+    print(f"{'sessions for registration':<26}{history_registration * 1000 / QUERIES:>12.3f}{scan_registration * 1000 / QUERIES:>12.3f}")
+    print(f"{'1-hour window':<26}{history_window * 1000 / QUERIES:>12.3f}{scan_window * 1000 / QUERIES:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
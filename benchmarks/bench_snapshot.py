@@ -0,0 +1,81 @@
+"""
+Snapshot Benchmark - snapshot size and save/load time for a full multi-level site
+
+Fills a Garage (default 10 levels x 10,000 slots, 10% EV) to capacity, saves it
+with LotSnapshot and times a full restore into a fresh Garage. Pickle of the
+same vehicles is shown for reference.
+Run: python benchmarks/bench_snapshot.py [levels] [slots_per_level]
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from Garage import Garage
+from LotSnapshot import load_garage, save_snapshot
+
+COLORS = ("Red", "Blue", "White", "Black", "Silver", "Green")
+MAKES = (("Toyota", "Corolla"), ("Honda", "Civic"), ("Tesla", "Model 3"), ("Ford", "Focus"), ("BMW", "i3"))
+
+
+def build_site(levels, slots_per_level):
+    garage = Garage()
+    ev_capacity = slots_per_level // 10
+    for level in range(1, levels + 1):
+        garage.add_level(level, slots_per_level - ev_capacity, ev_capacity)
+
+    # Placement fills floors bottom-up, so parking capacity-many of each kind fills the site
+    for level in range(1, levels + 1):
+        for n in range(slots_per_level - ev_capacity):
+            make, model = MAKES[n % len(MAKES)]
+            garage.park_vehicle(f"L{level}R{n:06d}", make, model, COLORS[n % len(COLORS)], False, n % 7 == 0)
+        for n in range(ev_capacity):
+            make, model = MAKES[n % len(MAKES)]
+            garage.park_vehicle(f"L{level}E{n:06d}", make, model, COLORS[n % len(COLORS)], True, n % 5 == 0)
+
+    for lot in garage.lots.values():
+        for _, vehicle in lot.get_all_ev_vehicles():
+            vehicle.charge = len(vehicle.regnum) * 7 % 101
+    return garage
+
+
+def best_of(runs, action):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = action()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    slots_per_level = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    garage = build_site(levels, slots_per_level)
+    vehicles = sum(len(lot.get_all_regular_vehicles()) + len(lot.get_all_ev_vehicles()) for lot in garage.lots.values())
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "site.snap")
+        save_seconds, size = best_of(3, lambda: save_snapshot(garage, path))
+        load_seconds, restored = best_of(3, lambda: load_garage(path))
+
+        pickle_data = pickle.dumps({level: (lot.get_all_regular_vehicles(), lot.get_all_ev_vehicles())
+                                    for level, lot in garage.lots.items()}, protocol=pickle.HIGHEST_PROTOCOL)
+
+    assert restored.registration_levels == garage.registration_levels
+
+    print(f"{levels} levels x {slots_per_level:,} slots - {vehicles:,} vehicles")
+    print(f"{'Format':<12}{'Bytes':>14}{'Bytes/vehicle':>16}{'Save ms':>10}{'Load ms':>10}")
+    print("-" * 62)
+    print(f"{'snapshot':<12}{size:>14,}{size / vehicles:>16.1f}{save_seconds * 1000:>10.0f}{load_seconds * 1000:>10.0f}")
+    print(f"{'pickle':<12}{len(pickle_data):>14,}{len(pickle_data) / vehicles:>16.1f}{'-':>10}{'-':>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+SQLite Storage Benchmark - park, remove and lookup throughput, in-memory lists vs SQLite
+
+Runs the same workload against ParkingLot with the default ListSlotStore and
+with SqliteSlotStorage (a WAL-mode database file): single parks and removes
+(one transaction each), batched parks and removes (one transaction per batch),
+then registration lookups, color searches and slot reads on the full lot.
+Run: python benchmarks/bench_sqlite_storage.py [vehicles] [batch_size]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from ParkingLot import ParkingLot
+from SlotStore import ListSlotStore
+from SqliteSlotStore import SqliteSlotStorage
+
+COLORS = ("Red", "Blue", "White", "Black", "Silver", "Green")
+MAKES = (("Toyota", "Corolla"), ("Honda", "Civic"), ("Tesla", "Model 3"), ("Ford", "Focus"), ("BMW", "i3"))
+LOOKUPS = 2000
+
+
+def park_requests(vehicles):
+    requests = []
+    for n in range(vehicles):
+        make, model = MAKES[n % len(MAKES)]
+        requests.append((f"V{n:07d}", make, model, COLORS[n % len(COLORS)], n % 10 == 0, n % 7 == 0))
+    return requests
+
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def run(slot_store, vehicles, batch_size):
+    requests = park_requests(vehicles)
+    rates = {}
+
+    def per_second(count, seconds):
+        return count / seconds if seconds else float("inf")
+
+    lot = ParkingLot(slot_store)
+    lot.create_parking_lot(vehicles, vehicles, 1)
+    slots = []
+    seconds = timed(lambda: slots.extend(lot.park_vehicle(*request) for request in requests))
+    rates["park"] = per_second(vehicles, seconds)
+    removals = [(slot, request[4]) for slot, request in zip(slots, requests)]
+    rates["remove"] = per_second(vehicles, timed(lambda: [lot.remove_vehicle(*removal) for removal in removals]))
+
+    lot.create_parking_lot(vehicles, vehicles, 1)
+    batches = [requests[start:start + batch_size] for start in range(0, vehicles, batch_size)]
+    results = []
+    seconds = timed(lambda: [results.extend(lot.park_vehicles(batch)) for batch in batches])
+    rates["park batch"] = per_second(vehicles, seconds)
+    removals = [(result["slot_number"], request[4]) for result, request in zip(results, requests)]
+    remove_batches = [removals[start:start + batch_size] for start in range(0, vehicles, batch_size)]
+    rates["remove batch"] = per_second(vehicles, timed(lambda: [lot.remove_vehicles(batch) for batch in remove_batches]))
+
+    lot.park_vehicles(requests)
+    registrations = [request[0] for request in requests[::max(1, vehicles // LOOKUPS)]]
+    rates["registration lookup"] = per_second(len(registrations), timed(
+        lambda: [lot.find_slot_by_registration(registration) for registration in registrations]))
+    searches = [COLORS[n % len(COLORS)] for n in range(60)]
+    rates["color search"] = per_second(len(searches), timed(lambda: [lot.find_vehicles_by_color(color) for color in searches]))
+    indexes = list(range(0, vehicles, max(1, vehicles // LOOKUPS)))
+    rates["slot read"] = per_second(len(indexes), timed(lambda: [lot.regular_slots[index] for index in indexes]))
+    return rates
+
+
+def main():
+    vehicles = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    with tempfile.TemporaryDirectory() as directory:
+        memory_rates = run(ListSlotStore, vehicles, batch_size)
+        storage = SqliteSlotStorage(os.path.join(directory, "lot.db"))
+        sqlite_rates = run(storage, vehicles, batch_size)
+        storage.close()
+
+    print(f"{vehicles:,} vehicles, batches of {batch_size} (ops/s)")
+    print(f"{'Operation':<22}{'lists':>14}{'SQLite':>14}{'ratio':>9}")
+    print("-" * 59)
+    for operation in memory_rates:
+        ratio = memory_rates[operation] / sqlite_rates[operation]
+        print(f"{operation:<22}{memory_rates[operation]:>14,.0f}{sqlite_rates[operation]:>14,.0f}{ratio:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
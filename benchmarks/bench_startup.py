@@ -0,0 +1,52 @@
+"""
+Startup Benchmark - cold import time of the headless engine vs the Tk GUI
+
+Each sample runs in a fresh interpreter so nothing is cached in sys.modules.
+Run: python benchmarks/bench_startup.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+IMPORT_TIMER = (
+    "import time; start = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def cold_import_seconds(module, runs):
+    # Median import time of a module across fresh interpreters
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    samples = []
+    # One extra run up front so .pyc compilation isn't counted
+    for _ in range(runs + 1):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_TIMER.format(module=module)],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(float(output))
+    return statistics.median(samples[1:])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    cases = [
+        ("ParkingLot", "engine only (headless)"),
+        ("ParkingManager", "entry point, GUI not loaded"),
+        ("ParkingGUI", "engine + tkinter GUI"),
+    ]
+
+    print(f"{'Module':<16}{'Median import ms':>18}  Notes")
+    print("-" * 64)
+    for module, notes in cases:
+        seconds = cold_import_seconds(module, runs)
+        print(f"{module:<16}{seconds * 1000:>18.2f}  {notes}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Vehicle Memory Benchmark - bytes per vehicle record, __dict__ vs __slots__ layout
+
+Run: python benchmarks/bench_vehicle_memory.py [count]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from Vehicle import VehicleFactory
+
+
+class LegacyCar:
+    # Previous layout - same fields stored in a per-instance __dict__
+
+    def __init__(self, registration_number, make, model, color):
+        self._registration_number = registration_number
+        self._make = make
+        self._model = model
+        self._color = color
+
+class LegacyElectricCar(LegacyCar):
+    # Previous electric layout - one extra __dict__ entry for charge
+
+    def __init__(self, registration_number, make, model, color):
+        super().__init__(registration_number, make, model, color)
+        self._charge = 0
+
+
+def measure(create, count):
+    # Bytes allocated per vehicle - field values are shared so only the record itself is counted
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    vehicles = [create("REG", "Make", "Model", "Color") for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Exclude the list holding the vehicles
+    container = sys.getsizeof(vehicles)
+    return (current - baseline - container) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    cases = [
+        ("Car", LegacyCar, lambda *args: VehicleFactory.create_vehicle(*args)),
+        ("ElectricCar", LegacyElectricCar, lambda *args: VehicleFactory.create_vehicle(*args, is_electric=True)),
+    ]
+
+    print(f"{'Vehicle':<14}{'__dict__ B/veh':>16}{'__slots__ B/veh':>17}{'Saving':>9}")
+    print("-" * 56)
+    for name, legacy, current in cases:
+        before = measure(legacy, count)
+        after = measure(current, count)
+        print(f"{name:<14}{before:>16.1f}{after:>17.1f}{1 - after / before:>9.0%}")
+
+
+if __name__ == '__main__':
+    main()
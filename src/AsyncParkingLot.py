@@ -0,0 +1,230 @@
+"""
+Async Parking Lot Module - asyncio facade over ParkingLot
+
+One writer task owns the live lot and applies every mutation, so gate
+coroutines never race on slots or indexes. The writer drains whatever commands
+are queued and applies them without yielding to the event loop, so between
+batches the live lot is always consistent. Reads that return finished results
+(lookups, vehicle lists) go straight to it, without locks or queueing. Reads
+that stay lazy (query() generators, the snapshot property) use a snapshot
+built on the first such read after a change - copying the lot is paid per
+change that someone reads lazily, not per batch.
+Observers are coroutines, delivered in event order by a separate task so a slow
+observer never holds up the writer. If the writer task itself fails, every
+queued and later mutation raises RuntimeError instead of waiting forever.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from ParkingLot import ParkingLot, ParkingObserver
+
+
+class AsyncParkingObserver(ABC):
+    # Observer interface for asyncio applications
+
+    @abstractmethod
+    async def update(self, event_type, message):
+        # Awaited on the delivery task once per event
+        pass
+
+
+class _EventCollector(ParkingObserver):
+    # Attached to the live lot - buffers events raised while the writer applies a batch
+
+    def __init__(self):
+        self.events = []
+
+    def update(self, event_type, message):
+        self.events.append((event_type, message))
+
+
+class AsyncParkingLot:
+    # Single-writer asyncio facade - must be used from one event loop
+
+    def __init__(self, parking_lot=None, max_pending=10000, max_batch=1000):
+        # parking_lot - live lot to own (a new ParkingLot by default); don't mutate it elsewhere
+        # max_pending - queued mutations before callers wait for room
+        # max_batch - queued commands the writer drains and applies per pass (without yielding)
+        self.parking_lot = parking_lot if parking_lot is not None else ParkingLot()
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self.observers = []
+        self.observer_errors = 0
+
+        self._collector = _EventCollector()
+        self.parking_lot.attach_observer(self._collector)
+        # Built on demand - None once a batch has changed the lot
+        self._snapshot = None
+
+        # Queues and tasks are created on start() so they bind to the running loop
+        self._commands = None
+        self._events = None
+        self._writer = None
+        self._delivery = None
+        self._closed = False
+        # Exception that stopped the writer task, if any
+        self._writer_error = None
+
+    @property
+    def snapshot(self):
+        # Lot state after the last applied batch - never mutated after it is built
+        if self._snapshot is None:
+            self._snapshot = self.parking_lot.snapshot()
+        return self._snapshot
+
+    def attach_observer(self, observer):
+        # observer - AsyncParkingObserver
+        if observer not in self.observers:
+            self.observers.append(observer)
+
+    def start(self):
+        # Start the writer and delivery tasks - called automatically on first use
+        if self._writer is not None:
+            return
+        if self._closed:
+            raise RuntimeError("AsyncParkingLot is closed")
+        self._commands = asyncio.Queue(self.max_pending)
+        self._events = asyncio.Queue()
+        self._writer = asyncio.ensure_future(self._run_writer())
+        self._delivery = asyncio.ensure_future(self._run_delivery())
+
+    async def close(self):
+        # Apply queued mutations, deliver queued events, then stop both tasks
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is None:
+            return
+        await self._commands.put(None)
+        await self._writer
+        await self._events.put(None)
+        await self._delivery
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # Mutations - queued for the writer task
+
+    async def create_parking_lot(self, regular_capacity, ev_capacity, level):
+        return await self._submit(self.parking_lot.create_parking_lot, regular_capacity, ev_capacity, level)
+
+    async def park_vehicle(self, registration_number, make, model, color, is_electric, is_motorcycle):
+        return await self._submit(self.parking_lot.park_vehicle, registration_number, make, model,
+                                  color, is_electric, is_motorcycle)
+
+    async def remove_vehicle(self, slot_number, is_ev_slot):
+        return await self._submit(self.parking_lot.remove_vehicle, slot_number, is_ev_slot)
+
+    async def park_vehicles(self, batch):
+        return await self._submit(self.parking_lot.park_vehicles, batch)
+
+    async def remove_vehicles(self, batch):
+        return await self._submit(self.parking_lot.remove_vehicles, batch)
+
+    # Reads - never queued; the writer never yields mid-batch, so the live lot is consistent here
+
+    async def get_all_regular_vehicles(self):
+        return self.parking_lot.get_all_regular_vehicles()
+
+    async def get_all_ev_vehicles(self):
+        return self.parking_lot.get_all_ev_vehicles()
+
+    async def find_slot_by_registration(self, registration):
+        return self.parking_lot.find_slot_by_registration(registration)
+
+    async def find_vehicles_by_color(self, color):
+        return self.parking_lot.find_vehicles_by_color(color)
+
+    async def find_vehicles_by_make(self, make):
+        return self.parking_lot.find_vehicles_by_make(make)
+
+    async def find_vehicles_by_model(self, model):
+        return self.parking_lot.find_vehicles_by_model(model)
+
+    async def query(self, *predicates):
+        # Generators outlive this call, so they read a snapshot the writer never mutates
+        return self.snapshot.query(*predicates)
+
+    async def _submit(self, operation, *args):
+        if self._closed:
+            raise RuntimeError("AsyncParkingLot is closed")
+        if self._writer_error is not None:
+            raise self._writer_failure()
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._commands.put((operation, args, future))
+        if self._writer_error is not None:
+            # The writer died while this call waited for room - nothing will take the command
+            self._fail_commands([])
+        return await future
+
+    def _writer_failure(self):
+        error = RuntimeError("AsyncParkingLot writer task failed")
+        error.__cause__ = self._writer_error
+        return error
+
+    def _fail_commands(self, batch):
+        # Fail the callers of batch and of everything still queued - used once the writer is gone
+        commands = list(batch)
+        while not self._commands.empty():
+            commands.append(self._commands.get_nowait())
+        for command in commands:
+            if command is not None and not command[2].done():
+                command[2].set_exception(self._writer_failure())
+
+    async def _run_writer(self):
+        batch = []
+        try:
+            stopping = False
+            while not stopping:
+                batch = [await self._commands.get()]
+                while len(batch) < self.max_batch and not self._commands.empty():
+                    batch.append(self._commands.get_nowait())
+
+                outcomes = []
+                for command in batch:
+                    if command is None:
+                        stopping = True
+                        continue
+                    operation, args, future = command
+                    try:
+                        outcomes.append((future, operation(*args), None))
+                    except Exception as error:
+                        outcomes.append((future, None, error))
+
+                # Drop the snapshot before resolving so every caller reads its own write
+                if outcomes:
+                    self._snapshot = None
+                for event in self._collector.events:
+                    self._events.put_nowait(event)
+                self._collector.events = []
+
+                for future, result, error in outcomes:
+                    # The mutation stands even if its caller stopped waiting
+                    if future.cancelled():
+                        continue
+                    if error is not None:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(result)
+        except Exception as error:
+            # Failures of the writer itself (operation errors go to their callers above)
+            self._writer_error = error
+            self._fail_commands(batch)
+
+    async def _run_delivery(self):
+        while True:
+            event = await self._events.get()
+            if event is None:
+                return
+            event_type, message = event
+            for observer in list(self.observers):
+                try:
+                    await observer.update(event_type, message)
+                except Exception:
+                    # A failing observer must not stop delivery to the others
+                    self.observer_errors += 1
@@ -0,0 +1,489 @@
+"""
+Binary Protocol Module - Compact length-prefixed protocol for gate cameras
+
+Every frame is a 4-byte big-endian payload length followed by the payload.
+
+Request payload:   u8 opcode | u32 request id | body
+    PARK    u8 flags (1 = electric, 2 = motorcycle) | registration | make | model | color
+    REMOVE  u8 flags (1 = EV slot) | u32 slot number
+    FIND    registration
+    BATCH   u16 count | count x (u8 opcode | body)
+Strings are u8 byte length + UTF-8.
+
+Response payload:  u8 opcode | u32 request id | result
+    PARK    i32 slot number (-1 if not parked)
+    REMOVE  u8 removed
+    FIND    u8 found | u8 slot type (0 regular, 1 EV) | u32 slot number
+    BATCH   u16 count | count x (u8 opcode | result)
+    ERROR   u8 length | message
+
+Responses come back in request order, so clients may pipeline many frames
+before reading. Each connection parses frames in place from one preallocated
+receive buffer and packs responses into one preallocated send buffer, flushed
+once per read - a burst of pipelined requests gets a single send().
+
+Run: python src/BinaryProtocol.py [--host 127.0.0.1] [--port 9090] [--unix PATH]
+"""
+
+import argparse
+import os
+import socket
+import socketserver
+import struct
+from itertools import groupby
+from operator import itemgetter
+from ParkingLot import ParkingLot
+from LotSnapshot import load_lot, save_snapshot
+from VehicleIndex import REGULAR_SLOT, EV_SLOT
+
+
+OP_PARK = 1
+OP_REMOVE = 2
+OP_FIND = 3
+OP_BATCH = 4
+OP_ERROR = 255
+
+OPCODES = {"park": OP_PARK, "remove": OP_REMOVE, "find": OP_FIND}
+
+FLAG_ELECTRIC = 1
+FLAG_MOTORCYCLE = 2
+FLAG_EV_SLOT = 1
+
+BUFFER_SIZE = 65536
+# Largest batch whose response always fits the send buffer
+MAX_BATCH = 4096
+
+_LENGTH = struct.Struct("!I")
+_HEAD = struct.Struct("!BI")
+_U16 = struct.Struct("!H")
+_REMOVE_BODY = struct.Struct("!BI")
+_PARK_RESULT = struct.Struct("!i")
+_REMOVE_RESULT = struct.Struct("!B")
+_FIND_RESULT = struct.Struct("!BBI")
+
+_RESULT_SIZES = {OP_PARK: _PARK_RESULT.size, OP_REMOVE: _REMOVE_RESULT.size, OP_FIND: _FIND_RESULT.size}
+
+
+class ProtocolError(Exception):
+    # Malformed frame - answered with an ERROR frame
+    pass
+
+
+# Frame buffers
+
+class FrameReader:
+    # Preallocated receive buffer - frames are parsed in place, never copied out
+
+    def __init__(self, sock, size=BUFFER_SIZE):
+        self.sock = sock
+        self.buffer = bytearray(size)
+        self._view = memoryview(self.buffer)
+        self._start = 0
+        self._end = 0
+
+    def fill(self):
+        # Receive more bytes, returns 0 once the peer has closed
+        if self._start == self._end:
+            self._start = self._end = 0
+        elif self._end == len(self.buffer):
+            # Move the partial frame to the front to make room
+            pending = self._end - self._start
+            self._view[:pending] = self._view[self._start:self._end]
+            self._start, self._end = 0, pending
+        received = self.sock.recv_into(self._view[self._end:])
+        self._end += received
+        return received
+
+    def next_frame(self):
+        # (start, end) of the next complete payload in self.buffer, or None
+        if self._end - self._start < _LENGTH.size:
+            return None
+        length, = _LENGTH.unpack_from(self.buffer, self._start)
+        if length > len(self.buffer) - _LENGTH.size:
+            raise ProtocolError(f"Frame of {length} bytes exceeds the {len(self.buffer)} byte buffer")
+        start = self._start + _LENGTH.size
+        if self._end - start < length:
+            return None
+        self._start = start + length
+        return start, start + length
+
+
+class FrameWriter:
+    # Preallocated send buffer - frames are packed in place and sent in one call per flush
+
+    def __init__(self, sock, size=BUFFER_SIZE):
+        self.sock = sock
+        self.buffer = bytearray(size)
+        self._view = memoryview(self.buffer)
+        self._end = 0
+
+    def reserve(self, size):
+        # Offset of size free bytes, flushing first if the buffer can't hold them
+        if self._end + size > len(self.buffer):
+            self.flush()
+        offset = self._end
+        self._end += size
+        return offset
+
+    def flush(self):
+        if self._end:
+            self.sock.sendall(self._view[:self._end])
+            self._end = 0
+
+
+# Encoding and decoding
+
+def _read_str(data, offset, frame_end):
+    # Bounded by the frame, not the buffer - the next frame's bytes are never read as this one's
+    if offset >= frame_end:
+        raise ProtocolError("String runs past the end of the frame")
+    end = offset + 1 + data[offset]
+    if end > frame_end:
+        raise ProtocolError("String runs past the end of the frame")
+    return str(memoryview(data)[offset + 1:end], "utf-8"), end
+
+def _write_str(buffer, offset, text):
+    encoded = text.encode("utf-8")
+    if len(encoded) > 255:
+        raise ValueError(f"String longer than 255 bytes: {text[:20]!r}...")
+    if offset + 1 + len(encoded) > len(buffer):
+        raise ValueError("Request does not fit the send buffer")
+    buffer[offset] = len(encoded)
+    buffer[offset + 1:offset + 1 + len(encoded)] = encoded
+    return offset + 1 + len(encoded)
+
+def _decode_body(opcode, data, offset, end):
+    # Request body -> (arguments, offset after the body); every read stays inside the frame (end)
+    try:
+        if opcode == OP_PARK:
+            if offset >= end:
+                raise ProtocolError("Request body runs past the end of the frame")
+            flags = data[offset]
+            registration, offset = _read_str(data, offset + 1, end)
+            make, offset = _read_str(data, offset, end)
+            model, offset = _read_str(data, offset, end)
+            color, offset = _read_str(data, offset, end)
+            arguments = (registration, make, model, color, bool(flags & FLAG_ELECTRIC), bool(flags & FLAG_MOTORCYCLE))
+        elif opcode == OP_REMOVE:
+            if offset + _REMOVE_BODY.size > end:
+                raise ProtocolError("Request body runs past the end of the frame")
+            flags, slot_number = _REMOVE_BODY.unpack_from(data, offset)
+            offset += _REMOVE_BODY.size
+            arguments = (slot_number, bool(flags & FLAG_EV_SLOT))
+        elif opcode == OP_FIND:
+            registration, offset = _read_str(data, offset, end)
+            arguments = registration
+        else:
+            raise ProtocolError(f"Unknown opcode {opcode}")
+    except UnicodeDecodeError:
+        raise ProtocolError("Malformed string in request body")
+    return arguments, offset
+
+def _encode_body(buffer, offset, opcode, arguments):
+    # Request body for ("park", reg, make, model, color, is_electric, is_motorcycle),
+    # ("remove", slot_number, is_ev_slot) or ("find", registration) arguments
+    if opcode == OP_PARK:
+        registration, make, model, color, is_electric, is_motorcycle = arguments
+        buffer[offset] = (FLAG_ELECTRIC if is_electric else 0) | (FLAG_MOTORCYCLE if is_motorcycle else 0)
+        offset += 1
+        for text in (registration, make, model, color):
+            offset = _write_str(buffer, offset, text)
+        return offset
+    if opcode == OP_REMOVE:
+        slot_number, is_ev_slot = arguments
+        _REMOVE_BODY.pack_into(buffer, offset, FLAG_EV_SLOT if is_ev_slot else 0, slot_number)
+        return offset + _REMOVE_BODY.size
+    registration, = arguments
+    return _write_str(buffer, offset, registration)
+
+def _write_result(buffer, offset, opcode, result):
+    if opcode == OP_PARK:
+        _PARK_RESULT.pack_into(buffer, offset, result)
+    elif opcode == OP_REMOVE:
+        _REMOVE_RESULT.pack_into(buffer, offset, result)
+    elif result["found"]:
+        _FIND_RESULT.pack_into(buffer, offset, 1, 1 if result["type"] == EV_SLOT else 0, result["slot_number"])
+    else:
+        _FIND_RESULT.pack_into(buffer, offset, 0, 0, 0)
+    return offset + _RESULT_SIZES[opcode]
+
+def _read_result(data, offset, opcode):
+    if opcode == OP_PARK:
+        return _PARK_RESULT.unpack_from(data, offset)[0]
+    if opcode == OP_REMOVE:
+        return bool(_REMOVE_RESULT.unpack_from(data, offset)[0])
+    found, slot_type, slot_number = _FIND_RESULT.unpack_from(data, offset)
+    if not found:
+        return {"found": False}
+    return {"slot_number": slot_number, "type": EV_SLOT if slot_type else REGULAR_SLOT, "found": True}
+
+
+# Server
+
+class BinaryRequestHandler(socketserver.BaseRequestHandler):
+    # One connection - frames are answered in order through one send buffer
+
+    def setup(self):
+        if self.request.family in (socket.AF_INET, socket.AF_INET6):
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = FrameReader(self.request)
+        self.writer = FrameWriter(self.request)
+
+    def handle(self):
+        parking_lot = self.server.parking_lot
+        try:
+            while self.reader.fill():
+                while True:
+                    frame = self.reader.next_frame()
+                    if frame is None:
+                        break
+                    self._handle_frame(parking_lot, self.reader.buffer, *frame)
+                self.writer.flush()
+        except ProtocolError as error:
+            # Framing is lost - report and drop the connection
+            self._write_error(0, str(error))
+            self.writer.flush()
+        except ConnectionError:
+            pass
+
+    def _handle_frame(self, parking_lot, data, start, end):
+        if end - start < _HEAD.size:
+            self._write_error(0, "Frame shorter than its header")
+            return
+        opcode, request_id = _HEAD.unpack_from(data, start)
+        offset = start + _HEAD.size
+        try:
+            if opcode == OP_BATCH:
+                self._handle_batch(parking_lot, data, offset, end, request_id)
+                return
+            arguments, offset = _decode_body(opcode, data, offset, end)
+            if offset != end:
+                raise ProtocolError("Unexpected bytes after the request body")
+            if opcode == OP_PARK:
+                result = parking_lot.park_vehicle(*arguments)
+            elif opcode == OP_REMOVE:
+                result = parking_lot.remove_vehicle(*arguments)
+            else:
+                result = parking_lot.find_slot_by_registration(arguments)
+        except ProtocolError as error:
+            self._write_error(request_id, str(error))
+            return
+        except Exception as error:
+            # Engine fault - this request gets an ERROR frame and the connection stays up
+            self._write_error(request_id, f"Server error: {error}")
+            return
+
+        size = _HEAD.size + _RESULT_SIZES[opcode]
+        offset = self.writer.reserve(_LENGTH.size + size)
+        buffer = self.writer.buffer
+        _LENGTH.pack_into(buffer, offset, size)
+        _HEAD.pack_into(buffer, offset + _LENGTH.size, opcode, request_id)
+        _write_result(buffer, offset + _LENGTH.size + _HEAD.size, opcode, result)
+
+    def _handle_batch(self, parking_lot, data, offset, end, request_id):
+        # Decode every item first so a malformed batch changes nothing
+        try:
+            count, = _U16.unpack_from(data, offset)
+        except struct.error:
+            raise ProtocolError("Truncated batch header")
+        if count > MAX_BATCH:
+            raise ProtocolError(f"Batch of {count} exceeds {MAX_BATCH} requests")
+        offset += _U16.size
+
+        items = []
+        for _ in range(count):
+            if offset >= end:
+                raise ProtocolError("Batch ends before its last request")
+            opcode = data[offset]
+            arguments, offset = _decode_body(opcode, data, offset + 1, end)
+            items.append((opcode, arguments))
+        if offset != end:
+            raise ProtocolError("Unexpected bytes after the batch")
+
+        # Runs of the same opcode become one engine call
+        results = []
+        for opcode, run in groupby(items, key=itemgetter(0)):
+            arguments = [item[1] for item in run]
+            if opcode == OP_PARK:
+                results.extend((opcode, result["slot_number"]) for result in parking_lot.park_vehicles(arguments))
+            elif opcode == OP_REMOVE:
+                results.extend((opcode, result["removed"]) for result in parking_lot.remove_vehicles(arguments))
+            else:
+                results.extend((opcode, parking_lot.find_slot_by_registration(registration)) for registration in arguments)
+
+        size = _HEAD.size + _U16.size + sum(1 + _RESULT_SIZES[opcode] for opcode, _ in results)
+        offset = self.writer.reserve(_LENGTH.size + size)
+        buffer = self.writer.buffer
+        _LENGTH.pack_into(buffer, offset, size)
+        _HEAD.pack_into(buffer, offset + _LENGTH.size, OP_BATCH, request_id)
+        offset += _LENGTH.size + _HEAD.size
+        _U16.pack_into(buffer, offset, len(results))
+        offset += _U16.size
+        for opcode, result in results:
+            buffer[offset] = opcode
+            offset = _write_result(buffer, offset + 1, opcode, result)
+
+    def _write_error(self, request_id, message):
+        encoded = message.encode("utf-8")[:255]
+        size = _HEAD.size + 1 + len(encoded)
+        offset = self.writer.reserve(_LENGTH.size + size)
+        buffer = self.writer.buffer
+        _LENGTH.pack_into(buffer, offset, size)
+        _HEAD.pack_into(buffer, offset + _LENGTH.size, OP_ERROR, request_id)
+        offset += _LENGTH.size + _HEAD.size
+        buffer[offset] = len(encoded)
+        buffer[offset + 1:offset + 1 + len(encoded)] = encoded
+
+
+class BinaryParkingServer(socketserver.ThreadingTCPServer):
+    # TCP server - one thread per connection, sharing a thread_safe lot
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, parking_lot=None):
+        super().__init__(address, BinaryRequestHandler)
+        self.parking_lot = parking_lot if parking_lot is not None else ParkingLot(thread_safe=True)
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class BinaryParkingUnixServer(socketserver.ThreadingUnixStreamServer):
+        # Unix domain socket server - same protocol, no TCP/IP stack on the local path
+        daemon_threads = True
+
+        def __init__(self, path, parking_lot=None):
+            super().__init__(path, BinaryRequestHandler)
+            self.parking_lot = parking_lot if parking_lot is not None else ParkingLot(thread_safe=True)
+
+
+# Client
+
+class BinaryParkingClient:
+    # Blocking client - address is (host, port) for TCP or a path for a Unix socket
+
+    def __init__(self, address):
+        if isinstance(address, str):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.connect(address)
+        self.reader = FrameReader(self.sock)
+        self.writer = FrameWriter(self.sock)
+        self._next_id = 0
+
+    def park(self, registration, make, model, color, is_electric=False, is_motorcycle=False):
+        return self.pipeline([("park", registration, make, model, color, is_electric, is_motorcycle)])[0]
+
+    def remove(self, slot_number, is_ev_slot=False):
+        return self.pipeline([("remove", slot_number, is_ev_slot)])[0]
+
+    def find(self, registration):
+        return self.pipeline([("find", registration)])[0]
+
+    def pipeline(self, requests):
+        # Send every request before reading any response - one result per request, in order
+        # Keep each call to a few thousand requests so unread responses can't fill both socket buffers
+        for request in requests:
+            opcode = OPCODES[request[0]]
+            offset = self._begin_frame(opcode)
+            self._end_frame(offset, _encode_body(self.writer.buffer, offset + _LENGTH.size + _HEAD.size, opcode, request[1:]))
+        self.writer.flush()
+        return [self._read_response() for _ in requests]
+
+    def batch(self, requests):
+        # One BATCH frame - the server groups runs of the same operation into one engine call
+        if len(requests) > MAX_BATCH:
+            raise ValueError(f"Batch of {len(requests)} exceeds {MAX_BATCH} requests")
+        offset = self._begin_frame(OP_BATCH)
+        buffer = self.writer.buffer
+        position = offset + _LENGTH.size + _HEAD.size
+        _U16.pack_into(buffer, position, len(requests))
+        position += _U16.size
+        for request in requests:
+            opcode = OPCODES[request[0]]
+            buffer[position] = opcode
+            position = _encode_body(buffer, position + 1, opcode, request[1:])
+        self._end_frame(offset, position)
+        self.writer.flush()
+        return self._read_response()
+
+    def close(self):
+        self.sock.close()
+
+    def _begin_frame(self, opcode):
+        # Room for the largest single frame; batches are sized by the caller's MAX_BATCH
+        offset = self.writer.reserve(0)
+        if len(self.writer.buffer) - offset < BUFFER_SIZE // 2:
+            self.writer.flush()
+            offset = 0
+        self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+        _HEAD.pack_into(self.writer.buffer, offset + _LENGTH.size, opcode, self._next_id)
+        return offset
+
+    def _end_frame(self, offset, end):
+        if end > len(self.writer.buffer):
+            raise ValueError("Request does not fit the send buffer")
+        _LENGTH.pack_into(self.writer.buffer, offset, end - offset - _LENGTH.size)
+        self.writer.reserve(end - offset)
+
+    def _read_response(self):
+        frame = self.reader.next_frame()
+        while frame is None:
+            if not self.reader.fill():
+                raise ConnectionError("Server closed the connection")
+            frame = self.reader.next_frame()
+        start, end = frame
+        data = self.reader.buffer
+        opcode, _ = _HEAD.unpack_from(data, start)
+        offset = start + _HEAD.size
+        if opcode == OP_ERROR:
+            message, _ = _read_str(data, offset, end)
+            raise ProtocolError(message)
+        if opcode != OP_BATCH:
+            return _read_result(data, offset, opcode)
+
+        count, = _U16.unpack_from(data, offset)
+        offset += _U16.size
+        results = []
+        for _ in range(count):
+            item_opcode = data[offset]
+            results.append(_read_result(data, offset + 1, item_opcode))
+            offset += 1 + _RESULT_SIZES[item_opcode]
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EasyParkPlus binary protocol server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9090)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix domain socket instead of TCP")
+    parser.add_argument("--regular", type=int, default=100, help="regular slots in the lot")
+    parser.add_argument("--ev", type=int, default=0, help="EV slots in the lot")
+    parser.add_argument("--level", type=int, default=1, help="floor level of the lot")
+    parser.add_argument("--snapshot", metavar="PATH", help="restore the lot from PATH if present, save it there on shutdown")
+    args = parser.parse_args(argv)
+
+    parking_lot = None
+    if args.snapshot and os.path.exists(args.snapshot):
+        parking_lot = load_lot(args.snapshot, thread_safe=True)
+    if args.unix:
+        server = BinaryParkingUnixServer(args.unix, parking_lot)
+        where = args.unix
+    else:
+        server = BinaryParkingServer((args.host, args.port), parking_lot)
+        where = f"{args.host}:{server.server_address[1]}"
+    if parking_lot is None:
+        server.parking_lot.create_parking_lot(args.regular, args.ev, args.level)
+
+    print(f"EasyParkPlus binary protocol listening on {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.snapshot:
+            save_snapshot(server.parking_lot, args.snapshot)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Console View Module - Bounded output console for the Tk front end
+
+The widget only ever holds the most recent lines. Older lines are trimmed in
+chunks, kept in an in-memory ring buffer and optionally spilled to disk, and are
+paged back in when the user scrolls above the top of the console. While paged-in
+history is on screen, trimming and auto-scroll wait until the view is back at
+the bottom, so new output doesn't delete the lines being read.
+"""
+
+import json
+import tkinter as tk
+from array import array
+from collections import deque
+
+
+class ConsoleText(tk.Text):
+    # tk.Text used as an append-only console - every insert() appends at the end
+    # Existing insert(index, chars, tags, ...) calls keep working unchanged
+
+    def __init__(self, master, max_lines=2000, trim_chunk=500, history_lines=100000,
+                 spill_path=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.max_lines = max_lines
+        self.trim_chunk = trim_chunk
+
+        # Complete lines as tuples of (text, tags) segments, newest on the right
+        self._history = deque(maxlen=history_lines)
+        self._pending = []
+        self._total_lines = 0
+        # Absolute number of the first complete line shown in the widget
+        self._display_start = 0
+        # Older lines were paged in and the view hasn't returned to the bottom since
+        self._scrolled_back = False
+
+        # Lines evicted from the ring buffer - one JSON record per line plus byte offsets
+        self._spill = open(spill_path, "w+b") if spill_path else None
+        self._spill_offsets = array('Q')
+
+        self.bind("<MouseWheel>", self._on_scroll_up, add=True)
+        self.bind("<Button-4>", self._on_scroll_up, add=True)
+
+    def insert(self, index, chars, *args):
+        # Ignore index - console output always goes to the end
+        super().insert(tk.END, chars, *args)
+
+        segments = [(chars, args[0] if args else None)]
+        for offset in range(1, len(args), 2):
+            segments.append((args[offset], args[offset + 1] if offset + 1 < len(args) else None))
+        for text, tags in segments:
+            self._record(text, tags)
+
+        if self._total_lines - self._display_start > self.max_lines + self.trim_chunk and not self.viewing_history():
+            self._trim()
+
+    def clear(self):
+        # Empty the widget - history remains available for scroll-back
+        super().delete("1.0", tk.END)
+        self._display_start = self._total_lines
+        self._pending = []
+        self._scrolled_back = False
+
+    def load_older(self, count=None):
+        # Prepend up to count lines from history/spill above the current top, returns lines loaded
+        count = count or self.trim_chunk
+        first = max(self._earliest_available(), self._display_start - count)
+        if first >= self._display_start:
+            return 0
+
+        chunk = []
+        for line_number in range(first, self._display_start):
+            for text, tags in self._line(line_number):
+                chunk.extend((text, tags or ()))
+        super().insert("1.0", *chunk)
+
+        loaded = self._display_start - first
+        self._display_start = first
+        self._scrolled_back = True
+        return loaded
+
+    def viewing_history(self):
+        # True while paged-in lines are being read - ends once the view is back at the bottom
+        if self._scrolled_back and self.yview()[1] >= 1.0:
+            self._scrolled_back = False
+        return self._scrolled_back
+
+    def scroll_to_end(self):
+        # Follow new output, unless the user is reading history
+        if not self.viewing_history():
+            self.see(tk.END)
+
+    def close(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def _record(self, text, tags):
+        # Split into complete lines for the history, keep any trailing partial line pending
+        pieces = text.split("\n")
+        for piece in pieces[:-1]:
+            if piece:
+                self._pending.append((piece, tags))
+            self._pending.append(("\n", None))
+            self._append_history(tuple(self._pending))
+            self._pending = []
+        if pieces[-1]:
+            self._pending.append((pieces[-1], tags))
+
+    def _append_history(self, line):
+        if len(self._history) == self._history.maxlen:
+            evicted = self._history[0]
+            if self._spill is not None:
+                self._spill.seek(0, 2)
+                self._spill_offsets.append(self._spill.tell())
+                self._spill.write(json.dumps(evicted).encode("utf-8") + b"\n")
+        self._history.append(line)
+        self._total_lines += 1
+
+    def _trim(self):
+        # Drop whole chunks from the top so trimming cost is amortized over many inserts
+        excess = self._total_lines - self._display_start - self.max_lines
+        super().delete("1.0", f"{excess + 1}.0")
+        self._display_start += excess
+
+    def _earliest_available(self):
+        if self._spill is not None:
+            return 0
+        return self._total_lines - len(self._history)
+
+    def _line(self, line_number):
+        history_start = self._total_lines - len(self._history)
+        if line_number >= history_start:
+            return self._history[line_number - history_start]
+
+        # Spilled line - offsets give its byte range in the spill file
+        start = self._spill_offsets[line_number]
+        self._spill.seek(start)
+        record = self._spill.readline()
+        return [(text, tuple(tags) if isinstance(tags, list) else tags) for text, tags in json.loads(record)]
+
+    def _on_scroll_up(self, event):
+        # Page older lines in when scrolling up past the top
+        scrolling_up = event.num == 4 or getattr(event, "delta", 0) > 0
+        if scrolling_up and self.yview()[0] <= 0.0:
+            self.load_older()
@@ -0,0 +1,191 @@
+"""
+Garage Module - Multi-level garage built from per-floor ParkingLot shards
+"""
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from itertools import chain
+from ParkingLot import ParkingLot, ParkingEventType
+from SlotStore import ListSlotStore
+from VehicleIndex import AttributeIndex, EV_SLOT, REGULAR_SLOT
+
+
+# Placement policies - pick the floor for an arriving vehicle
+
+class PlacementPolicy(ABC):
+    # Strategy interface for choosing a floor
+
+    @abstractmethod
+    def choose_level(self, lots, is_electric):
+        # Return a level with a free slot in the right pool, or None if every floor is full
+        pass
+
+    @staticmethod
+    def free_slots(lot, is_electric):
+        allocator = lot.ev_allocator if is_electric else lot.regular_allocator
+        return allocator.free_count
+
+class LowestLevelPolicy(PlacementPolicy):
+    # Fill floors bottom-up - shortest drive for arriving vehicles
+
+    def choose_level(self, lots, is_electric):
+        for level in sorted(lots):
+            if self.free_slots(lots[level], is_electric) > 0:
+                return level
+        return None
+
+class LeastOccupiedPolicy(PlacementPolicy):
+    # Spread vehicles across floors - the floor with most free slots wins, lowest on ties
+
+    def choose_level(self, lots, is_electric):
+        best_level = None
+        best_free = 0
+        for level in sorted(lots):
+            free = self.free_slots(lots[level], is_electric)
+            if free > best_free:
+                best_level, best_free = level, free
+        return best_level
+
+
+class Garage:
+    # Aggregate of per-level ParkingLots with garage-wide indexes
+    # All mutations go through the garage so the global indexes stay in sync
+
+    def __init__(self, placement_policy=None, slot_store=ListSlotStore):
+        self.placement_policy = placement_policy or LowestLevelPolicy()
+        self.slot_store = slot_store
+        self.lots = {}
+        self.observers = []
+        # Occupancy time series shared by every floor (OccupancySeries)
+        self.occupancy = None
+
+        # Registration -> level
+        self.registration_levels = {}
+        # Case-folded color -> {level: vehicles of that color on the level}
+        self.color_levels = {}
+
+    def attach_observer(self, observer):
+        # Observers hear events from every floor
+        if observer not in self.observers:
+            self.observers.append(observer)
+            for lot in self.lots.values():
+                lot.attach_observer(observer)
+
+    def attach_occupancy(self, occupancy):
+        # One recorder for every floor - each level gets its own series
+        self.occupancy = occupancy
+        for lot in self.lots.values():
+            lot.attach_occupancy(occupancy)
+
+    def notify_observers(self, event_type, message):
+        for observer in self.observers:
+            observer.update(event_type, message)
+
+    def add_level(self, level, regular_capacity, ev_capacity):
+        # Create (or recreate) the lot for one floor
+        if level in self.lots:
+            self._forget_level(level)
+
+        lot = self._new_lot()
+        lot.create_parking_lot(regular_capacity, ev_capacity, level)
+        self.lots[level] = lot
+        return lot
+
+    def restore_level(self, level, regular_capacity, ev_capacity, regular_vehicles, ev_vehicles):
+        # Recreate a floor from saved (slot_number, vehicle) pairs and index its vehicles garage-wide
+        if level in self.lots:
+            self._forget_level(level)
+
+        lot = self._new_lot()
+        lot.restore_parking_lot(regular_capacity, ev_capacity, level, regular_vehicles, ev_vehicles)
+        self.lots[level] = lot
+
+        # Bulk global index load - one count per distinct color instead of one update per vehicle
+        vehicles = [vehicle for _, vehicle in chain(regular_vehicles, ev_vehicles)]
+        self.registration_levels.update((vehicle.regnum, level) for vehicle in vehicles)
+        for color, count in Counter(AttributeIndex.normalize(vehicle.color) for vehicle in vehicles).items():
+            counts = self.color_levels.setdefault(color, {})
+            counts[level] = counts.get(level, 0) + count
+        return lot
+
+    def _new_lot(self):
+        lot = ParkingLot(self.slot_store)
+        for observer in self.observers:
+            lot.attach_observer(observer)
+        if self.occupancy is not None:
+            lot.attach_occupancy(self.occupancy)
+        return lot
+
+    def park_vehicle(self, registration_number, make, model, color, is_electric, is_motorcycle):
+        # Park on the floor chosen by the placement policy
+        # Returns {"parked": True, "level", "slot_number", "type"} or {"parked": False}
+        if registration_number in self.registration_levels:
+            level = self.registration_levels[registration_number]
+            self.notify_observers(ParkingEventType.PARKING_FAILED, f"Vehicle {registration_number} is already parked on level {level}")
+            return {"parked": False}
+
+        slot_type = EV_SLOT if is_electric else REGULAR_SLOT
+        level = self.placement_policy.choose_level(self.lots, is_electric)
+        if level is None:
+            self.notify_observers(ParkingEventType.PARKING_FAILED, f"Sorry, {slot_type} parking is full on every level")
+            return {"parked": False}
+
+        slot_number = self.lots[level].park_vehicle(registration_number, make, model, color, is_electric, is_motorcycle)
+        if slot_number < 0:
+            return {"parked": False}
+
+        self._index_vehicle(registration_number, color, level)
+        return {"parked": True, "level": level, "slot_number": slot_number, "type": slot_type}
+
+    def remove_vehicle(self, level, slot_number, is_ev_slot):
+        # Remove a vehicle from a slot on a given floor
+        lot = self.lots.get(level)
+        if lot is None:
+            self.notify_observers(ParkingEventType.REMOVAL_FAILED, f"Level {level} does not exist")
+            return False
+
+        slots = lot.ev_slots if is_ev_slot else lot.regular_slots
+        vehicle = slots[slot_number - 1] if 0 < slot_number <= len(slots) else None
+
+        removed = lot.remove_vehicle(slot_number, is_ev_slot)
+        if removed:
+            self._unindex_vehicle(vehicle.regnum, vehicle.color, level)
+        return removed
+
+    def find_slot_by_registration(self, registration):
+        # Global index names the floor, the floor's own index names the slot
+        level = self.registration_levels.get(registration)
+        if level is None:
+            return {"found": False}
+
+        result = self.lots[level].find_slot_by_registration(registration)
+        result["level"] = level
+        return result
+
+    def find_vehicles_by_color(self, color):
+        # {level: {"regular": [...], "ev": [...]}} - only floors holding that color are queried
+        levels = self.color_levels.get(AttributeIndex.normalize(color), {})
+        return {level: self.lots[level].find_vehicles_by_color(color) for level in sorted(levels)}
+
+    def _index_vehicle(self, registration, color, level):
+        self.registration_levels[registration] = level
+        counts = self.color_levels.setdefault(AttributeIndex.normalize(color), {})
+        counts[level] = counts.get(level, 0) + 1
+
+    def _unindex_vehicle(self, registration, color, level):
+        self.registration_levels.pop(registration, None)
+        key = AttributeIndex.normalize(color)
+        counts = self.color_levels.get(key)
+        if counts is None:
+            return
+        counts[level] -= 1
+        if not counts[level]:
+            del counts[level]
+        if not counts:
+            del self.color_levels[key]
+
+    def _forget_level(self, level):
+        # Drop a floor's vehicles from the global indexes before replacing it
+        lot = self.lots.pop(level)
+        for _, vehicle in lot.get_all_regular_vehicles() + lot.get_all_ev_vehicles():
+            self._unindex_vehicle(vehicle.regnum, vehicle.color, level)
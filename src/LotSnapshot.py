@@ -0,0 +1,206 @@
+"""
+Lot Snapshot Module - Compact binary save/load of full lot state
+
+One file holds every level of a ParkingLot or Garage: capacities, level
+numbers and each parked vehicle's slot, type, registration, make, model,
+color and charge. The layout is columnar so loading is a handful of
+array.frombytes() calls plus one pass building vehicles:
+
+    header    magic "EPSN" | u16 version | u16 level count | u32 string count | u32 string bytes
+    strings   UTF-8, NUL separated - every distinct string once (makes/colors repeat a lot)
+    per level i32 level | u32 regular capacity | u32 EV capacity | u32 regular count | u32 EV count
+              then per pool: u32 slot indexes | u8 type codes | 4 x u32 string ids
+              (registration, make, model, color) | f64 charges (EV pool only)
+    trailer   u32 CRC-32 of everything before it
+
+All integers are little-endian. Saves go to a temporary file that replaces the
+target only once fully written, so a crash mid-save keeps the previous snapshot.
+"""
+
+import gc
+import os
+import struct
+import sys
+import zlib
+from array import array
+from contextlib import contextmanager
+from Garage import Garage
+from ParkingLot import ParkingLot
+from SlotStore import ListSlotStore, TYPE_ELECTRIC, VEHICLE_CLASSES, vehicle_type_code
+
+
+MAGIC = b"EPSN"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII")
+_LEVEL = struct.Struct("<iIIII")
+_CRC = struct.Struct("<I")
+_STRING_COLUMNS = 4
+
+
+def _little_endian(column):
+    # array() is native-endian - files are always little-endian
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+def _read_column(data, offset, typecode, count):
+    column = array(typecode)
+    end = offset + column.itemsize * count
+    if end > len(data):
+        raise ValueError("Snapshot is truncated")
+    column.frombytes(data[offset:end])
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column, end
+
+
+@contextmanager
+def gc_paused():
+    # Bulk loads allocate hundreds of thousands of acyclic objects - with the cyclic
+    # collector running it rescans the growing heap again and again
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+# Saving
+
+def _lot_levels(target):
+    # [(level, lot)] for a Garage or a single ParkingLot
+    if isinstance(target, Garage):
+        return sorted(target.lots.items())
+    return [(target.level, target)]
+
+def _encode_pool(vehicles, string_ids, is_ev_pool):
+    # (slot_number, vehicle) pairs -> column bytes for one pool
+    slot_indexes = array('I', [slot_number - 1 for slot_number, _ in vehicles])
+    type_codes = bytes(vehicle_type_code(vehicle) for _, vehicle in vehicles)
+
+    strings = array('I')
+    for attribute in ("regnum", "make", "model", "color"):
+        for _, vehicle in vehicles:
+            text = getattr(vehicle, attribute)
+            string_id = string_ids.get(text)
+            if string_id is None:
+                if "\0" in text:
+                    raise ValueError(f"Cannot snapshot a string containing NUL: {text!r}")
+                string_id = string_ids[text] = len(string_ids)
+            strings.append(string_id)
+
+    parts = [_little_endian(slot_indexes), type_codes, _little_endian(strings)]
+    if is_ev_pool:
+        charges = array('d', [getattr(vehicle, 'charge', 0) for _, vehicle in vehicles])
+        parts.append(_little_endian(charges))
+    return parts
+
+def save_snapshot(target, path, copy=True):
+    # Write a ParkingLot or Garage to path - returns the snapshot size in bytes
+    # copy - take a point-in-time copy of each lot first; pass False for a lot that is
+    #        already one (ParkingLot.snapshot()), or that no other thread changes
+    string_ids = {}
+    body = []
+    levels = _lot_levels(target)
+    for level, lot in levels:
+        snapshot = lot.snapshot() if copy else lot
+        regular_vehicles = snapshot.get_all_regular_vehicles()
+        ev_vehicles = snapshot.get_all_ev_vehicles()
+        body.append(_LEVEL.pack(level, snapshot.regular_capacity, snapshot.ev_capacity,
+                                len(regular_vehicles), len(ev_vehicles)))
+        body.extend(_encode_pool(regular_vehicles, string_ids, False))
+        body.extend(_encode_pool(ev_vehicles, string_ids, True))
+
+    # dicts keep insertion order, so keys are already in id order
+    strings = "\0".join(string_ids).encode("utf-8")
+    data = b"".join([_HEADER.pack(MAGIC, VERSION, len(levels), len(string_ids), len(strings)), strings] + body)
+    data += _CRC.pack(zlib.crc32(data))
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as snapshot_file:
+        snapshot_file.write(data)
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    os.replace(temporary_path, path)
+    return len(data)
+
+
+# Loading
+
+def _decode_pool(data, offset, count, strings, is_ev_pool):
+    slot_indexes, offset = _read_column(data, offset, 'I', count)
+    type_codes, offset = _read_column(data, offset, 'B', count)
+    string_ids, offset = _read_column(data, offset, 'I', count * _STRING_COLUMNS)
+    charges = None
+    if is_ev_pool:
+        charges, offset = _read_column(data, offset, 'd', count)
+
+    registrations = [strings[i] for i in string_ids[:count]]
+    makes = [strings[i] for i in string_ids[count:2 * count]]
+    models = [strings[i] for i in string_ids[2 * count:3 * count]]
+    colors = [strings[i] for i in string_ids[3 * count:]]
+
+    vehicle_classes = VEHICLE_CLASSES
+    vehicles = []
+    for position, type_code in enumerate(type_codes):
+        vehicle = vehicle_classes[type_code](registrations[position], makes[position], models[position], colors[position])
+        if type_code & TYPE_ELECTRIC and charges is not None:
+            # Whole-number charges come back as ints, as they were set
+            charge = charges[position]
+            vehicle.charge = int(charge) if charge.is_integer() else charge
+        vehicles.append((slot_indexes[position] + 1, vehicle))
+    return vehicles, offset
+
+def read_snapshot(path):
+    # Parse a snapshot file -> [(level, regular_capacity, ev_capacity, regular_vehicles, ev_vehicles)]
+    with open(path, "rb") as snapshot_file:
+        data = snapshot_file.read()
+
+    if len(data) < _HEADER.size + _CRC.size:
+        raise ValueError("Snapshot is truncated")
+    stored_crc, = _CRC.unpack_from(data, len(data) - _CRC.size)
+    data = memoryview(data)[:len(data) - _CRC.size]
+    if zlib.crc32(data) != stored_crc:
+        raise ValueError("Snapshot checksum mismatch - file is corrupt")
+
+    magic, version, level_count, string_count, string_bytes = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a parking lot snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+
+    offset = _HEADER.size
+    strings = str(data[offset:offset + string_bytes], "utf-8").split("\0") if string_count else []
+    offset += string_bytes
+
+    levels = []
+    for _ in range(level_count):
+        level, regular_capacity, ev_capacity, regular_count, ev_count = _LEVEL.unpack_from(data, offset)
+        offset += _LEVEL.size
+        regular_vehicles, offset = _decode_pool(data, offset, regular_count, strings, False)
+        ev_vehicles, offset = _decode_pool(data, offset, ev_count, strings, True)
+        levels.append((level, regular_capacity, ev_capacity, regular_vehicles, ev_vehicles))
+    return levels
+
+def load_lot(path, slot_store=ListSlotStore, thread_safe=False):
+    # Restore a single-level snapshot into a new ParkingLot
+    with gc_paused():
+        levels = read_snapshot(path)
+        if len(levels) != 1:
+            raise ValueError(f"Snapshot holds {len(levels)} levels - use load_garage()")
+        lot = ParkingLot(slot_store, thread_safe=thread_safe)
+        level, regular_capacity, ev_capacity, regular_vehicles, ev_vehicles = levels[0]
+        lot.restore_parking_lot(regular_capacity, ev_capacity, level, regular_vehicles, ev_vehicles)
+    return lot
+
+def load_garage(path, placement_policy=None, slot_store=ListSlotStore):
+    # Restore every level of a snapshot into a new Garage
+    garage = Garage(placement_policy, slot_store)
+    with gc_paused():
+        for level, regular_capacity, ev_capacity, regular_vehicles, ev_vehicles in read_snapshot(path):
+            garage.restore_level(level, regular_capacity, ev_capacity, regular_vehicles, ev_vehicles)
+    return garage
@@ -0,0 +1,298 @@
+"""
+Mapped Slot Store Module - Slot table in a memory-mapped file
+
+Each pool of a lot is one file of fixed-width slot records, mapped with mmap
+and written in place. A restarted process maps the files again and serves
+straight from them - nothing is deserialized, only the allocators and the
+registration index are rebuilt (ParkingLot.attach_slots()).
+
+Slot file <pool>.slots, little-endian:
+    header  magic "EPSM" | u16 version | u16 record size | u32 capacity
+            | u32 string table bytes | u32 string count | i32 level | 8 bytes reserved
+    record  u8 occupied | u8 type code | u8 registration length | 5 pad | f64 charge
+            | u32 color code | u32 make code | u32 model code | 32 bytes registration (UTF-8) | 4 pad
+String table <pool>.strings - u16 length + UTF-8 per string, in code order.
+Codes are assigned on first use and never reused. The slot header records how
+much of the table is valid, so a string appended just before a crash is dropped.
+The level is the lot's floor, so open_mapped_lot() brings a lot back on it.
+
+Writes land in the shared mapping at once and survive a process crash; flush()
+is the durability point for an OS crash or power loss.
+"""
+
+import mmap
+import os
+import struct
+from itertools import compress, repeat
+from operator import itemgetter
+from ParkingLot import ParkingLot
+from SlotStore import (EMPTY_SLOT, TYPE_ELECTRIC, VEHICLE_CLASSES, VEHICLE_TYPE_NAMES, SlotStorage, StringInterner,
+                       vehicle_type_code)
+from Vehicle import ElectricVehicle
+from VehicleIndex import REGULAR_SLOT, EV_SLOT
+
+
+MAGIC = b"EPSM"
+VERSION = 1
+REGISTRATION_BYTES = 32
+# Longest string whose UTF-8 form always fits the u16 length prefix
+MAX_STRING_LENGTH = 0xFFFF // 4
+
+_HEADER = struct.Struct("<4sHHIIIi8x")
+_STRING_TABLE = struct.Struct("<II")
+_STRING_TABLE_OFFSET = 12
+_RECORD = struct.Struct("<BBB5xdIII32s4x")
+_EMPTY_RECORD = bytes(_RECORD.size)
+_STRING_LENGTH = struct.Struct("<H")
+
+# Views of single record fields for column scans - iter_unpack walks the mapping without copying it
+_CODE_FIELDS = {
+    "color": struct.Struct("<16xI44x"),
+    "make": struct.Struct("<20xI40x"),
+    "model": struct.Struct("<24xI36x"),
+}
+_REGISTRATION_FIELD = struct.Struct("<28x32s4x")
+
+
+def _charge(value):
+    # Whole-number charges come back as ints, as they were set
+    return int(value) if value.is_integer() else value
+
+
+class MappedSlotStore:
+    # Fixed-width slot records in a mapping - same interface as ColumnarSlotStore
+    # Indexing returns a freshly built Vehicle; write changes (e.g. charge) back by assigning the vehicle to its slot
+    # Built directly the records live in anonymous memory (snapshot copies, placeholder pools);
+    # MappedSlotFiles creates and opens file-backed ones
+    has_attribute_columns = True
+
+    def __init__(self, capacity=0, pool=None, level=0):
+        mapping = mmap.mmap(-1, _HEADER.size + capacity * _RECORD.size)
+        _HEADER.pack_into(mapping, 0, MAGIC, VERSION, _RECORD.size, capacity, 0, 0, level)
+        self._attach(mapping, capacity, level, StringInterner(), None, 0, 0)
+
+    def _attach(self, mapping, capacity, level, interner, strings_file, string_bytes, string_count):
+        self._map = mapping
+        self._capacity = capacity
+        self.level = level
+        self._interner = interner
+        self._strings_file = strings_file
+        self._string_bytes = string_bytes
+        self._string_count = string_count
+
+    @classmethod
+    def create(cls, capacity, path, strings_path, level=0):
+        # New empty table at path - built beside it and swapped in, so a store still mapping the old file keeps working
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as slot_file:
+            slot_file.write(_HEADER.pack(MAGIC, VERSION, _RECORD.size, capacity, 0, 0, level))
+            slot_file.truncate(_HEADER.size + capacity * _RECORD.size)
+        # The new header lists no strings, so the old table is ignored even if truncating it never happens
+        os.replace(temporary_path, path)
+        open(strings_path, "wb").close()
+        return cls.open(path, strings_path)
+
+    @classmethod
+    def open(cls, path, strings_path):
+        # Map an existing table - its records are served as they are
+        with open(path, "r+b") as slot_file:
+            # The mapping stays valid after the file is closed
+            mapping = mmap.mmap(slot_file.fileno(), 0)
+
+        magic, version, record_size, capacity, string_bytes, string_count, level = _HEADER.unpack_from(mapping, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a mapped slot table")
+        if version != VERSION or record_size != _RECORD.size:
+            raise ValueError(f"Unsupported slot table version {version} (record size {record_size})")
+        if len(mapping) != _HEADER.size + capacity * _RECORD.size:
+            raise ValueError(f"{path} does not match its capacity of {capacity} slots")
+
+        strings_file = open(strings_path, "a+b")
+        strings_file.seek(0)
+        data = strings_file.read(string_bytes)
+        if len(data) < string_bytes:
+            strings_file.close()
+            raise ValueError(f"{strings_path} is truncated")
+        # Drop anything appended after the header was last updated
+        strings_file.truncate(string_bytes)
+
+        interner = StringInterner()
+        offset = 0
+        for code in range(1, string_count + 1):
+            length, = _STRING_LENGTH.unpack_from(data, offset)
+            offset += _STRING_LENGTH.size
+            if interner.intern(str(data[offset:offset + length], "utf-8")) != code:
+                strings_file.close()
+                raise ValueError(f"{strings_path} repeats a string")
+            offset += length
+
+        store = cls.__new__(cls)
+        store._attach(mapping, capacity, level, interner, strings_file, string_bytes, string_count)
+        return store
+
+    def __len__(self):
+        return self._capacity
+
+    def _offset(self, index):
+        if not 0 <= index < self._capacity:
+            raise IndexError("slot index out of range")
+        return _HEADER.size + index * _RECORD.size
+
+    def __getitem__(self, index):
+        occupied, type_code, length, charge, color, make, model, registration = _RECORD.unpack_from(self._map, self._offset(index))
+        if not occupied:
+            return EMPTY_SLOT
+
+        string = self._interner.string
+        vehicle = VEHICLE_CLASSES[type_code](str(registration[:length], "utf-8"), string(make), string(model), string(color))
+        if type_code & TYPE_ELECTRIC:
+            vehicle.charge = _charge(charge)
+        return vehicle
+
+    def __setitem__(self, index, vehicle):
+        offset = self._offset(index)
+        if vehicle is EMPTY_SLOT:
+            self._map[offset:offset + _RECORD.size] = _EMPTY_RECORD
+            return
+
+        registration = vehicle.regnum.encode("utf-8")
+        if len(registration) > REGISTRATION_BYTES:
+            raise ValueError(f"Registration {vehicle.regnum!r} is longer than {REGISTRATION_BYTES} bytes")
+        # The field is NUL padded - bulk reads strip the padding instead of slicing by length
+        if b"\0" in registration:
+            raise ValueError(f"Registration {vehicle.regnum!r} contains NUL")
+        charge = vehicle.charge if isinstance(vehicle, ElectricVehicle) else 0
+        _RECORD.pack_into(self._map, offset, 1, vehicle_type_code(vehicle), len(registration), charge,
+                          self._code(vehicle.color), self._code(vehicle.make), self._code(vehicle.model), registration)
+
+    def __iter__(self):
+        for index in range(self._capacity):
+            yield self[index]
+
+    def _code(self, value):
+        # Interned code for value - a new string is on disk before any record refers to it
+        if len(value) > MAX_STRING_LENGTH:
+            raise ValueError(f"String longer than {MAX_STRING_LENGTH} characters: {value[:20]!r}...")
+        code = self._interner.intern(value)
+        if code > self._string_count:
+            encoded = value.encode("utf-8")
+            if self._strings_file is not None:
+                self._strings_file.write(_STRING_LENGTH.pack(len(encoded)) + encoded)
+                self._strings_file.flush()
+            self._string_bytes += _STRING_LENGTH.size + len(encoded)
+            self._string_count = code
+            _STRING_TABLE.pack_into(self._map, _STRING_TABLE_OFFSET, self._string_bytes, self._string_count)
+        return code
+
+    def _records(self):
+        # Zero-copy view of the record area
+        return memoryview(self._map)[_HEADER.size:]
+
+    def copy(self):
+        # Anonymous copy - one memcpy of the mapping, no Vehicle objects are built
+        mapping = mmap.mmap(-1, len(self._map))
+        mapping[:] = self._map
+        clone = MappedSlotStore.__new__(MappedSlotStore)
+        clone._attach(mapping, self._capacity, self.level, self._interner.copy(), None, self._string_bytes, self._string_count)
+        return clone
+
+    def flush(self):
+        # Durability point - strings first, since records refer to them
+        if self._strings_file is None:
+            return
+        os.fsync(self._strings_file.fileno())
+        self._map.flush()
+
+    def close(self):
+        if self._strings_file is not None:
+            self._strings_file.close()
+        self._map.close()
+
+    # Column operations - the occupied flags are one strided slice, other fields are read
+    # in place with iter_unpack
+
+    def occupied_indexes(self):
+        return list(compress(range(self._capacity), self._map[_HEADER.size::_RECORD.size]))
+
+    def occupied_count(self):
+        return self._map[_HEADER.size::_RECORD.size].count(1)
+
+    def occupied_registrations(self):
+        # (slot index, registration) pairs - no Vehicle objects built
+        occupied = self._map[_HEADER.size::_RECORD.size]
+        fields = compress(_REGISTRATION_FIELD.iter_unpack(self._records()), occupied)
+        registrations = map(bytes.decode, map(bytes.rstrip, map(itemgetter(0), fields), repeat(b"\0")))
+        return list(zip(compress(range(self._capacity), occupied), registrations))
+
+    def occupied_rows(self):
+        string = self._interner.string
+        return [
+            (index + 1, VEHICLE_TYPE_NAMES[type_code], str(registration[:length], "utf-8"),
+             string(color), string(make), string(model), _charge(charge) if type_code & TYPE_ELECTRIC else None)
+            for index, (occupied, type_code, length, charge, color, make, model, registration)
+            in enumerate(_RECORD.iter_unpack(self._records()))
+            if occupied
+        ]
+
+    def indexes_matching(self, attribute, value):
+        # Case-insensitive attribute scan over the record's code field
+        codes = self._interner.codes_matching(value)
+        if not codes:
+            return []
+        column = map(itemgetter(0), _CODE_FIELDS[attribute].iter_unpack(self._records()))
+        if len(codes) == 1:
+            matches = map(next(iter(codes)).__eq__, column)
+        else:
+            matches = map(codes.__contains__, column)
+        return list(compress(range(self._capacity), matches))
+
+    def vehicles_matching(self, attribute, value):
+        # (slot index, Vehicle) pairs for a case-insensitive attribute search
+        return [(index, self[index]) for index in self.indexes_matching(attribute, value)]
+
+
+class MappedSlotFiles(SlotStorage):
+    # Storage backend - each pool of the lot is mapped from a file in directory
+    # One directory holds one lot; give each Garage level a directory of its own
+    # commit() has nothing to do - writes are in the shared mapping at once; flush_lot() is the durability point
+    has_attribute_columns = True
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+    def __call__(self, capacity=0, pool=None, level=0):
+        if pool is None:
+            # Placeholder pool of a lot that isn't created yet - the files are left alone
+            return MappedSlotStore(capacity)
+        return MappedSlotStore.create(capacity, *self._paths(pool), level)
+
+    def _paths(self, pool):
+        name = pool.lower()
+        return os.path.join(self.directory, f"{name}.slots"), os.path.join(self.directory, f"{name}.strings")
+
+    def exists(self):
+        return all(os.path.exists(self._paths(pool)[0]) for pool in (REGULAR_SLOT, EV_SLOT))
+
+    def open_pools(self):
+        # (regular store, EV store) mapped from the existing files
+        return MappedSlotStore.open(*self._paths(REGULAR_SLOT)), MappedSlotStore.open(*self._paths(EV_SLOT))
+
+
+def open_mapped_lot(directory, level=None, thread_safe=False):
+    # ParkingLot whose pools live in directory - serves the vehicles already there if the
+    # files exist, otherwise create_parking_lot() creates them
+    # The lot comes back on the level in the slot file header unless level overrides it
+    slot_files = MappedSlotFiles(directory)
+    lot = ParkingLot(slot_files, thread_safe=thread_safe)
+    if slot_files.exists():
+        regular_slots, ev_slots = slot_files.open_pools()
+        lot.attach_slots(regular_slots, ev_slots, regular_slots.level if level is None else level)
+    return lot
+
+def flush_lot(parking_lot):
+    # Durability point for both pools of a mapped lot
+    with parking_lot.pool_locks[REGULAR_SLOT]:
+        parking_lot.regular_slots.flush()
+    with parking_lot.pool_locks[EV_SLOT]:
+        parking_lot.ev_slots.flush()
@@ -0,0 +1,157 @@
+"""
+Observer Dispatch Module - Asynchronous delivery of parking events
+
+AsyncObserverDispatcher is itself a ParkingObserver: attach it to a ParkingLot and
+attach slow observers (logging, remote sinks) to the dispatcher. Gate transactions
+only pay for a queue append; a background thread delivers the events.
+Tk widgets are not thread-safe, so GUIObserver should stay attached directly.
+"""
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from ParkingLot import ParkingObserver
+
+
+class BackpressurePolicy(Enum):
+    # What update() does when the queue is full
+    BLOCK = "block"               # wait for the worker to make room
+    DROP_OLDEST = "drop_oldest"   # discard the oldest queued event
+    COALESCE = "coalesce"         # fold into the newest queued event of the same type, else block
+
+
+class DeliveryStats:
+    # Per-observer delivery latency (enqueue -> update() returned), in seconds
+    # dropped - events the observer never got (DROP_OLDEST overflow, or sent after close())
+
+    def __init__(self):
+        self.delivered = 0
+        self.errors = 0
+        self.dropped = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def mean_latency(self):
+        return self.total_latency / self.delivered if self.delivered else 0.0
+
+    def record(self, latency):
+        self.delivered += 1
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+
+class AsyncObserverDispatcher(ParkingObserver):
+    # Bounded event queue drained by one background worker thread
+
+    def __init__(self, max_queue=1024, policy=BackpressurePolicy.BLOCK):
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+
+        self.max_queue = max_queue
+        self.policy = policy
+        self.observers = []
+        self.stats = {}
+        self.dropped = 0
+        self.coalesced = 0
+
+        # Queued entries are [event_type, message, enqueue_time] - lists so COALESCE can edit in place
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._delivering = False
+        self._worker = threading.Thread(target=self._run, name="observer-dispatch", daemon=True)
+        self._worker.start()
+
+    def attach_observer(self, observer):
+        # Observers attached here are called from the worker thread
+        with self._condition:
+            if observer not in self.observers:
+                self.observers.append(observer)
+                self.stats[observer] = DeliveryStats()
+
+    def update(self, event_type, message):
+        # Called by ParkingLot - enqueue and return immediately (unless BLOCK/COALESCE must wait)
+        # After close() events are dropped, not raised - the lot's change has already happened
+        with self._condition:
+            while not self._closed and len(self._queue) >= self.max_queue:
+                if self.policy == BackpressurePolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self._count_dropped()
+                    break
+                if self.policy == BackpressurePolicy.COALESCE and self._coalesce(event_type, message):
+                    return
+                self._condition.wait()
+
+            if self._closed:
+                # Also reached by a producer that was waiting for room when close() ran
+                self._count_dropped()
+                return
+            self._queue.append([event_type, message, time.perf_counter()])
+            self._condition.notify_all()
+
+    def _count_dropped(self):
+        # One event lost for every attached observer - called with the condition held
+        self.dropped += 1
+        for stats in self.stats.values():
+            stats.dropped += 1
+
+    def _coalesce(self, event_type, message):
+        # Merge into the newest queued event of the same type - keeps its original enqueue time
+        for entry in reversed(self._queue):
+            if entry[0] == event_type:
+                entry[1] = entry[1] + "\n" + message
+                self.coalesced += 1
+                return True
+        return False
+
+    def pending(self):
+        with self._condition:
+            return len(self._queue)
+
+    def flush(self, timeout=None):
+        # Wait until every queued event has been delivered
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self._condition:
+            while self._queue or self._delivering:
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, timeout=None):
+        # Deliver what is queued, then stop the worker
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                event_type, message, enqueued_at = self._queue.popleft()
+                observers = list(self.observers)
+                self._delivering = True
+                # Room freed - wake any producer blocked by backpressure
+                self._condition.notify_all()
+
+            for observer in observers:
+                try:
+                    observer.update(event_type, message)
+                except Exception:
+                    # A failing observer must not stop delivery to the others
+                    self.stats[observer].errors += 1
+                    continue
+                self.stats[observer].record(time.perf_counter() - enqueued_at)
+
+            with self._condition:
+                self._delivering = False
+                self._condition.notify_all()
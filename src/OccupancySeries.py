@@ -0,0 +1,277 @@
+"""
+Occupancy Series Module - Occupancy over time per pool and per floor
+
+Attach to a lot with ParkingLot.attach_occupancy() (or Garage.attach_occupancy()
+for every floor). Each park and removal records the pool's new occupied count,
+so occupancy is a step function of time. Every (level, pool) series folds it
+into fixed-size ring buffers at several resolutions - by default per second
+for the last hour, per minute for the last week and per hour for the last
+92 days. Each bucket keeps the time-weighted mean, peak and low occupancy.
+
+Rollup is automatic: a change only touches the finest ring, and each bucket
+closed there rolls up into the next coarser ring (a minute is the sum of its
+60 seconds). Quiet spells (no parks or removals) are written as constant
+buckets in bulk at every resolution, so queries never replay events. Memory
+is fixed by the ring sizes - months of history cost the same as a day's.
+
+Series per level: "regular", "EV" and ALL_POOLS (the whole floor).
+"""
+
+import threading
+import time
+from array import array
+from VehicleIndex import EV_SLOT, REGULAR_SLOT
+
+
+ALL_POOLS = "all"
+
+# Low of an open bucket before any value has been held in it
+_NOTHING_HELD = float("inf")
+
+# (name, bucket seconds, buckets kept)
+DEFAULT_RESOLUTIONS = (
+    ("second", 1, 3600),
+    ("minute", 60, 7 * 1440),
+    ("hour", 3600, 92 * 24),
+)
+
+
+class _Ring:
+    # One resolution of a series - closed buckets in a ring, plus the bucket still filling
+    # Buckets are consecutive (gaps are filled), so the newest id and a count locate all of them
+    # Closed buckets roll up into the next coarser ring
+
+    def __init__(self, seconds, size, now, coarser):
+        self.seconds = seconds
+        self.size = size
+        self.coarser = coarser
+        self.means = array('d', [0.0]) * size
+        self.peaks = array('I', [0]) * size
+        self.lows = array('I', [0]) * size
+        self.newest = None
+        self.filled = 0
+        self._open(int(now // seconds), now)
+
+    def _open(self, bucket, begin):
+        # Open bucket - occupancy x seconds from begin (its start, or when recording began)
+        # Peak and low only take values held for some time
+        self.bucket = bucket
+        self.begin = begin
+        self.area = 0.0
+        self.peak = -1
+        self.low = _NOTHING_HELD
+
+    def advance(self, last, now, value):
+        # Occupancy was value from last to now - close every bucket that ended on the way
+        if now <= last:
+            return
+        if value > self.peak:
+            self.peak = value
+        if value < self.low:
+            self.low = value
+        end = (self.bucket + 1) * self.seconds
+        if now < end:
+            self.area += value * (now - last)
+            return
+        self.area += value * (end - last)
+        self._close(end)
+
+        bucket = int(now // self.seconds)
+        skipped = bucket - self.bucket - 1
+        if skipped:
+            # Quiet spell - whole buckets at one value, and the same span for the coarser rings
+            self._write(self.bucket + 1, skipped, float(value), value, value)
+            if self.coarser is not None:
+                self.coarser.advance(end, bucket * self.seconds, value)
+        self._open(bucket, bucket * self.seconds)
+        if now > self.begin:
+            self.area = value * (now - self.begin)
+            self.peak = self.low = value
+
+    def _close(self, end):
+        self._write(self.bucket, 1, self.area / (end - self.begin), self.peak, self.low)
+        if self.coarser is not None:
+            self.coarser.add_bucket(end, self.area, self.peak, self.low)
+
+    def add_bucket(self, end, area, peak, low):
+        # Rollup of a closed finer bucket ending at end - it lies inside this ring's open bucket
+        self.area += area
+        self.peak = max(self.peak, peak)
+        self.low = min(self.low, low)
+        if end == (self.bucket + 1) * self.seconds:
+            self._close(end)
+            self._open(self.bucket + 1, end)
+
+    def _write(self, first, count, mean, peak, low):
+        # count consecutive buckets from id first with the same values - only the last size of them survive
+        if count > self.size:
+            first += count - self.size
+            count = self.size
+        start = first % self.size
+        for a, b in ((start, min(start + count, self.size)), (0, start + count - self.size)):
+            if b > a:
+                self.means[a:b] = array('d', [mean]) * (b - a)
+                self.peaks[a:b] = array('I', [peak]) * (b - a)
+                self.lows[a:b] = array('I', [low]) * (b - a)
+        self.newest = first + count - 1
+        self.filled = min(self.filled + count, self.size)
+
+    def points(self, start, end):
+        # (bucket start, mean, peak, low) for closed buckets overlapping [start, end) (None - unbounded), oldest first
+        seconds = self.seconds
+        points = []
+        if not self.filled:
+            return points
+        first = self.newest - self.filled + 1
+        last = self.newest
+        if start is not None:
+            first = max(first, int(start // seconds))
+        if end is not None:
+            last = min(last, -int(-end // seconds) - 1)
+        position = first % self.size
+        while first <= last:
+            # Run up to the end of the ring, then wrap
+            run = min(last - first + 1, self.size - position)
+            points.extend(zip(range(first * seconds, (first + run) * seconds, seconds),
+                              self.means[position:position + run],
+                              self.peaks[position:position + run],
+                              self.lows[position:position + run]))
+            first += run
+            position = 0
+        return points
+
+
+class _Series:
+    # Occupancy of one pool (or a whole floor) at every resolution
+    # Changes go into the finest ring only; coarser rings fill as its buckets close
+
+    def __init__(self, resolutions, now, value, capacity):
+        self.value = value
+        self.capacity = capacity
+        self.last = now
+        self.rings = {}
+        coarser = None
+        for name, seconds, size in reversed(resolutions):
+            coarser = self.rings[name] = _Ring(seconds, size, now, coarser)
+        self.finest = coarser
+        # Finest first - a ring's open bucket is continued by the open buckets of every finer ring
+        self.chain = [ring for _, ring in reversed(list(self.rings.items()))]
+
+    def advance(self, now):
+        # now never steps backwards (OccupancySeries._now)
+        self.finest.advance(self.last, now, self.value)
+        self.last = now
+
+    def set(self, now, value, capacity):
+        self.finest.advance(self.last, now, self.value)
+        self.last = now
+        self.value = value
+        self.capacity = capacity
+
+    def open_point(self, ring, start, end, now):
+        # ring's open bucket so far, including what the finer rings haven't rolled up yet
+        bucket_start = ring.bucket * ring.seconds
+        if now <= ring.begin or (end is not None and bucket_start >= end) or (start is not None and bucket_start + ring.seconds <= start):
+            return None
+        pending = self.chain[:self.chain.index(ring) + 1]
+        area = sum(pending_ring.area for pending_ring in pending)
+        peak = max(pending_ring.peak for pending_ring in pending)
+        low = min(pending_ring.low for pending_ring in pending)
+        return bucket_start, area / (now - ring.begin), peak, low
+
+
+class OccupancySeries:
+    # Occupancy recorder fed by ParkingLot - record() is called under the lot's pool locks
+
+    def __init__(self, resolutions=DEFAULT_RESOLUTIONS, clock=time.time):
+        # resolutions - (name, bucket seconds, buckets kept) for each ring, finest first
+        # clock - time source (seconds)
+        self.resolutions = tuple(resolutions)
+        for (_, finer, _), (name, seconds, _) in zip(self.resolutions, self.resolutions[1:]):
+            if seconds % finer:
+                raise ValueError(f"Resolution {name} ({seconds} s) must be a whole number of {finer} s buckets")
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._last_time = float("-inf")
+        # Level -> {pool: _Series}
+        self._levels = {}
+
+    def _now(self):
+        # Never step backwards (clock adjustments) - buckets close in time order
+        now = self.clock()
+        if now > self._last_time:
+            self._last_time = now
+        return self._last_time
+
+    # Recording - called by ParkingLot
+
+    def record(self, level, pool, occupied, capacity):
+        # Pool on level now has occupied of capacity slots taken; the floor total follows
+        with self._lock:
+            now = self._now()
+            floor = self._levels.get(level)
+            if floor is None:
+                floor = self._new_floor(level, now, {})
+            floor[pool].set(now, occupied, capacity)
+            self._set_total(floor, now)
+
+    def reset(self, level, pools):
+        # Lot created, restored or attached - pools are (pool, occupied, capacity) for both pools of level
+        with self._lock:
+            now = self._now()
+            floor = self._levels.get(level)
+            if floor is None:
+                # Series start at the lot's current occupancy
+                self._new_floor(level, now, {pool: (occupied, capacity) for pool, occupied, capacity in pools})
+                return
+            for pool, occupied, capacity in pools:
+                floor[pool].set(now, occupied, capacity)
+            self._set_total(floor, now)
+
+    def _new_floor(self, level, now, counts):
+        floor = {pool: _Series(self.resolutions, now, *counts.get(pool, (0, 0))) for pool in (REGULAR_SLOT, EV_SLOT)}
+        pools = (floor[REGULAR_SLOT], floor[EV_SLOT])
+        floor[ALL_POOLS] = _Series(self.resolutions, now, sum(series.value for series in pools),
+                                   sum(series.capacity for series in pools))
+        self._levels[level] = floor
+        return floor
+
+    def _set_total(self, floor, now):
+        regular, ev = floor[REGULAR_SLOT], floor[EV_SLOT]
+        floor[ALL_POOLS].set(now, regular.value + ev.value, regular.capacity + ev.capacity)
+
+    # Queries
+
+    def levels(self):
+        with self._lock:
+            return sorted(self._levels)
+
+    def series(self, level, pool=ALL_POOLS, resolution="minute", start=None, end=None):
+        # Buckets of one series overlapping [start, end) (default: everything kept), oldest first
+        # Returns {"level", "pool", "resolution", "seconds", "capacity", "occupied",
+        #          "points": [(bucket start, mean, peak, low), ...]} or None if nothing was recorded for it
+        # The last point is the bucket still filling
+        with self._lock:
+            floor = self._levels.get(level)
+            if floor is None or pool not in floor:
+                return None
+            series = floor[pool]
+            ring = series.rings.get(resolution)
+            if ring is None:
+                raise ValueError(f"Unknown resolution: {resolution}")
+            now = self._now()
+            # Close buckets that ended since the last change
+            series.advance(now)
+            points = ring.points(start, end)
+            open_point = series.open_point(ring, start, end, now)
+            if open_point is not None:
+                points.append(open_point)
+            return {
+                "level": level,
+                "pool": pool,
+                "resolution": resolution,
+                "seconds": ring.seconds,
+                "capacity": series.capacity,
+                "occupied": series.value,
+                "points": points,
+            }
@@ -0,0 +1,414 @@
+"""
+Parking GUI Module - Tkinter front end for ParkingLot
+"""
+
+import time
+import tkinter as tk
+from tkinter import messagebox
+from ParkingLot import ParkingLot, ParkingObserver, ParkingEventType
+from StatusView import LotStatusRows, LotStatusWindow, build_status_report, build_charge_report
+from ConsoleView import ConsoleText
+from QueryWorker import BackgroundQueryRunner
+
+
+# Lots with more parked vehicles than this open the virtualized status window
+# instead of dumping every row into the output text
+INLINE_STATUS_LIMIT = 200
+
+# Output console bounds - lines kept in the widget, trimmed per chunk, and kept for scroll-back
+CONSOLE_MAX_LINES = 2000
+CONSOLE_TRIM_CHUNK = 500
+CONSOLE_HISTORY_LINES = 100000
+
+# Console redraws per second at most - event bursts are coalesced into one insert per frame
+GUI_MAX_FRAME_RATE = 30
+
+# Console colors - registered as text tags once per observer
+TAG_PALETTE = ("green", "blue", "purple", "red", "navy", "orange")
+
+
+# Observer pattern - For GUI updates
+
+class GUIObserver(ParkingObserver):
+    # Concrete observer that updates the GUI
+    # Messages are queued and flushed once per frame via after(), so a burst of
+    # events costs one insert and one relayout instead of one per event
+    
+    def __init__(self, text_widget, max_frame_rate=GUI_MAX_FRAME_RATE):
+        self.text_widget = text_widget
+        
+        # Register the color tags once - inserts just reference them by name
+        self._color_tags = {}
+        for color in TAG_PALETTE:
+            self._color_tag(color)
+        
+        self.frame_interval_ms = max(1, int(1000 / max_frame_rate))
+        self._pending = []
+        self._flush_id = None
+        self._last_flush = 0.0
+    
+    def update(self, event_type, message):
+        # Display message in GUI with color coding
+        if event_type == ParkingEventType.LOT_CREATED:
+            self.write("SUCCESS " + message + "\n", "green")
+        elif event_type == ParkingEventType.VEHICLE_PARKED:
+            self.write("SUCCESS " + message + "\n", "blue")
+        elif event_type == ParkingEventType.VEHICLE_REMOVED:
+            self.write("SUCCESS " + message + "\n", "purple")
+        elif event_type in [ParkingEventType.PARKING_FAILED, ParkingEventType.REMOVAL_FAILED]:
+            self.write("FAILED " + message + "\n", "red")
+        elif event_type == ParkingEventType.BATCH_PROCESSED:
+            self.write("BATCH " + message + "\n", "navy")
+        else:
+            self.write(message + "\n")
+    
+    def write(self, text, color=None):
+        # Queue text for the next frame
+        self._pending.append((text, color))
+        if self._flush_id is None:
+            elapsed_ms = (time.monotonic() - self._last_flush) * 1000
+            delay_ms = max(0, int(self.frame_interval_ms - elapsed_ms))
+            self._flush_id = self.text_widget.after(delay_ms, self.flush)
+    
+    def flush(self):
+        # Insert everything queued in one call, then auto-scroll once (not while history is being read)
+        if self._flush_id is not None:
+            self.text_widget.after_cancel(self._flush_id)
+            self._flush_id = None
+        if not self._pending:
+            return
+        
+        chunks = self._tagged_chunks(self._pending)
+        self._pending = []
+        
+        self.text_widget.insert(tk.INSERT, *chunks)
+        self._follow_output()
+        self._last_flush = time.monotonic()
+    
+    def _follow_output(self):
+        # ConsoleText keeps its view while paged-in history is being read; a plain Text always follows
+        if isinstance(self.text_widget, ConsoleText):
+            self.text_widget.scroll_to_end()
+        else:
+            self.text_widget.see(tk.END)
+    
+    def _color_tag(self, color):
+        # Tag name for a foreground color, configured on first use only
+        tag_name = self._color_tags.get(color)
+        if tag_name is None:
+            tag_name = f"color_{color}"
+            self.text_widget.tag_config(tag_name, foreground=color)
+            self._color_tags[color] = tag_name
+        return tag_name
+    
+    def _tagged_chunks(self, segments):
+        # [(text, color), ...] -> flat insert() arguments: text, tags, text, tags, ...
+        chunks = []
+        for text, color in segments:
+            chunks.extend((text, self._color_tag(color) if color else ()))
+        return chunks
+    
+    def display_status(self, regular_vehicles, ev_vehicles, level):
+        # Display formatted status table - one insert for the whole report
+        # Flush queued messages first so the report lands after them
+        self.flush()
+        self.text_widget.insert(tk.INSERT, build_status_report(regular_vehicles, ev_vehicles, level))
+        self._follow_output()
+    
+    def display_charge_status(self, ev_vehicles, level):
+        # Display EV charge levels - one insert, colored by tag ranges
+        self.flush()
+        self.text_widget.insert(tk.INSERT, *self._tagged_chunks(build_charge_report(ev_vehicles, level)))
+        self._follow_output()
+
+
+# GUI
+
+class ParkingLotGUI:
+    # GUI Controller - ONLY handles user interface
+    # (Claude AI - Prompts for Analysing GUI & Global Variable with Tkinter, 2026)
+    
+    def __init__(self, root):
+        self.root = root
+        self.root.geometry("700x900")
+        self.root.resizable(False, False)
+        self.root.title("EasyParkPlus - Parking Lot Manager")
+        
+        # Business logic - thread_safe so queries can read it from the worker thread
+        self.parking_lot = ParkingLot(thread_safe=True)
+        
+        # GUI variables
+        self.regular_capacity_var = tk.StringVar()
+        self.ev_capacity_var = tk.StringVar()
+        self.level_var = tk.StringVar(value="1")
+        self.make_var = tk.StringVar()
+        self.model_var = tk.StringVar()
+        self.color_var = tk.StringVar()
+        self.registration_var = tk.StringVar()
+        self.is_electric_var = tk.IntVar()
+        self.is_motorcycle_var = tk.IntVar()
+        self.slot_number_var = tk.StringVar()
+        self.is_ev_slot_var = tk.IntVar()
+        self.search_registration_var = tk.StringVar()
+        self.search_color_var = tk.StringVar()
+        
+        # Create GUI
+        self._create_widgets()
+        
+        # Setup observer pattern
+        self.gui_observer = GUIObserver(self.output_text)
+        self.parking_lot.attach_observer(self.gui_observer)
+        
+        # Virtualized status window - created on first large status request
+        self.status_window = None
+        
+        # Lot queries run off the UI thread - a new query cancels the one in flight
+        self.query_runner = BackgroundQueryRunner(self.root, self.parking_lot)
+        self.root.protocol("WM_DELETE_WINDOW", self._close)
+    
+    def _close(self):
+        # Stop the query worker before the window goes away
+        self.query_runner.shutdown()
+        self.root.destroy()
+    
+    def _create_widgets(self):
+        # Create all GUI widgets
+        row = 0
+        
+        # Header
+        tk.Label(self.root, text='EasyParkPlus - Parking Lot Manager', font='Arial 14 bold').grid(
+            row=row, column=0, padx=10, pady=10, columnspan=4)
+        row += 1
+        
+        # Lot Creation Section
+        tk.Label(self.root, text='Lot Creation', font='Arial 12 bold').grid(
+            row=row, column=0, padx=10, pady=(10,5), columnspan=4)
+        row += 1
+        
+        tk.Label(self.root, text='Regular Spaces', font='Arial 12').grid(
+            row=row, column=0, padx=5, sticky='e')
+        tk.Entry(self.root, textvariable=self.regular_capacity_var, width=6, font='Arial 12').grid(
+            row=row, column=1, padx=4, pady=2)
+        tk.Label(self.root, text='EV Spaces', font='Arial 12').grid(
+            row=row, column=2, padx=5, sticky='e')
+        tk.Entry(self.root, textvariable=self.ev_capacity_var, width=6, font='Arial 12').grid(
+            row=row, column=3, padx=4, pady=2)
+        row += 1
+        
+        tk.Label(self.root, text='Floor Level', font='Arial 12').grid(
+            row=row, column=0, padx=5, sticky='e')
+        tk.Entry(self.root, textvariable=self.level_var, width=6, font='Arial 12').grid(
+            row=row, column=1, padx=4, pady=4)
+        row += 1
+        
+        tk.Button(self.root, command=self._create_lot, text="Create Parking Lot", font="Arial 12",
+                bg='lightblue', fg='black', activebackground="teal", padx=5, pady=5).grid(
+                    row=row, column=0, padx=4, pady=4, columnspan=2)
+        row += 1
+        
+        # Vehicle Management Section
+        tk.Label(self.root, text='Vehicle Management', font='Arial 12 bold').grid(
+            row=row, column=0, padx=10, pady=(10,5), columnspan=4)
+        row += 1
+        
+        tk.Label(self.root, text='Make', font='Arial 12').grid(
+            row=row, column=0, padx=5, sticky='e')
+        tk.Entry(self.root, textvariable=self.make_var, width=12, font='Arial 12').grid(
+            row=row, column=1, padx=4, pady=4)
+        tk.Label(self.root, text='Model', font='Arial 12').grid(
+            row=row, column=2, padx=5, sticky='e')
+        tk.Entry(self.root, textvariable=self.model_var, width=12, font='Arial 12').grid(
+            row=row, column=3, padx=4, pady=4)
+        row += 1
+        
+        tk.Label(self.root, text='Color', font='Arial 12').grid(
+            row=row, column=0, padx=5, sticky='e')
+        tk.Entry(self.root, textvariable=self.color_var, width=12, font='Arial 12').grid(
+            row=row, column=1, padx=4, pady=4)
+        tk.Label(self.root, text='Registration #', font='Arial 12').grid(
+            row=row, column=2, padx=5, sticky='e')
+        tk.Entry(self.root, textvariable=self.registration_var, width=12, font='Arial 12').grid(
+            row=row, column=3, padx=4, pady=4)
+        row += 1
+        
+        tk.Checkbutton(self.root, text='Electric', variable=self.is_electric_var, onvalue=1, offvalue=0, font='Arial 12').grid(
+            row=row, column=0, padx=4, pady=4)
+        tk.Checkbutton(self.root, text='Motorcycle', variable=self.is_motorcycle_var, onvalue=1, offvalue=0, font='Arial 12').grid(
+            row=row, column=1, padx=4, pady=4)
+        row += 1
+        
+        tk.Button(self.root, command=self._park_vehicle, text="Park Vehicle", font="Arial 11",
+                bg='lightblue', fg='black', activebackground="teal", padx=5, pady=5).grid(
+                    row=row, column=0, padx=4, pady=4)
+        row += 1
+        
+        tk.Label(self.root, text='Slot #', font='Arial 12').grid(
+            row=row, column=0, padx=5, sticky='e')
+        tk.Entry(self.root, textvariable=self.slot_number_var, width=12, font='Arial 12').grid(
+            row=row, column=1, padx=4, pady=4)
+        tk.Checkbutton(self.root, text='EV Slot?', variable=self.is_ev_slot_var, onvalue=1, offvalue=0, font='Arial 12').grid(
+            row=row, column=2, padx=4, pady=4)
+        row += 1
+        
+        tk.Button(self.root, command=self._remove_vehicle, text="Remove Vehicle", font="Arial 11",
+                bg='lightblue', fg='black', activebackground="teal", padx=5, pady=5).grid(
+                    row=row, column=0, padx=4, pady=4)
+        row += 1
+        
+        # Query Section
+        tk.Label(self.root, text="").grid(row=row, column=0)
+        row += 1
+        
+        tk.Button(self.root, command=self._find_by_registration, text="Find by Registration", font="Arial 11",
+                bg='lightblue', fg='black', activebackground="teal", padx=5, pady=5).grid(
+                    row=row, column=0, padx=4, pady=4)
+        tk.Entry(self.root, textvariable=self.search_registration_var, width=12, font='Arial 12').grid(
+            row=row, column=1, padx=4, pady=4)
+        
+        tk.Button(self.root, command=self._find_by_color, text="Find by Color", font="Arial 11",
+                bg='lightblue', fg='black', activebackground="teal", padx=5, pady=5).grid(
+                    row=row, column=2, padx=4, pady=4)
+        tk.Entry(self.root, textvariable=self.search_color_var, width=12, font='Arial 12').grid(
+            row=row, column=3, padx=4, pady=4)
+        row += 1
+        
+        tk.Button(self.root, command=self._show_charge_status, text="EV Charge Status", font="Arial 11",
+                bg='lightblue', fg='black', activebackground="teal", padx=5, pady=5).grid(
+                    row=row, column=0, padx=4, pady=4)
+        tk.Button(self.root, command=self._show_status, text="Lot Status", font="Arial 11",
+                bg='PaleGreen1', fg='black', activebackground="PaleGreen3", padx=5, pady=5).grid(
+                    row=row, column=1, padx=4, pady=4, columnspan=2)
+        tk.Button(self.root, command=self._clear_output, text="Clear", font="Arial 11",
+                bg='#ffcccc', fg='black', activebackground='#ff9999', padx=5, pady=5).grid(
+                    row=row, column=3, padx=4, pady=4)
+        row += 1
+        
+        # Output text area
+        self.output_text = ConsoleText(self.root, max_lines=CONSOLE_MAX_LINES, trim_chunk=CONSOLE_TRIM_CHUNK,
+                                       history_lines=CONSOLE_HISTORY_LINES, width=75, height=15, font='Courier 10')
+        self.output_text.grid(
+            row=row, column=0, padx=10, pady=10, columnspan=4)
+    
+    # Event handlers - delegate to business logic
+    
+    def _create_lot(self):
+        # Create parking lot
+        try:
+            regular_capacity = int(self.regular_capacity_var.get())
+            ev_capacity = int(self.ev_capacity_var.get())
+            level = int(self.level_var.get())
+            self.parking_lot.create_parking_lot(regular_capacity, ev_capacity, level)
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please enter valid numbers")
+    
+    def _park_vehicle(self):
+        # Park vehicle
+        if not self.registration_var.get().strip():
+            messagebox.showwarning("Missing Info", "Please enter registration number")
+            return
+        
+        self.parking_lot.park_vehicle(
+            self.registration_var.get().strip(),
+            self.make_var.get().strip(),
+            self.model_var.get().strip(),
+            self.color_var.get().strip() or "Unknown",
+            bool(self.is_electric_var.get()),
+            bool(self.is_motorcycle_var.get())
+        )
+        
+        # Clear form
+        self.make_var.set("")
+        self.model_var.set("")
+        self.color_var.set("")
+        self.registration_var.set("")
+        self.is_electric_var.set(0)
+        self.is_motorcycle_var.set(0)
+    
+    def _remove_vehicle(self):
+        # Remove vehicle
+        try:
+            slot_number = int(self.slot_number_var.get())
+            is_ev_slot = bool(self.is_ev_slot_var.get())
+            self.parking_lot.remove_vehicle(slot_number, is_ev_slot)
+            self.slot_number_var.set("")
+        except ValueError:
+            messagebox.showwarning("Invalid Input", "Please enter valid slot number")
+    
+    def _find_by_registration(self):
+        # Find vehicle by registration
+        registration = self.search_registration_var.get().strip()
+        if not registration:
+            return
+        
+        result = self.parking_lot.find_slot_by_registration(registration)
+        if result.get("found"):
+            self.gui_observer.write(f"SUCCESS Vehicle {registration} found in {result['type']} slot {result['slot_number']}\n")
+        else:
+            self.gui_observer.write(f"FAILED Vehicle {registration} not found\n")
+    
+    def _find_by_color(self):
+        # Find vehicles by color
+        color = self.search_color_var.get().strip()
+        if not color:
+            return
+        
+        self.query_runner.submit(
+            lambda lot: lot.find_vehicles_by_color(color),
+            lambda results: self._display_color_results(color, results)
+        )
+    
+    def _display_color_results(self, color, results):
+        # Runs on the UI thread once the color query completes
+        self.gui_observer.write(f"\nVehicles with color '{color}':\n")
+        
+        if results["regular"]:
+            slots = ", ".join(str(slot) for slot, _ in results["regular"])
+            self.gui_observer.write(f"Regular slots: {slots}\n")
+        else:
+            self.gui_observer.write("Regular slots: (none)\n")
+        
+        if results["ev"]:
+            slots = ", ".join(str(slot) for slot, _ in results["ev"])
+            self.gui_observer.write(f"EV slots: {slots}\n")
+        else:
+            self.gui_observer.write("EV slots: (none)\n")
+        
+        self.gui_observer.write("\n")
+    
+    def _show_status(self):
+        # Show parking lot status
+        if not self.parking_lot.is_initialized:
+            messagebox.showwarning("Not Initialized", "Please create parking lot first")
+            return
+        
+        self.query_runner.submit(
+            lambda lot: (lot.get_all_regular_vehicles(), lot.get_all_ev_vehicles(), lot.level),
+            lambda results: self._display_status_results(*results)
+        )
+    
+    def _display_status_results(self, regular, ev, level):
+        # Runs on the UI thread once the status query completes
+        if len(regular) + len(ev) <= INLINE_STATUS_LIMIT:
+            self.gui_observer.display_status(regular, ev, level)
+            return
+        
+        # Large lot - render only the visible rows in a separate window
+        if self.status_window is None or not self.status_window.winfo_exists():
+            self.status_window = LotStatusWindow(self.root)
+        self.status_window.show(LotStatusRows(regular, ev, level))
+        self.gui_observer.write(f"Lot status ({len(regular) + len(ev)} vehicles) opened in status window\n")
+    
+    def _show_charge_status(self):
+        # Show EV charge status
+        if not self.parking_lot.is_initialized:
+            messagebox.showwarning("Not Initialized", "Please create parking lot first")
+            return
+        
+        self.query_runner.submit(
+            lambda lot: (lot.get_all_ev_vehicles(), lot.level),
+            lambda results: self.gui_observer.display_charge_status(*results)
+        )
+    
+    def _clear_output(self):
+        # Clear output - cleared lines stay reachable by scrolling up
+        self.output_text.clear()
@@ -0,0 +1,324 @@
+"""
+Parking Journal Module - Append-only write-ahead journal with group commit
+
+A ParkingLot with a journal attached records every successful create, park
+and remove as a compact binary record. Records are appended to an in-memory
+buffer under the lot's own locks. A writer thread moves the buffer to disk
+and fsyncs it. A gate waits for durability only after releasing the lot's
+locks, so every gate waiting while one fsync runs is covered by the next
+one: many changes, one fsync.
+
+Directory layout:
+    journal-<first sequence>.log   segments of records, oldest first
+    snapshot-<sequence>.snap       LotSnapshot files written by checkpoint()
+
+Record: u32 payload length | u32 CRC-32 of payload | payload
+    payload  u8 kind | u64 sequence | body
+    CREATE   u32 regular capacity | u32 EV capacity | i32 level
+    PARK     u8 pool (0 regular, 1 EV) | u32 slot index | u8 type code | 4 x (u16 length + UTF-8)
+    REMOVE   u8 pool | u32 slot index
+A torn record at the end of the last segment (crash mid-write) is cut off on
+recovery. EV charge changes are not lot operations and only persist through
+checkpoints.
+"""
+
+import os
+import re
+import struct
+import threading
+import zlib
+from LotSnapshot import gc_paused, read_snapshot, save_snapshot
+from ParkingLot import ParkingLot
+from SlotStore import ListSlotStore, TYPE_ELECTRIC, TYPE_MOTORCYCLE, vehicle_type_code
+from Vehicle import VehicleFactory
+from VehicleIndex import EV_SLOT
+
+
+RECORD_CREATE = 1
+RECORD_PARK = 2
+RECORD_REMOVE = 3
+
+_FRAME = struct.Struct("<II")
+_PREFIX = struct.Struct("<BQ")
+_CREATE = struct.Struct("<IIi")
+_SLOT = struct.Struct("<BI")
+_STRING_LENGTH = struct.Struct("<H")
+
+_SEGMENT_NAME = re.compile(r"^journal-(\d{20})\.log$")
+_SNAPSHOT_NAME = re.compile(r"^snapshot-(\d{20})\.snap$")
+
+
+def _segment_path(directory, first_sequence):
+    return os.path.join(directory, f"journal-{first_sequence:020d}.log")
+
+def _snapshot_path(directory, sequence):
+    return os.path.join(directory, f"snapshot-{sequence:020d}.snap")
+
+def _numbered_files(directory, pattern):
+    # [(number, path)] for files matching pattern, ascending
+    found = []
+    for name in os.listdir(directory):
+        match = pattern.match(name)
+        if match:
+            found.append((int(match.group(1)), os.path.join(directory, name)))
+    return sorted(found)
+
+
+class ParkingJournal:
+    # Durable log of lot changes - attach with ParkingLot.attach_journal() or open through recover_lot()
+
+    def __init__(self, directory, last_sequence=0, fsync=True):
+        # last_sequence - sequence of the newest record already on disk (recover_lot() passes it)
+        # fsync - False still survives a process crash, but not an OS crash or power loss
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.fsync = fsync
+        self.last_sequence = last_sequence
+        self.durable_sequence = last_sequence
+        self.commits = 0
+
+        self._buffer = bytearray()
+        self._condition = threading.Condition()
+        self._rotate_requested = False
+        self._closed = False
+        self._error = None
+        self._file = open(_segment_path(directory, last_sequence + 1), "ab")
+        self._writer = threading.Thread(target=self._run, name="journal-writer", daemon=True)
+        self._writer.start()
+
+    # Appends - called by ParkingLot under its locks, never block on I/O
+
+    def record_create(self, regular_capacity, ev_capacity, level):
+        self._append(RECORD_CREATE, _CREATE.pack(regular_capacity, ev_capacity, level))
+
+    def record_park(self, slot_type, slot_index, vehicle):
+        body = bytearray(_SLOT.pack(1 if slot_type == EV_SLOT else 0, slot_index))
+        body.append(vehicle_type_code(vehicle))
+        for text in (vehicle.regnum, vehicle.make, vehicle.model, vehicle.color):
+            encoded = text.encode("utf-8")
+            body += _STRING_LENGTH.pack(len(encoded))
+            body += encoded
+        self._append(RECORD_PARK, body)
+
+    def record_remove(self, slot_type, slot_index):
+        self._append(RECORD_REMOVE, _SLOT.pack(1 if slot_type == EV_SLOT else 0, slot_index))
+
+    def _append(self, kind, body):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Journal is closed")
+            self.last_sequence += 1
+            payload = _PREFIX.pack(kind, self.last_sequence) + body
+            self._buffer += _FRAME.pack(len(payload), zlib.crc32(payload))
+            self._buffer += payload
+            self._condition.notify_all()
+
+    # Durability
+
+    def commit(self):
+        # Block until every record appended so far is on disk
+        with self._condition:
+            target = self.last_sequence
+            while self.durable_sequence < target:
+                if self._error is not None:
+                    raise self._error
+                self._condition.wait()
+
+    def checkpoint(self, parking_lot):
+        # Save a snapshot, then drop journal segments and snapshots it makes redundant
+        snapshot = parking_lot.snapshot()
+        sequence = snapshot.journal_sequence
+        self.commit()
+        save_snapshot(snapshot, _snapshot_path(self.directory, sequence), copy=False)
+        self._rotate()
+
+        for older_sequence, path in _numbered_files(self.directory, _SNAPSHOT_NAME):
+            if older_sequence < sequence:
+                os.remove(path)
+        # A segment is redundant once the next one starts at or before sequence + 1
+        segments = _numbered_files(self.directory, _SEGMENT_NAME)
+        for (first, path), (next_first, _) in zip(segments, segments[1:]):
+            if next_first <= sequence + 1:
+                os.remove(path)
+        return sequence
+
+    def close(self):
+        # Write out what is buffered, then stop the writer
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._writer.join()
+        self._file.close()
+
+    def _rotate(self):
+        # Start a new segment - everything written so far stays in the old one
+        with self._condition:
+            self._rotate_requested = True
+            self._condition.notify_all()
+            while self._rotate_requested:
+                if self._error is not None:
+                    raise self._error
+                self._condition.wait()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._buffer and not self._rotate_requested and not self._closed:
+                    self._condition.wait()
+                data, self._buffer = self._buffer, bytearray()
+                target = self.last_sequence
+                rotate = self._rotate_requested
+                closing = self._closed
+
+            try:
+                if data:
+                    self._file.write(data)
+                    self._file.flush()
+                    if self.fsync:
+                        os.fsync(self._file.fileno())
+                if rotate:
+                    self._file.close()
+                    self._file = open(_segment_path(self.directory, target + 1), "ab")
+            except OSError as error:
+                with self._condition:
+                    self._error = error
+                    self._condition.notify_all()
+                return
+
+            with self._condition:
+                if data:
+                    self.durable_sequence = target
+                    self.commits += 1
+                if rotate:
+                    self._rotate_requested = False
+                self._condition.notify_all()
+                if closing and not self._buffer:
+                    return
+
+
+# Recovery
+
+def read_records(path):
+    # Yield (kind, sequence, body) from one segment and return the byte length of its valid prefix
+    with open(path, "rb") as segment_file:
+        data = memoryview(segment_file.read())
+    offset = 0
+    while offset + _FRAME.size <= len(data):
+        length, crc = _FRAME.unpack_from(data, offset)
+        start = offset + _FRAME.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        kind, sequence = _PREFIX.unpack_from(payload, 0)
+        yield kind, sequence, payload[_PREFIX.size:]
+        offset = start + length
+    return offset
+
+def _decode_park(body):
+    # PARK record body -> Vehicle
+    type_code = body[_SLOT.size]
+    offset = _SLOT.size + 1
+    strings = []
+    for _ in range(4):
+        length, = _STRING_LENGTH.unpack_from(body, offset)
+        offset += _STRING_LENGTH.size
+        strings.append(str(body[offset:offset + length], "utf-8"))
+        offset += length
+    return VehicleFactory.create_vehicle(*strings, bool(type_code & TYPE_ELECTRIC), bool(type_code & TYPE_MOTORCYCLE))
+
+
+class _ReplayState:
+    # Lot state folded from snapshot + journal - vehicles are built once, at the end
+    # Pools map slot index -> Vehicle (from the snapshot) or the raw PARK record body (from the journal),
+    # so vehicles parked and removed again within the journal are never decoded
+
+    def __init__(self):
+        self.initialized = False
+        self.regular_capacity = self.ev_capacity = self.level = 0
+        self.pools = ({}, {})
+
+    def load_snapshot(self, path):
+        levels = read_snapshot(path)
+        if len(levels) != 1:
+            raise ValueError(f"Journal snapshot holds {len(levels)} levels, expected 1")
+        self.level, self.regular_capacity, self.ev_capacity, regular_vehicles, ev_vehicles = levels[0]
+        self.pools = ({slot_number - 1: vehicle for slot_number, vehicle in regular_vehicles},
+                      {slot_number - 1: vehicle for slot_number, vehicle in ev_vehicles})
+        self.initialized = True
+
+    def apply(self, kind, body):
+        if kind == RECORD_CREATE:
+            self.regular_capacity, self.ev_capacity, self.level = _CREATE.unpack_from(body, 0)
+            self.pools = ({}, {})
+            self.initialized = True
+            return
+
+        pool, slot_index = _SLOT.unpack_from(body, 0)
+        slots = self.pools[pool]
+        if kind == RECORD_REMOVE:
+            if slots.pop(slot_index, None) is None:
+                raise ValueError(f"Journal replay conflict: slot {slot_index + 1} is already empty")
+            return
+
+        if slot_index in slots:
+            raise ValueError(f"Journal replay conflict: slot {slot_index + 1} is already occupied")
+        slots[slot_index] = body
+
+    def build(self, lot):
+        # One bulk restore instead of replaying every park and remove through the lot
+        if not self.initialized:
+            return
+        located = []
+        for slots in self.pools:
+            vehicles = []
+            for slot_index in sorted(slots):
+                vehicle = slots[slot_index]
+                if isinstance(vehicle, memoryview):
+                    vehicle = _decode_park(vehicle)
+                vehicles.append((slot_index + 1, vehicle))
+            located.append(vehicles)
+        lot.restore_parking_lot(self.regular_capacity, self.ev_capacity, self.level, *located)
+
+def recover_lot(directory, slot_store=ListSlotStore, thread_safe=False, fsync=True):
+    # Newest snapshot + every later journal record -> (ParkingLot, ParkingJournal attached to it)
+    os.makedirs(directory, exist_ok=True)
+    with gc_paused():
+        state = _ReplayState()
+        snapshots = _numbered_files(directory, _SNAPSHOT_NAME)
+        snapshot_sequence = 0
+        if snapshots:
+            snapshot_sequence, snapshot_path = snapshots[-1]
+            state.load_snapshot(snapshot_path)
+
+        last_sequence = snapshot_sequence
+        segments = _numbered_files(directory, _SEGMENT_NAME)
+        for position, (_, path) in enumerate(segments):
+            records = read_records(path)
+            while True:
+                try:
+                    kind, sequence, body = next(records)
+                except StopIteration as stop:
+                    valid_length = stop.value
+                    break
+                if sequence <= snapshot_sequence:
+                    continue
+                if sequence != last_sequence + 1:
+                    raise ValueError(f"Journal gap: expected record {last_sequence + 1}, found {sequence}")
+                state.apply(kind, body)
+                last_sequence = sequence
+
+            if valid_length < os.path.getsize(path):
+                if position != len(segments) - 1:
+                    raise ValueError(f"Corrupt record inside {os.path.basename(path)}")
+                # Torn write from a crash - cut it off so new records follow valid ones
+                with open(path, "r+b") as segment_file:
+                    segment_file.truncate(valid_length)
+
+        lot = ParkingLot(slot_store, thread_safe=thread_safe)
+        state.build(lot)
+
+    journal = ParkingJournal(directory, last_sequence, fsync)
+    lot.journal_sequence = last_sequence
+    # Already durable in the journal - no checkpoint needed
+    lot.attach_journal(journal, checkpoint=False)
+    return lot, journal
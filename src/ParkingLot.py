@@ -0,0 +1,594 @@
+"""
+Parking Lot Module - Headless business logic
+Strategies, events, observer interface and ParkingLot - no GUI imports, so gate
+controllers, servers and scripts can run on display-less machines
+"""
+
+from Vehicle import Vehicle, ElectricVehicle, VehicleFactory
+from SlotAllocator import SlotAllocator
+from VehicleIndex import RegistrationIndex, AttributeIndex, REGULAR_SLOT, EV_SLOT
+from ParkingQuery import QueryPlanner
+from SlotStore import ListSlotStore, SlotStorage, EMPTY_SLOT
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from enum import Enum
+from contextlib import nullcontext
+import threading
+
+
+# Stand-in for locks when a lot is used from a single thread
+_NO_LOCK = nullcontext()
+
+
+# Strategy pattern 
+
+class ParkingStrategy(ABC):
+    """
+    Strategy interface for parking operations
+    Allows different algorithms for regular vs EV parking
+    """
+    
+    @abstractmethod
+    def can_park(self, vehicle, occupied_count, capacity):
+        # Check if vehicle can be parked
+        pass
+    
+    @abstractmethod
+    def find_empty_slot(self, allocator):
+        # Claim first available slot from the pool's allocator
+        pass
+
+class StandardParkingStrategy(ParkingStrategy):
+    # Strategy for regular (non-electric) vehicles
+    
+    def can_park(self, vehicle, occupied_count, capacity):
+        # Regular vehicles need regular slots
+        return not isinstance(vehicle, ElectricVehicle) and occupied_count < capacity
+    
+    def find_empty_slot(self, allocator):
+        # Lowest-numbered free slot, -1 if none
+        return allocator.allocate()
+
+class EVParkingStrategy(ParkingStrategy):
+    # Strategy for electric vehicles - requires charging stations
+    
+    def can_park(self, vehicle, occupied_count, capacity):
+        # Only electric vehicles in EV slots
+        return isinstance(vehicle, ElectricVehicle) and occupied_count < capacity
+    
+    def find_empty_slot(self, allocator):
+        # Lowest-numbered free slot, -1 if none
+        return allocator.allocate()
+
+
+# Observer pattern - Decouples business logic from presentation
+
+class ParkingEventType(Enum):
+    # Types of events that can occur in parking lot
+    LOT_CREATED = "lot_created"
+    VEHICLE_PARKED = "vehicle_parked"
+    VEHICLE_REMOVED = "vehicle_removed"
+    PARKING_FAILED = "parking_failed"
+    REMOVAL_FAILED = "removal_failed"
+    BATCH_PROCESSED = "batch_processed"
+
+class ParkingObserver(ABC):
+    # Observer interface - observers react to parking lot events
+    # With a thread_safe lot, update() is called from whichever gate thread made the change
+    
+    @abstractmethod
+    def update(self, event_type, message):
+        # Called when parking lot state changes
+        pass
+
+
+# Business Logic - Separated from GUI
+
+class ParkingLot:
+    # Core parking lot business logic
+    
+    def __init__(self, slot_store=ListSlotStore, thread_safe=False):
+        # Initialize parking lot with strategies
+        # slot_store - storage layout class for each pool (ListSlotStore or ColumnarSlotStore)
+        #              or a SlotStorage backend (MappedSlotFiles, SqliteSlotStorage)
+        # thread_safe - lock pools and indexes so several gate threads can share the lot
+        self.level = 0
+        self.regular_capacity = 0
+        self.ev_capacity = 0
+
+        self.slot_store = slot_store
+        # Backends get a commit() after every change - plain store classes have nothing to commit
+        self.storage = slot_store if isinstance(slot_store, SlotStorage) else None
+        self.regular_slots = slot_store(0)
+        self.ev_slots = slot_store(0)
+        
+        # Free slot bookkeeping - kept in sync with the slot lists
+        self.regular_allocator = SlotAllocator()
+        self.ev_allocator = SlotAllocator()
+        
+        # Registration -> (slot type, slot index) for O(1) lookups
+        self.registration_index = RegistrationIndex()
+        
+        # Case-folded secondary indexes for attribute searches
+        # Columnar stores scan their own code columns instead
+        if slot_store.has_attribute_columns:
+            self.attribute_indexes = {}
+        else:
+            self.attribute_indexes = {
+                "color": AttributeIndex("color"),
+                "make": AttributeIndex("make"),
+                "model": AttributeIndex("model"),
+            }
+        
+        # Strategy pattern - different behavior for regular vs EV
+        self.regular_strategy = StandardParkingStrategy()
+        self.ev_strategy = EVParkingStrategy()
+        
+        # Observer pattern - list of observers to notify
+        self.observers = []
+        
+        # Concurrency-safe mode - one lock per pool so parks into different pools
+        # don't contend, plus a short-held lock for the indexes
+        # Lock order: pool lock before index lock
+        self.thread_safe = thread_safe
+        if thread_safe:
+            self.pool_locks = {REGULAR_SLOT: threading.Lock(), EV_SLOT: threading.Lock()}
+            self.index_lock = threading.Lock()
+        else:
+            self.pool_locks = {REGULAR_SLOT: _NO_LOCK, EV_SLOT: _NO_LOCK}
+            self.index_lock = _NO_LOCK
+        
+        # Registrations between the duplicate check and indexing
+        self._reserved_registrations = set()
+        
+        # Write-ahead journal (ParkingJournal) - successful changes are recorded under the
+        # same locks that apply them, so journal order matches the order they happened
+        self.journal = None
+        # Last journal sequence this state reflects - set on snapshots of a journaled lot
+        self.journal_sequence = 0
+        
+        # Session history (SessionHistory) - arrivals and departures, recorded under the pool locks
+        self.history = None
+        
+        # Occupancy time series (OccupancySeries) - each pool's occupied count after every change
+        self.occupancy = None
+        
+        self.is_initialized = False
+    
+    def attach_observer(self, observer):
+        # Add an observer 
+        if observer not in self.observers:
+            self.observers.append(observer)
+    
+    def attach_journal(self, journal, checkpoint=True):
+        # Record every successful change from now on
+        # A lot that already holds state is checkpointed first - the journal alone has no CREATE or
+        # PARK records for it, so recovery would otherwise start from an empty lot
+        # checkpoint=False only when the lot was just rebuilt from this journal (recover_lot)
+        self.journal = journal
+        if checkpoint and self.is_initialized:
+            journal.checkpoint(self)
+    
+    def attach_history(self, history):
+        # Record arrivals and departures from now on - vehicles already parked count as arriving now
+        with self.pool_locks[REGULAR_SLOT], self.pool_locks[EV_SLOT]:
+            self.history = history
+            self._reset_history()
+    
+    def _reset_history(self):
+        # Slots were replaced wholesale - called with both pool locks held
+        if self.history is not None:
+            parked = [(REGULAR_SLOT, slot_index, self.regular_slots[slot_index]) for slot_index in self.regular_slots.occupied_indexes()]
+            parked += [(EV_SLOT, slot_index, self.ev_slots[slot_index]) for slot_index in self.ev_slots.occupied_indexes()]
+            self.history.reset(parked)
+    
+    def attach_occupancy(self, occupancy):
+        # Record occupancy from now on, starting with the current counts (or at creation, for a lot not created yet)
+        with self.pool_locks[REGULAR_SLOT], self.pool_locks[EV_SLOT]:
+            self.occupancy = occupancy
+            if self.is_initialized:
+                self._reset_occupancy()
+    
+    def _reset_occupancy(self):
+        # Both pools changed wholesale - called with both pool locks held
+        if self.occupancy is not None:
+            self.occupancy.reset(self.level, [
+                (REGULAR_SLOT, self.regular_allocator.occupied_count, self.regular_capacity),
+                (EV_SLOT, self.ev_allocator.occupied_count, self.ev_capacity),
+            ])
+    
+    def _commit_changes(self):
+        # Make applied changes durable - called outside the locks, so gates share journal fsyncs,
+        # and once per batch, so a batch is one storage transaction
+        if self.storage is not None:
+            self.storage.commit()
+        if self.journal is not None:
+            self.journal.commit()
+    
+    def notify_observers(self, event_type, message):
+        # Notify all observers of an event 
+        for observer in self.observers:
+            observer.update(event_type, message)
+    
+    def _index_vehicle(self, vehicle, slot_type, slot_index):
+        # Add a newly parked vehicle to every index
+        self.registration_index.add(vehicle.regnum, slot_type, slot_index)
+        for index in self.attribute_indexes.values():
+            index.add(vehicle, slot_type, slot_index)
+    
+    def _unindex_vehicle(self, vehicle, slot_type, slot_index):
+        # Drop a departing vehicle from every index
+        self.registration_index.remove(vehicle.regnum)
+        for index in self.attribute_indexes.values():
+            index.remove(vehicle, slot_type, slot_index)
+    
+    def snapshot(self):
+        # Point-in-time copy of the lot state for readers on other threads
+        # Slots, allocators and indexes are copied (Vehicle objects are shared); observers are not
+        clone = ParkingLot(self.slot_store)
+        with self.pool_locks[REGULAR_SLOT], self.pool_locks[EV_SLOT], self.index_lock:
+            clone.level = self.level
+            clone.regular_capacity = self.regular_capacity
+            clone.ev_capacity = self.ev_capacity
+            clone.is_initialized = self.is_initialized
+            clone.regular_slots = self.regular_slots.copy()
+            clone.ev_slots = self.ev_slots.copy()
+            clone.regular_allocator = self.regular_allocator.copy()
+            clone.ev_allocator = self.ev_allocator.copy()
+            clone.registration_index = self.registration_index.copy()
+            clone.attribute_indexes = {attribute: index.copy() for attribute, index in self.attribute_indexes.items()}
+            # Every journal append happens under one of these locks, so the position is exact
+            clone.journal_sequence = self.journal.last_sequence if self.journal is not None else self.journal_sequence
+        return clone
+    
+    def create_parking_lot(self, regular_capacity, ev_capacity, level):
+        # Initialize parking lot
+        with self.pool_locks[REGULAR_SLOT], self.pool_locks[EV_SLOT], self.index_lock:
+            self.regular_capacity = regular_capacity
+            self.ev_capacity = ev_capacity
+            self.level = level
+
+            self.regular_slots = self._new_slots(regular_capacity, REGULAR_SLOT)
+            self.ev_slots = self._new_slots(ev_capacity, EV_SLOT)
+            self.regular_allocator.reset(regular_capacity)
+            self.ev_allocator.reset(ev_capacity)
+            self.registration_index.clear()
+            for index in self.attribute_indexes.values():
+                index.clear()
+            
+            self.is_initialized = True
+            if self.journal is not None:
+                self.journal.record_create(regular_capacity, ev_capacity, level)
+            self._reset_history()
+            self._reset_occupancy()
+        
+        self._commit_changes()
+        message = f"Created parking lot with {regular_capacity} regular slots and {ev_capacity} EV slots on level {level}"
+        self.notify_observers(ParkingEventType.LOT_CREATED, message)
+    
+    def _new_slots(self, capacity, pool):
+        # Empty store for pool - backends also keep self.level, so a reopened lot comes back on its level
+        if self.storage is not None:
+            return self.storage(capacity, pool, self.level)
+        return self.slot_store(capacity, pool)
+
+    def restore_parking_lot(self, regular_capacity, ev_capacity, level, regular_vehicles, ev_vehicles):
+        # Rebuild a lot from saved state - vehicles are (slot_number, vehicle) pairs per pool,
+        # the same shape get_all_regular_vehicles()/get_all_ev_vehicles() return
+        with self.pool_locks[REGULAR_SLOT], self.pool_locks[EV_SLOT], self.index_lock:
+            self.regular_capacity = regular_capacity
+            self.ev_capacity = ev_capacity
+            self.level = level
+
+            self.regular_slots = self._new_slots(regular_capacity, REGULAR_SLOT)
+            self.ev_slots = self._new_slots(ev_capacity, EV_SLOT)
+            self.registration_index.clear()
+            for index in self.attribute_indexes.values():
+                index.clear()
+
+            pools = (
+                (REGULAR_SLOT, self.regular_slots, self.regular_allocator, regular_vehicles, regular_capacity),
+                (EV_SLOT, self.ev_slots, self.ev_allocator, ev_vehicles, ev_capacity),
+            )
+            for slot_type, slots, allocator, vehicles, capacity in pools:
+                located_vehicles = [(slot_number - 1, vehicle) for slot_number, vehicle in vehicles]
+                for slot_index, vehicle in located_vehicles:
+                    slots[slot_index] = vehicle
+                # Bulk index loads - far cheaper than indexing vehicle by vehicle
+                self.registration_index.add_many(slot_type, located_vehicles)
+                for index in self.attribute_indexes.values():
+                    index.add_many(slot_type, located_vehicles)
+                allocator.restore(capacity, [slot_index for slot_index, _ in located_vehicles])
+
+            self.is_initialized = True
+            self._reset_history()
+            self._reset_occupancy()
+
+        self._commit_changes()
+        message = (f"Restored parking lot with {regular_capacity} regular slots and {ev_capacity} EV slots on level {level} "
+                   f"({len(regular_vehicles) + len(ev_vehicles)} vehicles)")
+        self.notify_observers(ParkingEventType.LOT_CREATED, message)
+    
+    def attach_slots(self, regular_slots, ev_slots, level):
+        # Serve slot stores that already hold vehicles (e.g. mapped files from a previous run)
+        # Capacities come from the stores; only allocators and indexes are rebuilt
+        with self.pool_locks[REGULAR_SLOT], self.pool_locks[EV_SLOT], self.index_lock:
+            self.regular_capacity = len(regular_slots)
+            self.ev_capacity = len(ev_slots)
+            self.level = level
+
+            self.regular_slots = regular_slots
+            self.ev_slots = ev_slots
+            self.registration_index.clear()
+            for index in self.attribute_indexes.values():
+                index.clear()
+
+            parked = 0
+            pools = (
+                (REGULAR_SLOT, self.regular_slots, self.regular_allocator),
+                (EV_SLOT, self.ev_slots, self.ev_allocator),
+            )
+            for slot_type, slots, allocator in pools:
+                occupied_indexes = slots.occupied_indexes()
+                allocator.restore(len(slots), occupied_indexes)
+                parked += len(occupied_indexes)
+                if slots.has_attribute_columns:
+                    # Column stores list registrations directly - no Vehicle objects are built
+                    self.registration_index.add_registrations(slot_type, slots.occupied_registrations())
+                else:
+                    located_vehicles = [(slot_index, slots[slot_index]) for slot_index in occupied_indexes]
+                    self.registration_index.add_many(slot_type, located_vehicles)
+                    for index in self.attribute_indexes.values():
+                        index.add_many(slot_type, located_vehicles)
+
+            self.is_initialized = True
+            self._reset_history()
+            self._reset_occupancy()
+
+        message = (f"Attached parking lot with {self.regular_capacity} regular slots and {self.ev_capacity} EV slots "
+                   f"on level {level} ({parked} vehicles)")
+        self.notify_observers(ParkingEventType.LOT_CREATED, message)
+    
+    def park_vehicle(self, registration_number, make, model, color, is_electric, is_motorcycle):
+        # Park a vehicle using appropriate strategy
+        slot_number, event_type, message = self._park(registration_number, make, model, color, is_electric, is_motorcycle)
+        if slot_number > 0:
+            self._commit_changes()
+        self.notify_observers(event_type, message)
+        return slot_number
+    
+    def remove_vehicle(self, slot_number, is_ev_slot):
+        # Remove vehicle from slot
+        removed, event_type, message = self._remove(slot_number, is_ev_slot)
+        if removed:
+            self._commit_changes()
+        self.notify_observers(event_type, message)
+        return removed
+    
+    def park_vehicles(self, batch):
+        # Park a batch of (registration, make, model, color, is_electric, is_motorcycle) tuples
+        # One pass over the batch, one aggregated BATCH_PROCESSED event for observers
+        # Returns a {"parked", "slot_number", "message"} dict per item, in batch order
+        results = []
+        for item in batch:
+            slot_number, event_type, message = self._park(*item)
+            results.append({"parked": slot_number > 0, "slot_number": slot_number, "message": message})
+        
+        parked = sum(1 for result in results if result["parked"])
+        # One durability wait for the whole batch
+        if parked:
+            self._commit_changes()
+        self.notify_observers(ParkingEventType.BATCH_PROCESSED, f"Batch park: {parked} parked, {len(results) - parked} failed")
+        return results
+    
+    def remove_vehicles(self, batch):
+        # Remove a batch of (slot_number, is_ev_slot) pairs
+        # One pass over the batch, one aggregated BATCH_PROCESSED event for observers
+        # Returns a {"removed", "message"} dict per item, in batch order
+        results = []
+        for slot_number, is_ev_slot in batch:
+            removed, event_type, message = self._remove(slot_number, is_ev_slot)
+            results.append({"removed": removed, "message": message})
+        
+        removed = sum(1 for result in results if result["removed"])
+        if removed:
+            self._commit_changes()
+        self.notify_observers(ParkingEventType.BATCH_PROCESSED, f"Batch remove: {removed} removed, {len(results) - removed} failed")
+        return results
+    
+    def _park(self, registration_number, make, model, color, is_electric, is_motorcycle):
+        # Park without notifying - returns (slot_number or -1, event type, message)
+        if not self.is_initialized:
+            return -1, ParkingEventType.PARKING_FAILED, "Please create parking lot first"
+        
+        # Reject duplicates without scanning the slots
+        # The registration stays reserved until indexed, so two gates can't both park it
+        with self.index_lock:
+            existing = self.registration_index.lookup(registration_number)
+            if existing is not None:
+                slot_type, slot_index = existing
+                return -1, ParkingEventType.PARKING_FAILED, f"Vehicle {registration_number} is already parked in {slot_type} slot {slot_index + 1}"
+            if registration_number in self._reserved_registrations:
+                return -1, ParkingEventType.PARKING_FAILED, f"Vehicle {registration_number} is already being parked"
+            self._reserved_registrations.add(registration_number)
+        
+        try:
+            # Factory pattern - create appropriate vehicle
+            vehicle = VehicleFactory.create_vehicle(registration_number, make, model, color, is_electric, is_motorcycle)
+            
+            # Strategy pattern - use appropriate parking strategy
+            if isinstance(vehicle, ElectricVehicle):
+                with self.pool_locks[EV_SLOT]:
+                    occupied_count = self.ev_allocator.occupied_count
+                    
+                    if self.ev_strategy.can_park(vehicle, occupied_count, self.ev_capacity):
+                        slot_index = self.ev_strategy.find_empty_slot(self.ev_allocator)
+                        if slot_index >= 0:
+                            self._store_vehicle(EV_SLOT, self.ev_slots, self.ev_allocator, slot_index, vehicle)
+                            with self.index_lock:
+                                self._index_vehicle(vehicle, EV_SLOT, slot_index)
+                            if self.history is not None:
+                                self.history.record_arrival(EV_SLOT, slot_index, vehicle)
+                            if self.occupancy is not None:
+                                self.occupancy.record(self.level, EV_SLOT, self.ev_allocator.occupied_count, self.ev_capacity)
+                            slot_number = slot_index + 1
+                            message = f"Allocated EV slot number: {slot_number} for {vehicle.get_type()} - {registration_number}"
+                            return slot_number, ParkingEventType.VEHICLE_PARKED, message
+            else:
+                with self.pool_locks[REGULAR_SLOT]:
+                    occupied_count = self.regular_allocator.occupied_count
+                    
+                    if self.regular_strategy.can_park(vehicle, occupied_count, self.regular_capacity):
+                        slot_index = self.regular_strategy.find_empty_slot(self.regular_allocator)
+                        if slot_index >= 0:
+                            self._store_vehicle(REGULAR_SLOT, self.regular_slots, self.regular_allocator, slot_index, vehicle)
+                            with self.index_lock:
+                                self._index_vehicle(vehicle, REGULAR_SLOT, slot_index)
+                            if self.history is not None:
+                                self.history.record_arrival(REGULAR_SLOT, slot_index, vehicle)
+                            if self.occupancy is not None:
+                                self.occupancy.record(self.level, REGULAR_SLOT, self.regular_allocator.occupied_count, self.regular_capacity)
+                            slot_number = slot_index + 1
+                            message = f"Allocated regular slot number: {slot_number} for {vehicle.get_type()} - {registration_number}"
+                            return slot_number, ParkingEventType.VEHICLE_PARKED, message
+            
+            # If we get here, parking failed
+            slot_type = EV_SLOT if isinstance(vehicle, ElectricVehicle) else REGULAR_SLOT
+            return -1, ParkingEventType.PARKING_FAILED, f"Sorry, {slot_type} parking lot is full"
+            
+        except Exception as error:
+            return -1, ParkingEventType.PARKING_FAILED, f"Error: {str(error)}"
+        
+        finally:
+            with self.index_lock:
+                self._reserved_registrations.discard(registration_number)
+    
+    def _store_vehicle(self, slot_type, slots, allocator, slot_index, vehicle):
+        # Write a vehicle to its claimed slot and journal it - called with the pool lock held, before indexing
+        # On any failure the slot and allocator are rolled back, so a failed park leaves no trace
+        try:
+            slots[slot_index] = vehicle
+        except Exception:
+            # Store rejected the vehicle (e.g. a fixed-width field overflowed)
+            allocator.release(slot_index)
+            raise
+        if self.journal is not None:
+            try:
+                self.journal.record_park(slot_type, slot_index, vehicle)
+            except Exception:
+                # Not journaled, so not parked (e.g. the journal is closed)
+                slots[slot_index] = EMPTY_SLOT
+                allocator.release(slot_index)
+                raise
+    
+    def _remove(self, slot_number, is_ev_slot):
+        # Remove without notifying - returns (removed, event type, message)
+        try:
+            slot_index = slot_number - 1
+            slots = self.ev_slots if is_ev_slot else self.regular_slots
+            allocator = self.ev_allocator if is_ev_slot else self.regular_allocator
+            slot_type = EV_SLOT if is_ev_slot else REGULAR_SLOT
+            
+            with self.pool_locks[slot_type]:
+                if 0 <= slot_index < len(slots) and slots[slot_index] is not EMPTY_SLOT:
+                    vehicle = slots[slot_index]
+                    # Journal first - if the append fails the vehicle stays where it is
+                    if self.journal is not None:
+                        self.journal.record_remove(slot_type, slot_index)
+                    slots[slot_index] = EMPTY_SLOT
+                    allocator.release(slot_index)
+                    with self.index_lock:
+                        self._unindex_vehicle(vehicle, slot_type, slot_index)
+                    if self.history is not None:
+                        self.history.record_departure(slot_type, slot_index)
+                    if self.occupancy is not None:
+                        capacity = self.ev_capacity if is_ev_slot else self.regular_capacity
+                        self.occupancy.record(self.level, slot_type, allocator.occupied_count, capacity)
+                    message = f"Slot number {slot_number} ({slot_type}) is now free - was {vehicle.regnum}"
+                    return True, ParkingEventType.VEHICLE_REMOVED, message
+                else:
+                    return False, ParkingEventType.REMOVAL_FAILED, f"Unable to remove vehicle from {slot_type} slot {slot_number}"
+        except Exception as error:
+            return False, ParkingEventType.REMOVAL_FAILED, f"Error: {str(error)}"
+    
+    def get_all_regular_vehicles(self):
+        # Get list of (slot_number, vehicle) tuples for regular vehicles
+        with self.pool_locks[REGULAR_SLOT]:
+            return [(i+1, self.regular_slots[i]) for i in self.regular_slots.occupied_indexes()]
+    
+    def get_all_ev_vehicles(self):
+        # Get list of (slot_number, vehicle) tuples for EV vehicles
+        with self.pool_locks[EV_SLOT]:
+            return [(i+1, self.ev_slots[i]) for i in self.ev_slots.occupied_indexes()]
+    
+    def get_regular_rows(self):
+        # Report rows for regular slots read straight from the slot store, no Vehicle objects needed
+        # (slot_number, type, registration, color, make, model, charge or None) - see SlotStore.vehicle_row()
+        with self.pool_locks[REGULAR_SLOT]:
+            return self.regular_slots.occupied_rows()
+    
+    def get_ev_rows(self):
+        # Report rows for EV slots - same shape as get_regular_rows()
+        with self.pool_locks[EV_SLOT]:
+            return self.ev_slots.occupied_rows()
+    
+    def find_slot_by_registration(self, registration):
+        # Find slot by registration number - O(1) via the registration index
+        with self.index_lock:
+            location = self.registration_index.lookup(registration)
+        if location is None:
+            return {"found": False}
+        
+        slot_type, slot_index = location
+        return {"slot_number": slot_index+1, "type": slot_type, "found": True}
+    
+    def _find_vehicles_by_attribute(self, attribute, value):
+        # Resolve a case-insensitive attribute search through its index,
+        # or a column scan when the slot store has no separate index
+        if attribute in self.attribute_indexes:
+            regular_indexes = []
+            ev_indexes = []
+            with self.index_lock:
+                for slot_type, slot_index in self.attribute_indexes[attribute].lookup(value):
+                    if slot_type == EV_SLOT:
+                        ev_indexes.append(slot_index)
+                    else:
+                        regular_indexes.append(slot_index)
+            regular_indexes.sort()
+            ev_indexes.sort()
+        else:
+            # Column stores read the matching vehicles in one pass (one SELECT for SQLite),
+            # under the pool lock so a concurrent write can't land between match and read
+            with self.pool_locks[REGULAR_SLOT]:
+                regular_vehicles = [(i+1, vehicle) for i, vehicle in self.regular_slots.vehicles_matching(attribute, value)]
+            with self.pool_locks[EV_SLOT]:
+                ev_vehicles = [(i+1, vehicle) for i, vehicle in self.ev_slots.vehicles_matching(attribute, value)]
+            return {"regular": regular_vehicles, "ev": ev_vehicles}
+        
+        # Re-check every slot - since the lookup another gate may have emptied it,
+        # or removed the car and parked one that doesn't match in its place
+        normalize = AttributeIndex.normalize
+        key = normalize(value)
+        regular_vehicles = [(i+1, vehicle) for i in regular_indexes
+                            if (vehicle := self.regular_slots[i]) is not EMPTY_SLOT and normalize(getattr(vehicle, attribute)) == key]
+        ev_vehicles = [(i+1, vehicle) for i in ev_indexes
+                       if (vehicle := self.ev_slots[i]) is not EMPTY_SLOT and normalize(getattr(vehicle, attribute)) == key]
+        
+        return {"regular": regular_vehicles, "ev": ev_vehicles}
+    
+    def find_vehicles_by_color(self, color):
+        # Find all vehicles matching color
+        return self._find_vehicles_by_attribute("color", color)
+    
+    def find_vehicles_by_make(self, make):
+        # Find all vehicles matching make
+        return self._find_vehicles_by_attribute("make", make)
+    
+    def find_vehicles_by_model(self, model):
+        # Find all vehicles matching model
+        return self._find_vehicles_by_attribute("model", model)
+    
+    def query(self, *predicates):
+        # Compound query - all predicates must match (see ParkingQuery)
+        # Returns lazy {"regular": iterator, "ev": iterator} of (slot_number, vehicle) tuples
+        return QueryPlanner(self).execute(predicates)
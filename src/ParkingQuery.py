@@ -0,0 +1,130 @@
+"""
+Parking Query Module - Compound multi-attribute queries over parked vehicles
+
+Example - red Toyota motorcycles in EV slots with charge below 20:
+    lot.query(AttributeEquals("color", "red"), AttributeEquals("make", "Toyota"),
+              VehicleTypeIs("Motorcycle"), SlotTypeIs(EV_SLOT), ChargeBelow(20))
+"""
+
+from abc import ABC, abstractmethod
+from VehicleIndex import AttributeIndex, REGULAR_SLOT, EV_SLOT
+from SlotStore import EMPTY_SLOT
+
+
+class QueryPredicate(ABC):
+    # A single condition on a parked vehicle and the slot type it occupies
+
+    @abstractmethod
+    def matches(self, slot_type, vehicle):
+        pass
+
+    def postings(self, parking_lot):
+        # Candidate (slot type, slot index) set from an index, None if not indexable
+        return None
+
+class AttributeEquals(QueryPredicate):
+    # Case-insensitive equality on color, make or model
+
+    def __init__(self, attribute, value):
+        self.attribute = attribute
+        self.key = AttributeIndex.normalize(value)
+
+    def matches(self, slot_type, vehicle):
+        return AttributeIndex.normalize(getattr(vehicle, self.attribute)) == self.key
+
+    def postings(self, parking_lot):
+        index = parking_lot.attribute_indexes.get(self.attribute)
+        return index.lookup(self.key) if index is not None else None
+
+class VehicleTypeIs(QueryPredicate):
+    # Match on get_type() - "Car" or "Motorcycle"
+
+    def __init__(self, vehicle_type):
+        self.vehicle_type = vehicle_type
+
+    def matches(self, slot_type, vehicle):
+        return vehicle.get_type() == self.vehicle_type
+
+class SlotTypeIs(QueryPredicate):
+    # Restrict results to one pool - the planner skips the other pool entirely
+
+    def __init__(self, slot_type):
+        self.slot_type = slot_type
+
+    def matches(self, slot_type, vehicle):
+        return slot_type == self.slot_type
+
+class ChargeBelow(QueryPredicate):
+    # Vehicles with charge strictly below a limit - non-electric vehicles never match
+
+    def __init__(self, limit):
+        self.limit = limit
+
+    def matches(self, slot_type, vehicle):
+        return hasattr(vehicle, 'charge') and vehicle.charge < self.limit
+
+class ChargeAtLeast(QueryPredicate):
+    # Vehicles with charge at or above a limit - non-electric vehicles never match
+
+    def __init__(self, limit):
+        self.limit = limit
+
+    def matches(self, slot_type, vehicle):
+        return hasattr(vehicle, 'charge') and vehicle.charge >= self.limit
+
+
+class QueryPlanner:
+    # Plans a conjunction of predicates against a ParkingLot
+    # 1. SlotTypeIs predicates prune whole pools
+    # 2. Indexed predicates are intersected smallest posting set first
+    # 3. Remaining predicates filter the candidates lazily as results are consumed
+
+    def __init__(self, parking_lot):
+        self.parking_lot = parking_lot
+
+    def execute(self, predicates):
+        # Returns {"regular": iterator, "ev": iterator} of (slot_number, vehicle) tuples
+        pools = {REGULAR_SLOT, EV_SLOT}
+        for predicate in predicates:
+            if isinstance(predicate, SlotTypeIs):
+                pools &= {predicate.slot_type}
+
+        candidates = self._intersect_postings(predicates)
+
+        return {
+            "regular": self._stream(REGULAR_SLOT, self.parking_lot.regular_slots, pools, candidates, predicates),
+            "ev": self._stream(EV_SLOT, self.parking_lot.ev_slots, pools, candidates, predicates),
+        }
+
+    def _intersect_postings(self, predicates):
+        # Smallest-first intersection of index posting sets, None if nothing is indexed
+        with self.parking_lot.index_lock:
+            posting_sets = []
+            for predicate in predicates:
+                postings = predicate.postings(self.parking_lot)
+                if postings is not None:
+                    posting_sets.append(postings)
+
+            if not posting_sets:
+                return None
+
+            posting_sets.sort(key=len)
+            smallest, others = posting_sets[0], posting_sets[1:]
+            # Materialize now - posting sets are live and change as vehicles park/leave
+            return [key for key in smallest if all(key in postings for postings in others)]
+
+    def _stream(self, slot_type, slots, pools, candidates, predicates):
+        # Lazily yield matches for one pool in slot order
+        if slot_type not in pools:
+            return
+
+        if candidates is None:
+            slot_indexes = slots.occupied_indexes()
+        else:
+            slot_indexes = sorted(index for candidate_type, index in candidates if candidate_type == slot_type)
+
+        for slot_index in slot_indexes:
+            vehicle = slots[slot_index]
+            # Re-check every predicate - the lot may have changed since planning
+            if vehicle is not EMPTY_SLOT and all(predicate.matches(slot_type, vehicle) for predicate in predicates):
+                yield slot_index + 1, vehicle
@@ -0,0 +1,356 @@
+"""
+Parking Server Module - Headless HTTP/JSON API for the parking engine
+
+Standard library only. Connections are HTTP/1.1 keep-alive, so a client can
+reuse one socket and pipeline requests on it. POST /batch runs a list of
+operations in one request, handing consecutive parks/removes to
+ParkingLot.park_vehicles()/remove_vehicles() as one engine call each.
+
+Run: python src/ParkingServer.py [--host 127.0.0.1] [--port 8080]
+
+Endpoints:
+    POST /lot                  {"regular_capacity", "ev_capacity", "level"}
+    POST /park                 {"registration", "make", "model", "color", "is_electric", "is_motorcycle"}
+    POST /remove               {"slot_number", "is_ev_slot"}
+    POST /batch                {"operations": [{"op": "park" | "remove" | "find", ...}, ...]}
+    GET  /registration/<reg>   slot lookup by registration number
+    GET  /search?color=<color> vehicles of a color (also make= / model=)
+    GET  /status               every parked vehicle
+    GET  /charge               EV charge levels
+    GET  /occupancy            occupancy buckets - ?pool=all|regular|EV&resolution=second|minute|hour&start=&end=
+                               (only when started with --occupancy)
+"""
+
+import argparse
+import json
+import os
+from itertools import groupby
+from operator import itemgetter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from ParkingLot import ParkingLot
+from LotSnapshot import load_lot, save_snapshot
+from MappedSlotStore import flush_lot, open_mapped_lot
+from OccupancySeries import ALL_POOLS, OccupancySeries
+from VehicleIndex import EV_SLOT, REGULAR_SLOT
+
+
+PARK_FIELDS = ("registration", "make", "model", "color")
+# Largest request body accepted - a 100k-operation batch is well under it
+MAX_BODY_BYTES = 64 * 1024 * 1024
+SEARCH_ATTRIBUTES = ("color", "make", "model")
+OCCUPANCY_POOLS = (ALL_POOLS, REGULAR_SLOT, EV_SLOT)
+
+
+class RequestError(Exception):
+    # Client error - reported as 400 with {"error": message}
+    pass
+
+
+def vehicle_json(slot_number, vehicle):
+    record = {
+        "slot_number": slot_number,
+        "registration": vehicle.regnum,
+        "type": vehicle.get_type(),
+        "color": vehicle.color,
+        "make": vehicle.make,
+        "model": vehicle.model,
+    }
+    if hasattr(vehicle, 'charge'):
+        record["charge"] = vehicle.charge
+    return record
+
+def row_json(row):
+    # ParkingLot.get_regular_rows()/get_ev_rows() row -> the same record vehicle_json() builds
+    slot_number, vehicle_type, registration, color, make, model, charge = row
+    record = {
+        "slot_number": slot_number,
+        "registration": registration,
+        "type": vehicle_type,
+        "color": color,
+        "make": make,
+        "model": model,
+    }
+    if charge is not None:
+        record["charge"] = charge
+    return record
+
+def vehicles_json(results):
+    # {"regular": [(slot, vehicle), ...], "ev": [...]} -> JSON-ready lists
+    return {pool: [vehicle_json(slot_number, vehicle) for slot_number, vehicle in vehicles]
+            for pool, vehicles in results.items()}
+
+def flag(body, field):
+    # Optional JSON boolean - strings and numbers are refused, since bool("false") would be True
+    value = body.get(field, False)
+    if not isinstance(value, bool):
+        raise RequestError(f"{field} must be true or false")
+    return value
+
+def park_arguments(body):
+    # JSON park request -> ParkingLot.park_vehicle() positional arguments
+    missing = [field for field in PARK_FIELDS if field not in body]
+    if missing:
+        raise RequestError(f"Missing field(s): {', '.join(missing)}")
+    return (str(body["registration"]), str(body["make"]), str(body["model"]), str(body["color"]),
+            flag(body, "is_electric"), flag(body, "is_motorcycle"))
+
+def remove_arguments(body):
+    # JSON remove request -> (slot_number, is_ev_slot)
+    try:
+        slot_number = int(body["slot_number"])
+    except (KeyError, TypeError, ValueError):
+        raise RequestError("slot_number must be an integer")
+    return slot_number, flag(body, "is_ev_slot")
+
+
+class ParkingService:
+    # Request handling independent of HTTP - one instance shared by every connection
+
+    def __init__(self, parking_lot=None, record_occupancy=False):
+        # record_occupancy - keep occupancy history for GET /occupancy; off by default, since every
+        #                    park and remove then also takes the series' lock
+        self.parking_lot = parking_lot if parking_lot is not None else ParkingLot(thread_safe=True)
+        self.occupancy = None
+        if record_occupancy:
+            # Kept in memory for as long as the server runs
+            self.occupancy = OccupancySeries()
+            self.parking_lot.attach_occupancy(self.occupancy)
+
+    def create_lot(self, body):
+        try:
+            regular_capacity = int(body["regular_capacity"])
+            ev_capacity = int(body["ev_capacity"])
+            level = int(body.get("level", 1))
+        except (KeyError, TypeError, ValueError):
+            raise RequestError("regular_capacity and ev_capacity must be integers")
+        if regular_capacity < 0 or ev_capacity < 0:
+            raise RequestError("Capacities must not be negative")
+        self.parking_lot.create_parking_lot(regular_capacity, ev_capacity, level)
+        return {"created": True, "regular_capacity": regular_capacity, "ev_capacity": ev_capacity, "level": level}
+
+    def park(self, body):
+        slot_number = self.parking_lot.park_vehicle(*park_arguments(body))
+        return {"parked": slot_number > 0, "slot_number": slot_number}
+
+    def remove(self, body):
+        return {"removed": self.parking_lot.remove_vehicle(*remove_arguments(body))}
+
+    def find(self, registration):
+        return self.parking_lot.find_slot_by_registration(registration)
+
+    def search(self, params):
+        for attribute in SEARCH_ATTRIBUTES:
+            if attribute in params:
+                finder = getattr(self.parking_lot, f"find_vehicles_by_{attribute}")
+                return vehicles_json(finder(params[attribute][0]))
+        raise RequestError("Search needs one of: color, make, model")
+
+    def status(self):
+        # Reports read rows straight from the slot stores instead of building every Vehicle
+        return {
+            "level": self.parking_lot.level,
+            "regular": [row_json(row) for row in self.parking_lot.get_regular_rows()],
+            "ev": [row_json(row) for row in self.parking_lot.get_ev_rows()],
+        }
+
+    def charge_status(self):
+        return {
+            "level": self.parking_lot.level,
+            "ev": [{"slot_number": slot_number, "registration": registration, "charge": charge if charge is not None else 0}
+                   for slot_number, _, registration, _, _, _, charge in self.parking_lot.get_ev_rows()],
+        }
+
+    def occupancy_series(self, params):
+        # Buckets as {"start", "mean", "peak", "low"}; start/end are Unix times
+        if self.occupancy is None:
+            raise RequestError("Occupancy is not recorded - start the server with --occupancy")
+        pool = params.get("pool", [ALL_POOLS])[0]
+        if pool not in OCCUPANCY_POOLS:
+            raise RequestError(f"pool must be one of: {', '.join(OCCUPANCY_POOLS)}")
+        resolution = params.get("resolution", ["minute"])[0]
+        try:
+            start, end = (float(params[bound][0]) if bound in params else None for bound in ("start", "end"))
+        except ValueError:
+            raise RequestError("start and end must be numbers")
+        try:
+            series = self.occupancy.series(self.parking_lot.level, pool, resolution, start, end)
+        except ValueError as error:
+            raise RequestError(str(error))
+        if series is None:
+            raise RequestError("Please create parking lot first")
+        series["points"] = [{"start": bucket_start, "mean": mean, "peak": peak, "low": low}
+                            for bucket_start, mean, peak, low in series["points"]]
+        return series
+
+    def batch(self, body):
+        # Results come back in request order; runs of the same op become one engine call
+        # Every operation is validated before any runs, so a bad request changes nothing
+        operations = body.get("operations")
+        if not isinstance(operations, list):
+            raise RequestError("operations must be a list")
+
+        parsed = [self._batch_operation(operation) for operation in operations]
+        results = []
+        for op, run in groupby(parsed, key=itemgetter(0)):
+            results.extend(self._run_batch(op, [arguments for _, arguments in run]))
+        return {"results": results}
+
+    def _batch_operation(self, operation):
+        op = operation.get("op") if isinstance(operation, dict) else None
+        if op == "park":
+            return op, park_arguments(operation)
+        if op == "remove":
+            return op, remove_arguments(operation)
+        if op == "find":
+            return op, str(operation.get("registration", ""))
+        raise RequestError(f"Unknown batch op: {op!r}")
+
+    def _run_batch(self, op, run):
+        if op == "park":
+            return self.parking_lot.park_vehicles(run)
+        if op == "remove":
+            return self.parking_lot.remove_vehicles(run)
+        return [self.parking_lot.find_slot_by_registration(registration) for registration in run]
+
+
+class ParkingRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so connections stay open between requests
+    protocol_version = "HTTP/1.1"
+    server_version = "EasyParkPlus"
+    # Headers and body go out as separate writes - without TCP_NODELAY the body waits on a delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        service = self.server.service
+        if url.path.startswith("/registration/"):
+            self._respond(lambda: service.find(unquote(url.path[len("/registration/"):])))
+        elif url.path == "/search":
+            self._respond(lambda: service.search(parse_qs(url.query)))
+        elif url.path == "/status":
+            self._respond(service.status)
+        elif url.path == "/charge":
+            self._respond(service.charge_status)
+        elif url.path == "/occupancy":
+            self._respond(lambda: service.occupancy_series(parse_qs(url.query)))
+        else:
+            self._send(404, {"error": f"Unknown path: {url.path}"})
+
+    def do_POST(self):
+        routes = {
+            "/lot": self.server.service.create_lot,
+            "/park": self.server.service.park,
+            "/remove": self.server.service.remove,
+            "/batch": self.server.service.batch,
+        }
+        # Body must be consumed even for unknown paths or the next request on the connection is corrupt
+        try:
+            body = self._read_json()
+        except RequestError as error:
+            self._send(400, {"error": str(error)})
+            return
+
+        handler = routes.get(urlsplit(self.path).path)
+        if handler is None:
+            self._send(404, {"error": f"Unknown path: {self.path}"})
+        else:
+            self._respond(lambda: handler(body))
+
+    def _read_json(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_BODY_BYTES:
+            # read(-1) would wait for the client to hang up; either way the body can't be skipped,
+            # so the connection closes after the error
+            self.close_connection = True
+            raise RequestError("Invalid Content-Length")
+        raw = self.rfile.read(length) if length else b"{}"
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            raise RequestError("Request body is not valid JSON")
+        if not isinstance(body, dict):
+            raise RequestError("Request body must be a JSON object")
+        return body
+
+    def _respond(self, action):
+        try:
+            result = action()
+        except RequestError as error:
+            self._send(400, {"error": str(error)})
+            return
+        except Exception as error:
+            # Anything else is a server fault - answer in JSON and keep the connection usable
+            self.log_error("%s %s failed: %r", self.command, self.path, error)
+            self._send(500, {"error": "Internal server error"})
+            return
+        self._send(200, result)
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Per-request logging only when the server was started with --verbose
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def log_error(self, format, *args):
+        # Errors are logged with or without --verbose
+        super().log_message(format, *args)
+
+
+class ParkingHTTPServer(ThreadingHTTPServer):
+    # One thread per connection - the shared lot runs in thread_safe mode
+    daemon_threads = True
+
+    def __init__(self, address, service=None, verbose=False):
+        super().__init__(address, ParkingRequestHandler)
+        self.service = service if service is not None else ParkingService()
+        self.verbose = verbose
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EasyParkPlus HTTP/JSON API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--regular", type=int, help="create a lot with this many regular slots on startup")
+    parser.add_argument("--ev", type=int, default=0, help="EV slots for the startup lot")
+    parser.add_argument("--level", type=int, default=1, help="floor level for the startup lot (a mapped lot keeps the level it was created with)")
+    parser.add_argument("--snapshot", metavar="PATH", help="restore the lot from PATH if present, save it there on shutdown")
+    parser.add_argument("--mapped", metavar="DIR", help="keep the slot table in memory-mapped files in DIR and serve them again on restart")
+    parser.add_argument("--occupancy", action="store_true", help="record occupancy history for GET /occupancy")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    parking_lot = None
+    if args.mapped:
+        parking_lot = open_mapped_lot(args.mapped, thread_safe=True)
+    elif args.snapshot and os.path.exists(args.snapshot):
+        parking_lot = load_lot(args.snapshot, thread_safe=True)
+    server = ParkingHTTPServer((args.host, args.port), ParkingService(parking_lot, args.occupancy),
+                               verbose=args.verbose)
+    if not server.service.parking_lot.is_initialized and args.regular is not None:
+        server.service.parking_lot.create_parking_lot(args.regular, args.ev, args.level)
+
+    print(f"EasyParkPlus API listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.mapped and server.service.parking_lot.is_initialized:
+            flush_lot(server.service.parking_lot)
+        if args.snapshot and server.service.parking_lot.is_initialized:
+            save_snapshot(server.service.parking_lot, args.snapshot)
+
+if __name__ == '__main__':
+    main()
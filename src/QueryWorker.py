@@ -0,0 +1,59 @@
+"""
+Query Worker Module - Runs ParkingLot queries off the Tk main thread
+
+Queries run on a worker thread against the live lot, which must be thread_safe -
+its pool and index locks keep each read consistent while the UI thread parks and
+removes. Nothing is copied on the UI thread. Results are handed back on the UI
+thread through after() polling - Tk widgets must not be touched from the worker.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundQueryRunner:
+    # One query in flight at a time - submitting a new query cancels the previous one
+
+    POLL_MS = 15
+
+    def __init__(self, root, parking_lot):
+        if not parking_lot.thread_safe:
+            raise ValueError("Background queries need a thread_safe ParkingLot")
+        self.root = root
+        self.parking_lot = parking_lot
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lot-query")
+        self._current = None
+
+    def submit(self, query, on_result, on_error=None):
+        # query(lot) runs on the worker, on_result(result) / on_error(error) on the UI thread
+        self.cancel()
+        future = self._executor.submit(query, self.parking_lot)
+        self._current = future
+        self.root.after(self.POLL_MS, self._poll, future, on_result, on_error)
+        return future
+
+    def cancel(self):
+        # Queued queries never start; a running query finishes but its result is discarded
+        if self._current is not None:
+            self._current.cancel()
+            self._current = None
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _poll(self, future, on_result, on_error):
+        # Superseded or cancelled - drop silently
+        if future is not self._current:
+            return
+        if not future.done():
+            self.root.after(self.POLL_MS, self._poll, future, on_result, on_error)
+            return
+
+        self._current = None
+        error = future.exception()
+        if error is None:
+            on_result(future.result())
+        elif on_error is not None:
+            on_error(error)
+        else:
+            raise error
@@ -0,0 +1,245 @@
+"""
+Session History Module - Arrival/departure record of every parking stay
+
+Attach to a lot with ParkingLot.attach_history(). Each park opens a session
+and each removal closes it with a timestamp, so stays outlive the vehicle's
+slot. Completed sessions go into time-partitioned chunks - one chunk per
+chunk_seconds of departure time, each a set of compact array columns
+(arrival, departure, registration code, pool, slot). Sessions close in
+departure order, so every append goes to the newest chunk and each chunk
+stays sorted by departure.
+
+Queries use indexes, not scans of every session:
+    sessions_for(registration)        registration -> session ids postings
+    sessions_overlapping(start, end)  chunk ranges and per-chunk earliest arrival
+                                      skip chunks, bisect on departure inside one;
+                                      stays in progress are kept in arrival order
+"""
+
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import compress, repeat
+from operator import gt
+from VehicleIndex import EV_SLOT, REGULAR_SLOT
+
+
+_POOLS = (REGULAR_SLOT, EV_SLOT)
+
+
+class _SessionChunk:
+    # Completed sessions whose departure falls in one chunk_seconds span, in departure order
+
+    def __init__(self, key, first_id):
+        self.key = key
+        self.first_id = first_id
+        self.min_arrival = float("inf")
+        self.arrivals = array('d')
+        self.departures = array('d')
+        self.registrations = array('I')
+        self.pools = array('B')
+        self.slots = array('I')
+
+    def __len__(self):
+        return len(self.departures)
+
+    def row(self, row):
+        # (arrival, departure, registration code, pool, slot index)
+        return self.arrivals[row], self.departures[row], self.registrations[row], self.pools[row], self.slots[row]
+
+    def rows(self, first_row):
+        # row() tuples from first_row to the end, zipped column slices
+        return zip(self.arrivals[first_row:], self.departures[first_row:], self.registrations[first_row:],
+                   self.pools[first_row:], self.slots[first_row:])
+
+    def append(self, arrival, departure, registration_code, pool, slot_index):
+        self.arrivals.append(arrival)
+        self.departures.append(departure)
+        self.registrations.append(registration_code)
+        self.pools.append(pool)
+        self.slots.append(slot_index)
+        self.min_arrival = min(self.min_arrival, arrival)
+
+
+class SessionHistory:
+    # Session store fed by ParkingLot - record_* are called under the lot's pool locks
+
+    def __init__(self, chunk_seconds=3600, clock=time.time):
+        # chunk_seconds - departure time covered by one chunk; queries skip whole chunks outside a window
+        # clock - time source for arrivals and departures (seconds)
+        self.chunk_seconds = chunk_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._last_time = float("-inf")
+
+        # Stays in progress: (pool, slot index) -> stay (registration, arrival, location),
+        # and registration -> (pool, slot index)
+        self._open = {}
+        self._open_locations = {}
+        # Every stay opened, in arrival order - arrivals never step backwards, so appends keep it sorted
+        # Closed stays are skipped (no longer the stay in _open) and compacted away once they dominate
+        self._open_arrivals = array('d')
+        self._open_stays = []
+
+        self._chunks = []
+        self._chunk_keys = []
+        self._chunk_first_ids = []
+        # Session ids run on across prunes - ids below _first_id are gone
+        self._session_count = 0
+        self._first_id = 0
+        # Registration strings are stored once; chunks hold their codes
+        self._registration_codes = {}
+        self._registrations = []
+        # Registration code -> ids of its completed sessions, ascending
+        self._postings = {}
+
+    def __len__(self):
+        # Completed sessions held
+        return self._session_count - self._first_id
+
+    def _now(self):
+        # Never step backwards (clock adjustments) - chunks must stay in departure order
+        self._last_time = max(self.clock(), self._last_time)
+        return self._last_time
+
+    # Recording - called by ParkingLot
+
+    def record_arrival(self, slot_type, slot_index, vehicle):
+        with self._lock:
+            self._start((slot_type, slot_index), vehicle.regnum, self._now())
+
+    def record_departure(self, slot_type, slot_index):
+        with self._lock:
+            self._close((slot_type, slot_index), self._now())
+
+    def reset(self, parked):
+        # Lot recreated or restored - close every open stay, then open one for each (slot type, slot index, vehicle)
+        # in parked; their real arrival times are unknown, so they count from now
+        with self._lock:
+            now = self._now()
+            for location in list(self._open):
+                self._close(location, now)
+            for slot_type, slot_index, vehicle in parked:
+                self._start((slot_type, slot_index), vehicle.regnum, now)
+
+    def _start(self, location, registration, arrival):
+        stay = (registration, arrival, location)
+        self._open[location] = stay
+        self._open_locations[registration] = location
+        self._open_arrivals.append(arrival)
+        self._open_stays.append(stay)
+
+    def _close(self, location, departure):
+        stay = self._open.pop(location, None)
+        if stay is None:
+            return
+        registration, arrival, _ = stay
+        del self._open_locations[registration]
+        if len(self._open_stays) > 2 * len(self._open) + 64:
+            # Mostly closed stays - keep the open ones, still in arrival order
+            self._open_stays = [stay for stay in self._open_stays if self._open.get(stay[2]) is stay]
+            self._open_arrivals = array('d', [stay[1] for stay in self._open_stays])
+
+        code = self._registration_codes.get(registration)
+        if code is None:
+            code = self._registration_codes[registration] = len(self._registrations)
+            self._registrations.append(registration)
+
+        key = int(departure // self.chunk_seconds)
+        if not self._chunks or self._chunks[-1].key != key:
+            self._chunks.append(_SessionChunk(key, self._session_count))
+            self._chunk_keys.append(key)
+            self._chunk_first_ids.append(self._session_count)
+        slot_type, slot_index = location
+        self._chunks[-1].append(arrival, departure, code, _POOLS.index(slot_type), slot_index)
+
+        postings = self._postings.get(code)
+        if postings is None:
+            postings = self._postings[code] = array('Q')
+        postings.append(self._session_count)
+        self._session_count += 1
+
+    # Queries - results are dicts, oldest departure first, stays in progress last
+
+    def _completed(self, rows):
+        # Result dicts for chunk rows (_SessionChunk.row() tuples) - one comprehension, no call per row
+        registrations = self._registrations
+        return [{
+            "registration": registrations[registration_code],
+            "slot_number": slot_index + 1,
+            "type": _POOLS[pool],
+            "arrived_at": arrival,
+            "departed_at": departure,
+            "dwell": departure - arrival,
+        } for arrival, departure, registration_code, pool, slot_index in rows]
+
+    def _in_progress(self, stays, now):
+        # Result dicts for open stays
+        return [{
+            "registration": registration,
+            "slot_number": slot_index + 1,
+            "type": slot_type,
+            "arrived_at": arrival,
+            "departed_at": None,
+            "dwell": now - arrival,
+        } for registration, arrival, (slot_type, slot_index) in stays]
+
+    def _chunk_for(self, session_id):
+        # Chunk holding a session id - ids ascend across chunks
+        return self._chunks[bisect_right(self._chunk_first_ids, session_id) - 1]
+
+    def sessions_for(self, registration):
+        # Every stay of one vehicle, through the registration postings
+        with self._lock:
+            rows = []
+            for session_id in self._postings.get(self._registration_codes.get(registration), ()):
+                chunk = self._chunk_for(session_id)
+                rows.append(chunk.row(session_id - chunk.first_id))
+            sessions = self._completed(rows)
+            location = self._open_locations.get(registration)
+            if location is not None:
+                sessions += self._in_progress([self._open[location]], max(self.clock(), self._last_time))
+            return sessions
+
+    def sessions_overlapping(self, start, end):
+        # Stays that were in progress at any time in [start, end): arrived before end, left after start
+        # Bounds are compared as floats, like the stored times
+        start, end = float(start), float(end)
+        with self._lock:
+            sessions = []
+            # Chunks hold departures in [key * chunk_seconds, (key + 1) * chunk_seconds) - earlier ones left before start
+            first_chunk = bisect_left(self._chunk_keys, int(start // self.chunk_seconds))
+            for chunk in self._chunks[first_chunk:]:
+                if chunk.min_arrival >= end:
+                    continue
+                first_row = bisect_right(chunk.departures, start)
+                arrived = map(gt, repeat(end), chunk.arrivals[first_row:])
+                sessions += self._completed(compress(chunk.rows(first_row), arrived))
+
+            # Stays in progress all leave after start - only those that arrived before end count
+            now = max(self.clock(), self._last_time)
+            arrived = self._open_stays[:bisect_left(self._open_arrivals, end)]
+            open_stays = self._open
+            sessions += self._in_progress([stay for stay in arrived if open_stays.get(stay[2]) is stay], now)
+            return sessions
+
+    def prune(self, before):
+        # Drop completed sessions that departed before the start of before's chunk - returns how many went
+        with self._lock:
+            keep_from = bisect_left(self._chunk_keys, int(before // self.chunk_seconds))
+            if keep_from == 0:
+                return 0
+            dropped = self._chunks[:keep_from]
+            del self._chunks[:keep_from]
+            del self._chunk_keys[:keep_from]
+            del self._chunk_first_ids[:keep_from]
+            self._first_id = self._chunk_first_ids[0] if self._chunks else self._session_count
+
+            for code in {code for chunk in dropped for code in chunk.registrations}:
+                postings = self._postings[code]
+                # Postings ascend, so the dropped ids are a prefix
+                del postings[:bisect_left(postings, self._first_id)]
+                if not postings:
+                    del self._postings[code]
+            return sum(len(chunk) for chunk in dropped)
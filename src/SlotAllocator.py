@@ -0,0 +1,68 @@
+"""
+Slot Allocator - Free slot bookkeeping for a parking pool
+"""
+
+import heapq
+from itertools import compress
+
+
+class SlotAllocator:
+    # Tracks free slot indices for one pool (regular or EV)
+    # Min-heap of free indices always yields the lowest-numbered free slot in O(log n)
+    # and the occupancy counter answers capacity checks in O(1) - no slot list scans
+
+    def __init__(self, capacity=0):
+        self.reset(capacity)
+
+    def reset(self, capacity):
+        # Mark every slot free - a sorted range is already a valid heap
+        self.capacity = capacity
+        self.occupied_count = 0
+        self._free_heap = list(range(capacity))
+        self._free_flags = bytearray(b"\x01") * capacity
+
+    def restore(self, capacity, occupied_indexes):
+        # Rebuild from a known set of occupied slots - the free list comes out sorted, so it's a valid heap
+        self.capacity = capacity
+        self._free_flags = bytearray(b"\x01") * capacity
+        for index in occupied_indexes:
+            self._free_flags[index] = 0
+        self._free_heap = list(compress(range(capacity), self._free_flags))
+        self.occupied_count = capacity - len(self._free_heap)
+
+    @property
+    def free_count(self):
+        return self.capacity - self.occupied_count
+
+    def is_free(self, index):
+        # Check a single slot without touching the heap
+        return bool(self._free_flags[index])
+
+    def allocate(self):
+        # Claim the lowest free slot, -1 if the pool is full
+        while self._free_heap:
+            index = heapq.heappop(self._free_heap)
+            # Skip entries already claimed elsewhere (lazy deletion)
+            if self._free_flags[index]:
+                self._free_flags[index] = 0
+                self.occupied_count += 1
+                return index
+        return -1
+
+    def copy(self):
+        # Independent allocator with the same free/occupied state
+        clone = SlotAllocator.__new__(SlotAllocator)
+        clone.capacity = self.capacity
+        clone.occupied_count = self.occupied_count
+        clone._free_heap = self._free_heap.copy()
+        clone._free_flags = self._free_flags.copy()
+        return clone
+
+    def release(self, index):
+        # Return a slot to the free pool
+        if self._free_flags[index]:
+            return False
+        self._free_flags[index] = 1
+        self.occupied_count -= 1
+        heapq.heappush(self._free_heap, index)
+        return True
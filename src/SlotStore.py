@@ -0,0 +1,255 @@
+"""
+Slot Store Module - Storage layouts for a pool's parking slots
+
+ListSlotStore     - list of Vehicle objects (default)
+ColumnarSlotStore - parallel compact columns, bulk queries run as C-level passes
+MappedSlotStore   - fixed-width records in a memory-mapped file (see MappedSlotStore.py)
+SqliteSlotStore   - rows in an SQLite database (see SqliteSlotStore.py)
+
+Every layout is built as slot_store(capacity, pool) - pool is the slot type
+(REGULAR_SLOT or EV_SLOT) when a lot creates its pools, None for placeholders.
+ParkingLot takes a store class, or a SlotStorage backend for layouts whose
+pools share files or a database connection. Backends are called as
+storage(capacity, pool, level) and keep the level with the pools, so a lot
+opened from them again comes back on its floor.
+
+Store interface: len(), store[index] (Vehicle or EMPTY_SLOT), store[index] = vehicle,
+iteration, copy(), occupied_indexes(), occupied_count(), occupied_rows(),
+indexes_matching(attribute, value), vehicles_matching(attribute, value); stores
+with has_attribute_columns also occupied_registrations().
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from itertools import compress
+from Vehicle import ElectricVehicle, VehicleFactory
+from VehicleIndex import AttributeIndex
+
+
+# Constants
+EMPTY_SLOT = None
+
+# Vehicle type codes - bit flags
+TYPE_MOTORCYCLE = 1
+TYPE_ELECTRIC = 2
+
+# Attributes stored as interned code columns
+ATTRIBUTE_COLUMNS = ("color", "make", "model")
+
+
+def vehicle_type_code(vehicle):
+    # Encode a vehicle's class as type code bit flags
+    code = TYPE_MOTORCYCLE if vehicle.get_type() == "Motorcycle" else 0
+    if isinstance(vehicle, ElectricVehicle):
+        code |= TYPE_ELECTRIC
+    return code
+
+# Type code -> vehicle class, resolved once through the factory so the mapping can't drift from it
+VEHICLE_CLASSES = {
+    type_code: type(VehicleFactory.create_vehicle("", "", "", "", bool(type_code & TYPE_ELECTRIC),
+                                                  bool(type_code & TYPE_MOTORCYCLE)))
+    for type_code in range((TYPE_ELECTRIC | TYPE_MOTORCYCLE) + 1)
+}
+
+# Type code -> Vehicle.get_type() name, for rows built without a Vehicle
+VEHICLE_TYPE_NAMES = {type_code: vehicle_class("", "", "", "").get_type() for type_code, vehicle_class in VEHICLE_CLASSES.items()}
+
+def vehicle_row(slot_number, vehicle):
+    # Report row for one parked vehicle - the shape every store's occupied_rows() returns
+    # (slot number, type, registration, color, make, model, charge or None for non-EVs)
+    charge = vehicle.charge if isinstance(vehicle, ElectricVehicle) else None
+    return (slot_number, vehicle.get_type(), vehicle.regnum, vehicle.color, vehicle.make, vehicle.model, charge)
+
+
+class SlotStorage(ABC):
+    # Storage backend - builds a lot's slot stores and owns what they share
+    # Pass an instance as ParkingLot(slot_store=...)
+    has_attribute_columns = False
+
+    @abstractmethod
+    def __call__(self, capacity=0, pool=None, level=0):
+        # New empty store for pool on level - pool is None for placeholders, which must not touch shared state
+        # Stores opened again later report the level they were created with as store.level
+        pass
+
+    def commit(self):
+        # Make the writes since the last commit durable - ParkingLot calls it outside its locks,
+        # once per operation and once per batch
+        pass
+
+
+class ListSlotStore(list):
+    # Default layout - one Vehicle object (or EMPTY_SLOT) per slot
+    has_attribute_columns = False
+
+    def __init__(self, capacity=0, pool=None):
+        super().__init__([EMPTY_SLOT] * capacity)
+
+    def copy(self):
+        # Shallow copy - same Vehicle objects, independent slot list
+        clone = ListSlotStore()
+        clone.extend(self)
+        return clone
+
+    def occupied_indexes(self):
+        return [index for index, vehicle in enumerate(self) if vehicle is not EMPTY_SLOT]
+
+    def occupied_count(self):
+        return len(self) - self.count(EMPTY_SLOT)
+
+    def occupied_rows(self):
+        return [vehicle_row(index + 1, vehicle) for index, vehicle in enumerate(self) if vehicle is not EMPTY_SLOT]
+
+    def indexes_matching(self, attribute, value):
+        # Case-insensitive attribute scan
+        key = AttributeIndex.normalize(value)
+        return [
+            index for index, vehicle in enumerate(self)
+            if vehicle is not EMPTY_SLOT and AttributeIndex.normalize(getattr(vehicle, attribute)) == key
+        ]
+
+    def vehicles_matching(self, attribute, value):
+        # (slot index, Vehicle) pairs for a case-insensitive attribute search
+        return [(index, self[index]) for index in self.indexes_matching(attribute, value)]
+
+
+class StringInterner:
+    # Maps strings to small integer codes and back
+    # Code 0 is reserved for "no value" so empty slots never match a search
+
+    def __init__(self):
+        self._codes = {}
+        self._strings = [None]
+        # Case-folded key -> codes of every spelling seen ("Red", "RED", ...)
+        self._folded = {}
+
+    def intern(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._codes[value] = code
+            self._strings.append(value)
+            self._folded.setdefault(AttributeIndex.normalize(value), set()).add(code)
+        return code
+
+    def string(self, code):
+        return self._strings[code]
+
+    def copy(self):
+        clone = StringInterner()
+        clone._codes = self._codes.copy()
+        clone._strings = self._strings.copy()
+        clone._folded = {key: codes.copy() for key, codes in self._folded.items()}
+        return clone
+
+    def codes_matching(self, value):
+        # Codes equal to value ignoring case
+        return self._folded.get(AttributeIndex.normalize(value), frozenset())
+
+
+class ColumnarSlotStore:
+    # Columnar layout - one compact array per field instead of one object per slot
+    # Indexing returns a freshly built Vehicle, so bulk operations should use the
+    # column methods below; write changes back by assigning the vehicle to its slot
+    # Charge is kept as a whole percentage (0-100) in a byte column
+    has_attribute_columns = True
+
+    def __init__(self, capacity=0, pool=None):
+        self._capacity = capacity
+        self._interner = StringInterner()
+        self._occupied = bytearray(capacity)
+        self._type_codes = bytearray(capacity)
+        self._charges = bytearray(capacity)
+        self._registrations = [None] * capacity
+        self._columns = {attribute: array('I', [0]) * capacity for attribute in ATTRIBUTE_COLUMNS}
+
+    def __len__(self):
+        return self._capacity
+
+    def __getitem__(self, index):
+        if not self._occupied[index]:
+            return EMPTY_SLOT
+
+        type_code = self._type_codes[index]
+        vehicle = VehicleFactory.create_vehicle(
+            self._registrations[index],
+            self._interner.string(self._columns["make"][index]),
+            self._interner.string(self._columns["model"][index]),
+            self._interner.string(self._columns["color"][index]),
+            bool(type_code & TYPE_ELECTRIC),
+            bool(type_code & TYPE_MOTORCYCLE)
+        )
+        if type_code & TYPE_ELECTRIC:
+            vehicle.charge = self._charges[index]
+        return vehicle
+
+    def __setitem__(self, index, vehicle):
+        if vehicle is EMPTY_SLOT:
+            self._occupied[index] = 0
+            self._type_codes[index] = 0
+            self._charges[index] = 0
+            self._registrations[index] = None
+            for column in self._columns.values():
+                column[index] = 0
+            return
+
+        self._occupied[index] = 1
+        self._type_codes[index] = vehicle_type_code(vehicle)
+        self._charges[index] = round(vehicle.charge) if isinstance(vehicle, ElectricVehicle) else 0
+        self._registrations[index] = vehicle.regnum
+        for attribute, column in self._columns.items():
+            column[index] = self._interner.intern(getattr(vehicle, attribute))
+
+    def __iter__(self):
+        for index in range(self._capacity):
+            yield self[index]
+
+    def copy(self):
+        # Column-by-column copy - no Vehicle objects are built
+        clone = ColumnarSlotStore()
+        clone._capacity = self._capacity
+        clone._interner = self._interner.copy()
+        clone._occupied = self._occupied.copy()
+        clone._type_codes = self._type_codes.copy()
+        clone._charges = self._charges.copy()
+        clone._registrations = self._registrations.copy()
+        clone._columns = {attribute: array('I', column) for attribute, column in self._columns.items()}
+        return clone
+
+    # Column operations - compress/map keep the per-slot loop in C
+
+    def occupied_indexes(self):
+        return list(compress(range(self._capacity), self._occupied))
+
+    def occupied_count(self):
+        return self._occupied.count(1)
+
+    def occupied_registrations(self):
+        # (slot index, registration) pairs - no Vehicle objects built
+        return [(index, self._registrations[index]) for index in self.occupied_indexes()]
+
+    def occupied_rows(self):
+        string = self._interner.string
+        color, make, model = self._columns["color"], self._columns["make"], self._columns["model"]
+        return [
+            (index + 1, VEHICLE_TYPE_NAMES[self._type_codes[index]], self._registrations[index],
+             string(color[index]), string(make[index]), string(model[index]),
+             self._charges[index] if self._type_codes[index] & TYPE_ELECTRIC else None)
+            for index in self.occupied_indexes()
+        ]
+
+    def indexes_matching(self, attribute, value):
+        # Case-insensitive attribute scan over the interned code column
+        codes = self._interner.codes_matching(value)
+        if not codes:
+            return []
+        column = self._columns[attribute]
+        if len(codes) == 1:
+            matches = map(next(iter(codes)).__eq__, column)
+        else:
+            matches = map(codes.__contains__, column)
+        return list(compress(range(self._capacity), matches))
+
+    def vehicles_matching(self, attribute, value):
+        # (slot index, Vehicle) pairs for a case-insensitive attribute search
+        return [(index, self[index]) for index in self.indexes_matching(attribute, value)]
@@ -0,0 +1,286 @@
+"""
+SQLite Slot Store Module - Lot storage backend in an SQLite database
+
+Both pools of a lot live in one database, so current and past occupancy can be
+queried with ad-hoc SQL next to the running engine. The database runs in WAL
+mode, so readers in other processes (sqlite3 shell, reporting jobs) never
+block the gates. Statements are fixed SQL strings; sqlite3 compiles each once
+per connection and reuses the prepared statement from its cache. Writes
+collect in one transaction until ParkingLot commits, once per park/remove and
+once per park_vehicles()/remove_vehicles() batch.
+
+Tables:
+    pools     pool, capacity, level (the lot's floor, restored by open_sqlite_lot())
+    slots     one row per occupied slot - registration, type code, make/model/color
+              (+ case-folded keys for searches), charge, parked_at
+    sessions  one row per stay - registration, vehicle, pool, slot, parked_at, removed_at (NULL while parked)
+Indexes: slots by registration and by color; sessions by registration and open stay.
+
+Example - vehicles parked at a given time:
+    SELECT registration, pool, slot_index + 1 FROM sessions
+    WHERE parked_at <= :t AND (removed_at IS NULL OR removed_at > :t)
+"""
+
+import sqlite3
+import threading
+import time
+from ParkingLot import ParkingLot
+from SlotStore import (EMPTY_SLOT, TYPE_ELECTRIC, VEHICLE_CLASSES, VEHICLE_TYPE_NAMES, ListSlotStore, SlotStorage,
+                       vehicle_type_code)
+from Vehicle import ElectricVehicle
+from VehicleIndex import AttributeIndex, REGULAR_SLOT, EV_SLOT
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pools (
+    pool TEXT PRIMARY KEY,
+    capacity INTEGER NOT NULL,
+    level INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slots (
+    pool TEXT NOT NULL,
+    slot_index INTEGER NOT NULL,
+    registration TEXT NOT NULL,
+    type_code INTEGER NOT NULL,
+    make TEXT NOT NULL,
+    model TEXT NOT NULL,
+    color TEXT NOT NULL,
+    make_key TEXT NOT NULL,
+    model_key TEXT NOT NULL,
+    color_key TEXT NOT NULL,
+    charge REAL,
+    parked_at REAL NOT NULL,
+    PRIMARY KEY (pool, slot_index)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS slots_registration ON slots (registration);
+CREATE INDEX IF NOT EXISTS slots_color ON slots (color_key);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    pool TEXT NOT NULL,
+    slot_index INTEGER NOT NULL,
+    registration TEXT NOT NULL,
+    type_code INTEGER NOT NULL,
+    make TEXT NOT NULL,
+    model TEXT NOT NULL,
+    color TEXT NOT NULL,
+    parked_at REAL NOT NULL,
+    removed_at REAL
+);
+CREATE INDEX IF NOT EXISTS sessions_registration ON sessions (registration);
+CREATE INDEX IF NOT EXISTS sessions_open ON sessions (pool, slot_index) WHERE removed_at IS NULL;
+"""
+
+_SAVE_POOL = "INSERT OR REPLACE INTO pools (pool, capacity, level) VALUES (?, ?, ?)"
+_CLEAR_POOL = "DELETE FROM slots WHERE pool = ?"
+_CLOSE_POOL_SESSIONS = "UPDATE sessions SET removed_at = ? WHERE pool = ? AND removed_at IS NULL"
+_SELECT_POOLS = "SELECT pool, capacity, level FROM pools"
+
+_SELECT_SLOT = "SELECT type_code, registration, make, model, color, charge FROM slots WHERE pool = ? AND slot_index = ?"
+_SELECT_VEHICLES = ("SELECT slot_index, type_code, registration, make, model, color, charge FROM slots "
+                    "WHERE pool = ? ORDER BY slot_index")
+# Re-assigning a parked vehicle (e.g. to write back its charge) keeps its parked_at
+_SAVE_SLOT = """
+INSERT INTO slots (pool, slot_index, registration, type_code, make, model, color, make_key, model_key, color_key, charge, parked_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (pool, slot_index) DO UPDATE SET
+    registration = excluded.registration, type_code = excluded.type_code, make = excluded.make,
+    model = excluded.model, color = excluded.color, make_key = excluded.make_key,
+    model_key = excluded.model_key, color_key = excluded.color_key, charge = excluded.charge
+"""
+_DELETE_SLOT = "DELETE FROM slots WHERE pool = ? AND slot_index = ?"
+_OPEN_SESSION = """
+INSERT INTO sessions (pool, slot_index, registration, type_code, make, model, color, parked_at)
+SELECT ?, ?, ?, ?, ?, ?, ?, ?
+WHERE NOT EXISTS (SELECT 1 FROM sessions WHERE pool = ? AND slot_index = ? AND removed_at IS NULL)
+"""
+_CLOSE_SESSION = "UPDATE sessions SET removed_at = ? WHERE pool = ? AND slot_index = ? AND removed_at IS NULL"
+
+_OCCUPIED_INDEXES = "SELECT slot_index FROM slots WHERE pool = ? ORDER BY slot_index"
+_OCCUPIED_COUNT = "SELECT COUNT(*) FROM slots WHERE pool = ?"
+_OCCUPIED_REGISTRATIONS = "SELECT slot_index, registration FROM slots WHERE pool = ? ORDER BY slot_index"
+_OCCUPIED_ROWS = ("SELECT slot_index + 1, type_code, registration, color, make, model, charge FROM slots "
+                  "WHERE pool = ? ORDER BY slot_index")
+_MATCHING = {
+    attribute: f"SELECT slot_index FROM slots WHERE {attribute}_key = ? AND pool = ? ORDER BY slot_index"
+    for attribute in ("color", "make", "model")
+}
+_MATCHING_VEHICLES = {
+    attribute: ("SELECT slot_index, type_code, registration, make, model, color, charge FROM slots "
+                f"WHERE {attribute}_key = ? AND pool = ? ORDER BY slot_index")
+    for attribute in ("color", "make", "model")
+}
+
+
+def _charge(value):
+    # Whole-number charges come back as ints, as they were set
+    return int(value) if value.is_integer() else value
+
+def _vehicle(type_code, registration, make, model, color, charge):
+    vehicle = VEHICLE_CLASSES[type_code](registration, make, model, color)
+    if type_code & TYPE_ELECTRIC:
+        vehicle.charge = _charge(charge)
+    return vehicle
+
+
+class SqliteSlotStore:
+    # One pool's slots as rows of the slots table - same interface as ColumnarSlotStore
+    # Indexing returns a freshly built Vehicle; write changes (e.g. charge) back by assigning the vehicle to its slot
+    has_attribute_columns = True
+
+    def __init__(self, storage, pool, capacity, level=0):
+        self._storage = storage
+        self._pool = pool
+        self._capacity = capacity
+        self.level = level
+
+    def __len__(self):
+        return self._capacity
+
+    def _check(self, index):
+        if not 0 <= index < self._capacity:
+            raise IndexError("slot index out of range")
+
+    def __getitem__(self, index):
+        self._check(index)
+        rows = self._storage.query(_SELECT_SLOT, (self._pool, index))
+        return _vehicle(*rows[0]) if rows else EMPTY_SLOT
+
+    def __setitem__(self, index, vehicle):
+        self._check(index)
+        now = self._storage.clock()
+        if vehicle is EMPTY_SLOT:
+            self._storage.write([
+                (_CLOSE_SESSION, (now, self._pool, index)),
+                (_DELETE_SLOT, (self._pool, index)),
+            ])
+            return
+
+        normalize = AttributeIndex.normalize
+        type_code = vehicle_type_code(vehicle)
+        charge = vehicle.charge if isinstance(vehicle, ElectricVehicle) else None
+        make, model, color = vehicle.make, vehicle.model, vehicle.color
+        self._storage.write([
+            (_OPEN_SESSION, (self._pool, index, vehicle.regnum, type_code, make, model, color, now, self._pool, index)),
+            (_SAVE_SLOT, (self._pool, index, vehicle.regnum, type_code, make, model, color,
+                          normalize(make), normalize(model), normalize(color), charge, now)),
+        ])
+
+    def _vehicles(self):
+        # {slot index: Vehicle} for every occupied slot - one query
+        return {row[0]: _vehicle(*row[1:]) for row in self._storage.query(_SELECT_VEHICLES, (self._pool,))}
+
+    def __iter__(self):
+        vehicles = self._vehicles()
+        for index in range(self._capacity):
+            yield vehicles.get(index, EMPTY_SLOT)
+
+    def copy(self):
+        # In-memory copy for snapshots - readers of it never touch the database
+        clone = ListSlotStore(self._capacity)
+        for index, vehicle in self._vehicles().items():
+            clone[index] = vehicle
+        return clone
+
+    def occupied_indexes(self):
+        return [index for index, in self._storage.query(_OCCUPIED_INDEXES, (self._pool,))]
+
+    def occupied_count(self):
+        return self._storage.query(_OCCUPIED_COUNT, (self._pool,))[0][0]
+
+    def occupied_registrations(self):
+        return self._storage.query(_OCCUPIED_REGISTRATIONS, (self._pool,))
+
+    def occupied_rows(self):
+        return [
+            (slot_number, VEHICLE_TYPE_NAMES[type_code], registration, color, make, model,
+             _charge(charge) if type_code & TYPE_ELECTRIC else None)
+            for slot_number, type_code, registration, color, make, model, charge
+            in self._storage.query(_OCCUPIED_ROWS, (self._pool,))
+        ]
+
+    def indexes_matching(self, attribute, value):
+        # Case-insensitive search through the case-folded key column (color has an index)
+        query = _MATCHING[attribute]
+        return [index for index, in self._storage.query(query, (AttributeIndex.normalize(value), self._pool))]
+
+    def vehicles_matching(self, attribute, value):
+        # (slot index, Vehicle) pairs for the same search - one SELECT, not one per slot
+        query = _MATCHING_VEHICLES[attribute]
+        return [(row[0], _vehicle(*row[1:])) for row in self._storage.query(query, (AttributeIndex.normalize(value), self._pool))]
+
+
+class SqliteSlotStorage(SlotStorage):
+    # Storage backend - both pools of one lot in the database at path (":memory:" for a private in-memory one)
+    # One connection, shared by the pools; a lock keeps a commit from landing between the statements of one write
+    has_attribute_columns = True
+
+    def __init__(self, path, synchronous="NORMAL", clock=time.time):
+        # synchronous - NORMAL survives a process crash; FULL also survives power loss at an fsync per commit
+        # clock - time source for parked_at/removed_at
+        self.path = path
+        self.clock = clock
+        self._lock = threading.Lock()
+        # Transactions are managed here (isolation_level=None), not by sqlite3's implicit BEGIN
+        self.connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute(f"PRAGMA synchronous = {synchronous}")
+        self.connection.executescript(_SCHEMA)
+
+    def __call__(self, capacity=0, pool=None, level=0):
+        if pool is None:
+            # Placeholder pool of a lot that isn't created yet - the database is left alone
+            return ListSlotStore(capacity)
+        now = self.clock()
+        self.write([
+            (_CLOSE_POOL_SESSIONS, (now, pool)),
+            (_CLEAR_POOL, (pool,)),
+            (_SAVE_POOL, (pool, capacity, level)),
+        ])
+        return SqliteSlotStore(self, pool, capacity, level)
+
+    def write(self, statements):
+        # Run (sql, parameters) write statements in the open transaction, starting one if needed
+        with self._lock:
+            if not self.connection.in_transaction:
+                self.connection.execute("BEGIN")
+            for sql, parameters in statements:
+                self.connection.execute(sql, parameters)
+
+    def query(self, sql, parameters=()):
+        # Reads see this connection's uncommitted writes, so the lot always reads its own state
+        with self._lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def commit(self):
+        with self._lock:
+            if self.connection.in_transaction:
+                self.connection.execute("COMMIT")
+
+    def close(self):
+        self.commit()
+        self.connection.close()
+
+    def _pools(self):
+        # pool -> (capacity, level)
+        return {pool: (capacity, level) for pool, capacity, level in self.query(_SELECT_POOLS)}
+
+    def exists(self):
+        pools = self._pools()
+        return REGULAR_SLOT in pools and EV_SLOT in pools
+
+    def open_pools(self):
+        # (regular store, EV store) over the rows already in the database
+        pools = self._pools()
+        return SqliteSlotStore(self, REGULAR_SLOT, *pools[REGULAR_SLOT]), SqliteSlotStore(self, EV_SLOT, *pools[EV_SLOT])
+
+
+def open_sqlite_lot(path, level=None, thread_safe=False, synchronous="NORMAL"):
+    # ParkingLot stored in the database at path - serves the vehicles already there if the
+    # lot was created before, otherwise create_parking_lot() creates it
+    # The lot comes back on the level stored with its pools unless level overrides it
+    storage = SqliteSlotStorage(path, synchronous)
+    lot = ParkingLot(storage, thread_safe=thread_safe)
+    if storage.exists():
+        regular_slots, ev_slots = storage.open_pools()
+        lot.attach_slots(regular_slots, ev_slots, regular_slots.level if level is None else level)
+    return lot
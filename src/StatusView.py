@@ -0,0 +1,209 @@
+"""
+Status View Module - Lot status and charge reports for the Tk front end
+
+Report builders produce a whole report in one string (or one list of colored
+segments) so the console gets a single insert per report.
+The virtualized table only formats and draws rows inside the viewport, so
+opening the status of a 5,000-bay lot costs the same as a 50-bay one.
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+
+
+# Status table layout - shared with GUIObserver's inline text report
+STATUS_HEADING = f"{'Slot':<6}{'Floor':<8}{'Reg No.':<15}{'Color':<12}{'Make':<12}{'Model'}"
+CHARGE_HEADING = f"{'Slot':<6}{'Floor':<8}{'Reg No.':<15}{'Charge %'}"
+
+# Report fragments - built once at import instead of on every report
+_STATUS_RULE = "=" * 70
+_CHARGE_RULE = "=" * 60
+_REGULAR_SECTION = f"\n{_STATUS_RULE}\nREGULAR VEHICLES\n{_STATUS_RULE}\n{STATUS_HEADING}\n{'-' * 70}\n"
+_EV_SECTION = f"\n{_STATUS_RULE}\nELECTRIC VEHICLES\n{_STATUS_RULE}\n{STATUS_HEADING}\n{'-' * 70}\n"
+_STATUS_FOOTER = f"{_STATUS_RULE}\n\n"
+_CHARGE_SECTION = f"\n{_CHARGE_RULE}\nEV CHARGE LEVELS\n{_CHARGE_RULE}\n{CHARGE_HEADING}\n{'-' * 60}\n"
+_CHARGE_FOOTER = f"{_CHARGE_RULE}\n\n"
+_NO_REGULAR_TEXT = "  (No vehicles parked)"
+_NO_EV_TEXT = "  (No electric vehicles parked)"
+_NO_REGULAR = _NO_REGULAR_TEXT + "\n"
+_NO_EV = _NO_EV_TEXT + "\n"
+
+def format_status_row(slot_num, level, vehicle):
+    return f"{slot_num:<6}{level:<8}{vehicle.regnum:<15}{vehicle.color:<12}{vehicle.make:<12}{vehicle.model}"
+
+def charge_color(charge):
+    # Color code by charge level
+    if charge < 20:
+        return "red"
+    if charge < 50:
+        return "orange"
+    return "green"
+
+def build_status_report(regular_vehicles, ev_vehicles, level):
+    # Whole lot status report as a single string
+    parts = [_REGULAR_SECTION]
+    if regular_vehicles:
+        parts.extend(format_status_row(slot_num, level, vehicle) + "\n" for slot_num, vehicle in regular_vehicles)
+    else:
+        parts.append(_NO_REGULAR)
+
+    parts.append(_EV_SECTION)
+    if ev_vehicles:
+        parts.extend(format_status_row(slot_num, level, vehicle) + "\n" for slot_num, vehicle in ev_vehicles)
+    else:
+        parts.append(_NO_EV)
+
+    parts.append(_STATUS_FOOTER)
+    return "".join(parts)
+
+def build_charge_report(ev_vehicles, level):
+    # EV charge report as [(text, color or None), ...] - consecutive rows of one color share a segment
+    segments = [(_CHARGE_SECTION, None)]
+    if not ev_vehicles:
+        segments.append((_NO_EV, None))
+
+    rows = []
+    row_color = None
+    for slot_num, vehicle in ev_vehicles:
+        charge = vehicle.charge if hasattr(vehicle, 'charge') else 0
+        color = charge_color(charge)
+        if color != row_color and rows:
+            segments.append(("".join(rows), row_color))
+            rows = []
+        row_color = color
+        rows.append(f"{slot_num:<6}{level:<8}{vehicle.regnum:<15}{charge}%\n")
+    if rows:
+        segments.append(("".join(rows), row_color))
+
+    segments.append((_CHARGE_FOOTER, None))
+    return segments
+
+
+class LotStatusRows:
+    # Lazy row source over get_all_regular_vehicles()/get_all_ev_vehicles() results
+    # Indexing yields (text, tag) and formats only the requested row
+
+    def __init__(self, regular_vehicles, ev_vehicles, level):
+        self.level = level
+        self._sections = [
+            ("REGULAR VEHICLES", regular_vehicles, _NO_REGULAR_TEXT),
+            ("ELECTRIC VEHICLES", ev_vehicles, _NO_EV_TEXT),
+        ]
+
+    def __len__(self):
+        # One title row per section plus its vehicles (or the "none parked" row)
+        return sum(1 + max(len(vehicles), 1) for _, vehicles, _ in self._sections)
+
+    def __getitem__(self, index):
+        for title, vehicles, empty_text in self._sections:
+            if index == 0:
+                return f"{title} ({len(vehicles)})", "title"
+            index -= 1
+
+            body_rows = max(len(vehicles), 1)
+            if index < body_rows:
+                if not vehicles:
+                    return empty_text, None
+                slot_num, vehicle = vehicles[index]
+                return format_status_row(slot_num, self.level, vehicle), None
+            index -= body_rows
+        raise IndexError("status row out of range")
+
+
+class VirtualTableView(tk.Frame):
+    # Canvas table holding one text item per visible row
+    # Scrolling rebinds the same items to different rows instead of creating new ones
+
+    WHEEL_ROWS = 3
+
+    def __init__(self, master, heading, font='Courier 10', tag_colors=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self._font = tkfont.Font(root=self, font=font)
+        self._row_height = self._font.metrics("linespace") + 2
+        self._tag_colors = tag_colors or {}
+        self._rows = []
+        self._first_row = 0
+        self._items = []
+
+        tk.Label(self, text=heading, font=font, anchor='w').grid(row=0, column=0, sticky='ew', padx=4)
+        self.canvas = tk.Canvas(self, background='white', highlightthickness=0)
+        self.canvas.grid(row=1, column=0, sticky='nsew')
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.grid(row=1, column=1, sticky='ns')
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", lambda event: self._render())
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", self._on_mousewheel)
+        self.canvas.bind("<Button-5>", self._on_mousewheel)
+
+    def set_rows(self, rows):
+        # rows - sized sequence of (text, tag); rows are read on demand only
+        self._rows = rows
+        self._first_row = 0
+        self._render()
+
+    def yview(self, *args):
+        # Scrollbar protocol - ("moveto", fraction) or ("scroll", count, "units"|"pages")
+        if args[0] == tk.MOVETO:
+            first_row = int(float(args[1]) * len(self._rows))
+        else:
+            step = int(args[1])
+            if args[2] == tk.PAGES:
+                step *= max(1, self._visible_rows() - 1)
+            first_row = self._first_row + step
+        self._scroll_to(first_row)
+
+    def _on_mousewheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self._scroll_to(self._first_row - self.WHEEL_ROWS)
+        else:
+            self._scroll_to(self._first_row + self.WHEEL_ROWS)
+
+    def _visible_rows(self):
+        # Rows that fit the canvas, counting a partially visible last row
+        return max(1, self.canvas.winfo_height() // self._row_height + 1)
+
+    def _scroll_to(self, first_row):
+        last_first_row = max(0, len(self._rows) - self._visible_rows() + 1)
+        self._first_row = min(max(0, first_row), last_first_row)
+        self._render()
+
+    def _render(self):
+        visible = self._visible_rows()
+
+        # Grow the item pool to the viewport size - it never exceeds the visible row count
+        while len(self._items) < visible:
+            y = len(self._items) * self._row_height
+            self._items.append(self.canvas.create_text(4, y, anchor='nw', font=self._font, text=""))
+
+        total = len(self._rows)
+        for offset, item in enumerate(self._items):
+            row_index = self._first_row + offset
+            if offset < visible and row_index < total:
+                text, tag = self._rows[row_index]
+                self.canvas.itemconfigure(item, text=text, fill=self._tag_colors.get(tag, 'black'))
+            else:
+                self.canvas.itemconfigure(item, text="")
+
+        if total:
+            self.scrollbar.set(self._first_row / total, min(1.0, (self._first_row + visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+class LotStatusWindow(tk.Toplevel):
+    # Separate window hosting the virtualized lot status table
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("EasyParkPlus - Lot Status")
+        self.geometry("640x480")
+        self.table = VirtualTableView(self, STATUS_HEADING, tag_colors={"title": "navy"})
+        self.table.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    def show(self, rows):
+        self.table.set_rows(rows)
+        self.deiconify()
+        self.lift()
@@ -7,6 +7,9 @@ from abc import ABC, abstractmethod
 
 class Vehicle(ABC):
     # Base class for all vehicles
+    # __slots__ throughout the hierarchy - no per-instance __dict__, so large
+    # numbers of current and historical vehicle records stay compact
+    __slots__ = ("_registration_number", "_make", "_model", "_color")
     
     def __init__(self, registration_number, make, model, color):
         # Initialize vehicle with basic attributes
@@ -43,6 +46,7 @@ class Vehicle(ABC):
 
 class Car(Vehicle):
     # Standard car - properly inherits from Vehicle
+    __slots__ = ()
     
     def __init__(self, registration_number, make, model, color):
         super().__init__(registration_number, make, model, color)
@@ -52,6 +56,7 @@ class Car(Vehicle):
 
 class Motorcycle(Vehicle):
     # Motorcycle - properly inherits from Vehicle
+    __slots__ = ()
     
     def __init__(self, registration_number, make, model, color):
         super().__init__(registration_number, make, model, color)
@@ -61,6 +66,7 @@ class Motorcycle(Vehicle):
 
 class ElectricVehicle(Vehicle):
     # Electric vehicle base class
+    __slots__ = ("_charge",)
     
     def __init__(self, registration_number, make, model, color, charge=0):
         super().__init__(registration_number, make, model, color)
@@ -77,6 +83,7 @@ class ElectricVehicle(Vehicle):
 
 class ElectricCar(ElectricVehicle):
     # Electric car 
+    __slots__ = ()
     
     def __init__(self, registration_number, make, model, color):
         super().__init__(registration_number, make, model, color)  
@@ -86,6 +93,7 @@ class ElectricCar(ElectricVehicle):
 
 class ElectricMotorcycle(ElectricVehicle):
     # Electric motorcycle
+    __slots__ = ()
     
     def __init__(self, registration_number, make, model, color):
         super().__init__(registration_number, make, model, color)
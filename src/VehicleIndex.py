@@ -0,0 +1,109 @@
+"""
+Vehicle Index Module - Lookup structures over parked vehicles
+"""
+
+from itertools import repeat
+from operator import itemgetter
+
+
+# Slot type labels - match the "type" field returned by ParkingLot lookups
+REGULAR_SLOT = "regular"
+EV_SLOT = "EV"
+
+
+class RegistrationIndex:
+    # Hash index of registration number -> (slot type, slot index)
+    # Gives O(1) lookups and duplicate detection instead of scanning every slot
+
+    def __init__(self):
+        self._locations = {}
+
+    def __len__(self):
+        return len(self._locations)
+
+    def __contains__(self, registration):
+        return registration in self._locations
+
+    def add(self, registration, slot_type, slot_index):
+        self._locations[registration] = (slot_type, slot_index)
+
+    def add_many(self, slot_type, located_vehicles):
+        # Bulk load of (slot index, vehicle) pairs from one pool
+        self._locations.update((vehicle.regnum, (slot_type, slot_index)) for slot_index, vehicle in located_vehicles)
+
+    def add_registrations(self, slot_type, located_registrations):
+        # Bulk load of (slot index, registration) pairs - for stores that can list them without building vehicles
+        # zip/map keep the loop in C - this runs for every parked vehicle on a warm restart
+        locations = zip(repeat(slot_type), map(itemgetter(0), located_registrations))
+        self._locations.update(zip(map(itemgetter(1), located_registrations), locations))
+
+    def remove(self, registration):
+        self._locations.pop(registration, None)
+
+    def lookup(self, registration):
+        # (slot type, slot index) or None if not parked
+        return self._locations.get(registration)
+
+    def clear(self):
+        self._locations.clear()
+
+    def copy(self):
+        clone = RegistrationIndex()
+        clone._locations = self._locations.copy()
+        return clone
+
+
+class AttributeIndex:
+    # Secondary index of case-folded attribute value -> {(slot type, slot index)}
+    # Queries cost time proportional to the number of matches, not the lot size
+
+    def __init__(self, attribute):
+        self.attribute = attribute
+        self._postings = {}
+
+    @staticmethod
+    def normalize(value):
+        # Case-folded key so "Red", "RED" and "red" share a posting set
+        return str(value).casefold()
+
+    def add(self, vehicle, slot_type, slot_index):
+        key = self.normalize(getattr(vehicle, self.attribute))
+        self._postings.setdefault(key, set()).add((slot_type, slot_index))
+
+    def add_many(self, slot_type, located_vehicles):
+        # Bulk load of (slot index, vehicle) pairs from one pool
+        # Attribute values repeat heavily, so each distinct value is normalized once
+        keys = {}
+        postings = self._postings
+        attribute = self.attribute
+        for slot_index, vehicle in located_vehicles:
+            value = getattr(vehicle, attribute)
+            key = keys.get(value)
+            if key is None:
+                key = keys[value] = self.normalize(value)
+            entries = postings.get(key)
+            if entries is None:
+                entries = postings[key] = set()
+            entries.add((slot_type, slot_index))
+
+    def remove(self, vehicle, slot_type, slot_index):
+        key = self.normalize(getattr(vehicle, self.attribute))
+        postings = self._postings.get(key)
+        if postings is None:
+            return
+        postings.discard((slot_type, slot_index))
+        # Drop empty posting sets so the index doesn't grow with every value ever seen
+        if not postings:
+            del self._postings[key]
+
+    def lookup(self, value):
+        # Posting set for a value - callers must not mutate it
+        return self._postings.get(self.normalize(value), frozenset())
+
+    def clear(self):
+        self._postings.clear()
+
+    def copy(self):
+        clone = AttributeIndex(self.attribute)
+        clone._postings = {key: postings.copy() for key, postings in self._postings.items()}
+        return clone
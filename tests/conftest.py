@@ -0,0 +1,5 @@
+# Modules under src/ import each other by flat name (from ParkingLot import ParkingLot)
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from AsyncParkingLot import AsyncParkingLot
+from ParkingQuery import AttributeEquals
+
+
+def test_callers_read_their_own_writes():
+    async def scenario():
+        async with AsyncParkingLot() as lot:
+            await lot.create_parking_lot(3, 1, 1)
+            slot_number = await lot.park_vehicle("A", "Toyota", "Corolla", "Red", False, False)
+            assert await lot.find_slot_by_registration("A") == {"slot_number": slot_number, "type": "regular", "found": True}
+            await lot.remove_vehicle(slot_number, False)
+            assert await lot.find_slot_by_registration("A") == {"found": False}
+
+    asyncio.run(scenario())
+
+
+def test_snapshot_is_rebuilt_after_a_change_and_never_mutated():
+    async def scenario():
+        async with AsyncParkingLot() as lot:
+            await lot.create_parking_lot(3, 0, 1)
+            await lot.park_vehicle("A", "Toyota", "Corolla", "Red", False, False)
+            before = lot.snapshot
+            assert lot.snapshot is before
+            red = await lot.query(AttributeEquals("color", "Red"))
+
+            await lot.park_vehicle("B", "Honda", "Civic", "Red", False, False)
+            assert lot.snapshot is not before
+            assert [vehicle.regnum for _, vehicle in before.get_all_regular_vehicles()] == ["A"]
+            assert [vehicle.regnum for _, vehicle in red["regular"]] == ["A"]
+            assert len(lot.snapshot.get_all_regular_vehicles()) == 2
+
+    asyncio.run(scenario())
+
+
+class BrokenCollector:
+    # Stands in for the writer's event buffer - reading it fails, taking the writer task down
+    @property
+    def events(self):
+        raise OSError("collector failed")
+
+
+def test_callers_fail_instead_of_hanging_once_the_writer_dies():
+    async def scenario():
+        lot = AsyncParkingLot(max_pending=2)
+        await lot.create_parking_lot(10, 0, 1)
+        lot._collector = BrokenCollector()
+        parks = [lot.park_vehicle(f"R{n}", "Toyota", "Corolla", "Red", False, False) for n in range(5)]
+        results = await asyncio.wait_for(asyncio.gather(*parks, return_exceptions=True), 5)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert isinstance(results[0].__cause__, OSError)
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(lot.remove_vehicle(1, False), 5)
+        await asyncio.wait_for(lot.close(), 5)
+
+    asyncio.run(scenario())
@@ -0,0 +1,52 @@
+from ParkingLot import ParkingEventType, ParkingLot, ParkingObserver
+
+
+class Recorder(ParkingObserver):
+    def __init__(self):
+        self.events = []
+
+    def update(self, event_type, message):
+        self.events.append((event_type, message))
+
+
+def car(registration, is_electric=False):
+    return (registration, "Toyota", "Corolla", "Red", is_electric, False)
+
+
+def test_batch_park_reports_each_item_in_order():
+    lot = ParkingLot()
+    lot.create_parking_lot(2, 1, 1)
+    recorder = Recorder()
+    lot.attach_observer(recorder)
+    results = lot.park_vehicles([car("A"), car("A"), car("E", True), car("B"), car("C"), car("F", True)])
+    assert [(result["parked"], result["slot_number"]) for result in results] == \
+        [(True, 1), (False, -1), (True, 1), (True, 2), (False, -1), (False, -1)]
+    assert results[1]["message"] == "Vehicle A is already parked in regular slot 1"
+    assert results[4]["message"] == "Sorry, regular parking lot is full"
+    # One aggregated event instead of one per vehicle
+    assert recorder.events == [(ParkingEventType.BATCH_PROCESSED, "Batch park: 3 parked, 3 failed")]
+
+
+def test_batch_remove_reports_each_item_in_order():
+    lot = ParkingLot()
+    lot.create_parking_lot(3, 1, 1)
+    lot.park_vehicles([car("A"), car("B"), car("E", True)])
+    recorder = Recorder()
+    lot.attach_observer(recorder)
+    results = lot.remove_vehicles([(1, False), (1, False), (1, True), (9, False)])
+    assert [result["removed"] for result in results] == [True, False, True, False]
+    assert recorder.events == [(ParkingEventType.BATCH_PROCESSED, "Batch remove: 2 removed, 2 failed")]
+    assert lot.find_slot_by_registration("B")["slot_number"] == 2
+    # Freed slots are reused lowest first
+    assert [result["slot_number"] for result in lot.park_vehicles([car("C"), car("D")])] == [1, 3]
+
+
+def test_batch_matches_one_call_per_vehicle():
+    batch = [car(f"R{number % 7}", number % 3 == 0) for number in range(20)]
+    single, batched = ParkingLot(), ParkingLot()
+    for lot in (single, batched):
+        lot.create_parking_lot(4, 2, 1)
+    expected = [single.park_vehicle(*item) for item in batch]
+    assert [result["slot_number"] for result in batched.park_vehicles(batch)] == expected
+    assert batched.get_regular_rows() == single.get_regular_rows()
+    assert batched.get_ev_rows() == single.get_ev_rows()
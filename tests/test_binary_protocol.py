@@ -0,0 +1,126 @@
+import socket
+import struct
+import threading
+
+import pytest
+
+from BinaryProtocol import (BUFFER_SIZE, MAX_BATCH, OP_BATCH, OP_ERROR, OP_FIND, OP_PARK, BinaryParkingClient,
+                            BinaryParkingServer, ProtocolError, _read_str)
+from ParkingLot import ParkingLot
+
+
+@pytest.fixture
+def lot():
+    lot = ParkingLot(thread_safe=True)
+    lot.create_parking_lot(3, 1, 1)
+    return lot
+
+
+@pytest.fixture
+def address(lot):
+    server = BinaryParkingServer(("127.0.0.1", 0), lot)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(address):
+    client = BinaryParkingClient(address)
+    client.sock.settimeout(5)
+    yield client
+    client.close()
+
+
+def frame(opcode, request_id, body=b""):
+    payload = struct.pack("!BI", opcode, request_id) + body
+    return struct.pack("!I", len(payload)) + payload
+
+
+def text(value):
+    encoded = value.encode("utf-8")
+    return bytes([len(encoded)]) + encoded
+
+
+def read_frame(sock):
+    def exactly(size):
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("closed")
+            data += chunk
+        return data
+    length, = struct.unpack("!I", exactly(4))
+    payload = exactly(length)
+    opcode, request_id = struct.unpack_from("!BI", payload)
+    return opcode, request_id, payload[5:]
+
+
+def test_single_requests_round_trip(client):
+    assert client.park("A", "Toyota", "Corolla", "Red") == 1
+    assert client.park("E", "Tesla", "Model 3", "White", is_electric=True) == 1
+    assert client.park("A", "Toyota", "Corolla", "Red") == -1
+    assert client.find("E") == {"slot_number": 1, "type": "EV", "found": True}
+    assert client.remove(1) is True
+    assert client.remove(1) is False
+    assert client.find("A") == {"found": False}
+
+
+def test_pipeline_and_batch_answer_in_request_order(client):
+    assert client.pipeline([("park", "A", "m", "x", "Red", False, False), ("park", "B", "m", "x", "Red", False, False),
+                            ("find", "B")]) == [1, 2, {"slot_number": 2, "type": "regular", "found": True}]
+    assert client.batch([("remove", 1, False), ("park", "C", "m", "x", "Blue", False, False),
+                         ("park", "D", "m", "x", "Blue", False, False), ("find", "D")]) == [
+        True, 1, 3, {"slot_number": 3, "type": "regular", "found": True}]
+
+
+def test_string_reads_stop_at_the_frame_end():
+    data = bytearray(b"\x05ab") + b"cdefgh"
+    with pytest.raises(ProtocolError):
+        _read_str(data, 0, 3)
+    assert _read_str(data, 0, 6) == ("abcde", 6)
+
+
+def test_truncated_request_gets_an_error_and_the_next_frame_is_served(address):
+    with socket.create_connection(address, timeout=5) as sock:
+        # The registration claims 40 bytes but the frame ends after 2 - the next frame must not be read as its rest
+        truncated = frame(OP_PARK, 7, b"\x00" + b"\x28AB")
+        sock.sendall(truncated + frame(OP_FIND, 8, text("AB")))
+        opcode, request_id, _ = read_frame(sock)
+        assert (opcode, request_id) == (OP_ERROR, 7)
+        opcode, request_id, body = read_frame(sock)
+        assert (opcode, request_id, body[0]) == (OP_FIND, 8, 0)
+
+
+def test_oversized_frame_is_refused_and_the_connection_dropped(address):
+    with socket.create_connection(address, timeout=5) as sock:
+        sock.sendall(struct.pack("!I", BUFFER_SIZE))
+        opcode, request_id, body = read_frame(sock)
+        assert (opcode, request_id) == (OP_ERROR, 0)
+        assert b"exceeds" in body
+        assert sock.recv(1) == b""
+
+
+def test_batches_over_the_limit_are_refused(client, address, lot):
+    with pytest.raises(ValueError):
+        client.batch([("find", "A")] * (MAX_BATCH + 1))
+    with socket.create_connection(address, timeout=5) as sock:
+        body = struct.pack("!H", MAX_BATCH + 1) + (bytes([OP_FIND]) + text("A")) * (MAX_BATCH + 1)
+        sock.sendall(frame(OP_BATCH, 9, body))
+        opcode, request_id, _ = read_frame(sock)
+        assert (opcode, request_id) == (OP_ERROR, 9)
+    assert lot.get_all_regular_vehicles() == []
+
+
+def test_engine_errors_answer_an_error_frame(client, lot):
+    def broken(*arguments):
+        raise RuntimeError("disk full")
+
+    lot.park_vehicle = broken
+    with pytest.raises(ProtocolError, match="disk full"):
+        client.park("A", "Toyota", "Corolla", "Red")
+    # The connection is still usable
+    assert client.find("A") == {"found": False}
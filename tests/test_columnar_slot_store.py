@@ -0,0 +1,55 @@
+from ParkingLot import ParkingLot
+from SlotStore import EMPTY_SLOT, ColumnarSlotStore
+from Vehicle import VehicleFactory
+
+
+def electric(registration, charge, color="Red"):
+    vehicle = VehicleFactory.create_vehicle(registration, "Tesla", "Model 3", color, True, False)
+    vehicle.charge = charge
+    return vehicle
+
+
+def test_charge_is_kept_as_a_rounded_percentage():
+    store = ColumnarSlotStore(5)
+    for index, charge in enumerate((12.4, 12.6, 99.8, 0.3, 150)):
+        store[index] = electric(f"E{index}", charge)
+    assert [store[index].charge for index in range(5)] == [12, 13, 100, 0, 100]
+    assert [row[-1] for row in store.occupied_rows()] == [12, 13, 100, 0, 100]
+
+
+def test_slots_round_trip_vehicles_and_clear():
+    store = ColumnarSlotStore(3)
+    store[0] = VehicleFactory.create_vehicle("M", "Honda", "CB500", "Black", False, True)
+    store[2] = electric("E", 55)
+    vehicle = store[0]
+    assert (vehicle.regnum, vehicle.make, vehicle.model, vehicle.color, vehicle.get_type()) == \
+        ("M", "Honda", "CB500", "Black", "Motorcycle")
+    assert store[1] is EMPTY_SLOT
+    assert store.occupied_rows() == [(1, "Motorcycle", "M", "Black", "Honda", "CB500", None),
+                                     (3, "Car", "E", "Red", "Tesla", "Model 3", 55)]
+    store[0] = EMPTY_SLOT
+    assert store.occupied_indexes() == [2]
+    assert store.indexes_matching("color", "black") == []
+
+
+def test_copy_is_independent():
+    store = ColumnarSlotStore(2)
+    store[0] = electric("A", 10)
+    clone = store.copy()
+    store[0] = EMPTY_SLOT
+    store[1] = electric("B", 20, color="Blue")
+    assert clone.occupied_registrations() == [(0, "A")]
+    assert clone.indexes_matching("color", "blue") == []
+
+
+def test_lot_searches_scan_the_code_columns_ignoring_case():
+    lot = ParkingLot(ColumnarSlotStore)
+    lot.create_parking_lot(3, 1, 1)
+    assert lot.attribute_indexes == {}
+    lot.park_vehicle("A", "Toyota", "Corolla", "Red", False, False)
+    lot.park_vehicle("B", "Toyota", "Corolla", "RED", False, False)
+    lot.park_vehicle("C", "Honda", "Civic", "Blue", False, False)
+    lot.park_vehicle("E", "Tesla", "Model 3", "red", True, False)
+    matches = lot.find_vehicles_by_color("rEd")
+    assert [(slot_number, vehicle.regnum) for slot_number, vehicle in matches["regular"]] == [(1, "A"), (2, "B")]
+    assert [(slot_number, vehicle.regnum) for slot_number, vehicle in matches["ev"]] == [(1, "E")]
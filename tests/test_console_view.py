@@ -0,0 +1,48 @@
+import pytest
+
+tk = pytest.importorskip("tkinter")
+
+from ConsoleView import ConsoleText
+
+
+@pytest.fixture
+def console():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("Tk needs a display")
+    console = ConsoleText(root, max_lines=20, trim_chunk=5, height=10)
+    console.pack()
+    for n in range(100):
+        console.insert(tk.END, f"line {n}\n")
+    root.update()
+    yield console
+    root.destroy()
+
+
+def first_line(console):
+    return console.get("1.0", "1.end")
+
+
+def test_trims_to_the_newest_lines(console):
+    assert first_line(console) == "line 78"
+
+
+def test_loaded_history_survives_new_output(console):
+    # Scrolled to the top, as the scroll handler requires before paging in
+    console.yview_moveto(0.0)
+    console.update()
+    assert console.load_older() == 5
+    assert first_line(console) == "line 73"
+
+    console.insert(tk.END, "line 100\n")
+    console.scroll_to_end()
+    assert first_line(console) == "line 73"
+
+    # Back at the bottom, trimming resumes
+    console.see(tk.END)
+    console.update()
+    for n in range(101, 110):
+        console.insert(tk.END, f"line {n}\n")
+    assert first_line(console) != "line 73"
+    assert console.get("end-2l", "end-1c") == "line 109\n"
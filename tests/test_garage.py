@@ -0,0 +1,52 @@
+from Garage import Garage, LeastOccupiedPolicy, LowestLevelPolicy
+from VehicleIndex import EV_SLOT, REGULAR_SLOT
+
+
+def park(garage, registration, color="Red", is_electric=False):
+    return garage.park_vehicle(registration, "Toyota", "Corolla", color, is_electric, False)
+
+
+def levels_of(results):
+    return [result.get("level") for result in results]
+
+
+def test_lowest_level_policy_fills_floors_bottom_up():
+    garage = Garage(LowestLevelPolicy())
+    garage.add_level(2, 2, 1)
+    garage.add_level(1, 1, 1)
+    assert levels_of(park(garage, f"R{number}") for number in range(4)) == [1, 2, 2, None]
+    assert levels_of(park(garage, f"E{number}", is_electric=True) for number in range(3)) == [1, 2, None]
+    # A freed slot downstairs is used first again
+    assert garage.remove_vehicle(1, 1, False)
+    assert park(garage, "R9") == {"parked": True, "level": 1, "slot_number": 1, "type": REGULAR_SLOT}
+
+
+def test_least_occupied_policy_spreads_vehicles():
+    garage = Garage(LeastOccupiedPolicy())
+    garage.add_level(1, 2, 1)
+    garage.add_level(2, 3, 0)
+    # Most free slots wins, lowest level on ties
+    assert levels_of(park(garage, f"R{number}") for number in range(6)) == [2, 1, 2, 1, 2, None]
+    assert park(garage, "E", is_electric=True) == {"parked": True, "level": 1, "slot_number": 1, "type": EV_SLOT}
+    assert park(garage, "E2", is_electric=True) == {"parked": False}
+
+
+def test_garage_indexes_follow_parks_and_removes():
+    garage = Garage()
+    garage.add_level(1, 1, 0)
+    garage.add_level(2, 2, 0)
+    park(garage, "A", color="Red")
+    park(garage, "B", color="RED")
+    park(garage, "C", color="Blue")
+    assert park(garage, "A") == {"parked": False}
+    assert garage.find_slot_by_registration("B") == {"slot_number": 1, "type": REGULAR_SLOT, "found": True, "level": 2}
+    assert sorted(garage.find_vehicles_by_color("red")) == [1, 2]
+
+    assert garage.remove_vehicle(1, 1, False)
+    assert not garage.remove_vehicle(3, 1, False)
+    assert garage.find_slot_by_registration("A") == {"found": False}
+    assert sorted(garage.find_vehicles_by_color("red")) == [2]
+    # Re-creating a floor drops its vehicles from the garage indexes
+    garage.add_level(2, 2, 0)
+    assert garage.find_vehicles_by_color("red") == {}
+    assert garage.registration_levels == {}
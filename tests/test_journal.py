@@ -0,0 +1,107 @@
+import os
+
+from ParkingJournal import ParkingJournal, recover_lot
+from ParkingLot import ParkingLot
+
+
+def park(lot, registration, is_electric=False):
+    return lot.park_vehicle(registration, "Toyota", "Corolla", "Red", is_electric, False)
+
+
+def vehicles(lot):
+    return ([(slot_number, vehicle.regnum) for slot_number, vehicle in lot.get_all_regular_vehicles()],
+            [(slot_number, vehicle.regnum) for slot_number, vehicle in lot.get_all_ev_vehicles()])
+
+
+def test_recover_replays_creates_parks_and_removes(tmp_path):
+    lot, journal = recover_lot(str(tmp_path), fsync=False)
+    lot.create_parking_lot(3, 2, 4)
+    park(lot, "A")
+    park(lot, "B")
+    park(lot, "E", is_electric=True)
+    lot.remove_vehicle(1, False)
+    journal.close()
+
+    recovered, journal = recover_lot(str(tmp_path), fsync=False)
+    journal.close()
+    assert recovered.is_initialized
+    assert (recovered.level, recovered.regular_capacity, recovered.ev_capacity) == (4, 3, 2)
+    assert vehicles(recovered) == ([(2, "B")], [(1, "E")])
+    assert recovered.find_slot_by_registration("A") == {"found": False}
+
+
+def test_recover_continues_after_checkpoint(tmp_path):
+    lot, journal = recover_lot(str(tmp_path), fsync=False)
+    lot.create_parking_lot(3, 0, 1)
+    park(lot, "A")
+    journal.checkpoint(lot)
+    park(lot, "B")
+    journal.close()
+
+    recovered, journal = recover_lot(str(tmp_path), fsync=False)
+    journal.close()
+    assert vehicles(recovered) == ([(1, "A"), (2, "B")], [])
+
+
+def test_checkpoint_copies_the_lot_once(tmp_path, monkeypatch):
+    lot, journal = recover_lot(str(tmp_path), fsync=False)
+    lot.create_parking_lot(3, 1, 1)
+    park(lot, "A")
+    copies = []
+    snapshot = ParkingLot.snapshot
+    monkeypatch.setattr(ParkingLot, "snapshot", lambda self: copies.append(self) or snapshot(self))
+    assert journal.checkpoint(lot) == lot.journal.last_sequence
+    assert copies == [lot]
+    journal.close()
+
+
+def test_recover_cuts_off_torn_record(tmp_path):
+    lot, journal = recover_lot(str(tmp_path), fsync=False)
+    lot.create_parking_lot(3, 0, 1)
+    park(lot, "A")
+    journal.close()
+    segment = max(os.path.join(tmp_path, name) for name in os.listdir(tmp_path) if name.endswith(".log"))
+    with open(segment, "ab") as segment_file:
+        segment_file.write(b"\x40\x00\x00\x00torn")
+
+    recovered, journal = recover_lot(str(tmp_path), fsync=False)
+    park(recovered, "B")
+    journal.close()
+    recovered, journal = recover_lot(str(tmp_path), fsync=False)
+    journal.close()
+    assert vehicles(recovered) == ([(1, "A"), (2, "B")], [])
+
+
+def test_attach_to_populated_lot_keeps_existing_state(tmp_path):
+    lot = ParkingLot()
+    lot.create_parking_lot(3, 1, 2)
+    park(lot, "A")
+    park(lot, "E", is_electric=True)
+
+    journal = ParkingJournal(str(tmp_path), fsync=False)
+    lot.attach_journal(journal)
+    park(lot, "B")
+    journal.close()
+
+    recovered, journal = recover_lot(str(tmp_path), fsync=False)
+    journal.close()
+    assert recovered.is_initialized
+    assert recovered.level == 2
+    assert vehicles(recovered) == ([(1, "A"), (2, "B")], [(1, "E")])
+
+
+def test_failed_journal_append_leaves_lot_unchanged(tmp_path):
+    lot, journal = recover_lot(str(tmp_path), fsync=False)
+    lot.create_parking_lot(2, 0, 1)
+    park(lot, "A")
+    journal.close()
+
+    assert park(lot, "C") == -1
+    assert vehicles(lot) == ([(1, "A")], [])
+    assert lot.find_slot_by_registration("C") == {"found": False}
+    assert lot.regular_allocator.occupied_count == 1
+
+    assert lot.remove_vehicle(1, False) is False
+    assert vehicles(lot) == ([(1, "A")], [])
+    assert lot.find_slot_by_registration("A")["found"]
+    assert lot.regular_allocator.occupied_count == 1
@@ -0,0 +1,88 @@
+import struct
+import zlib
+
+import pytest
+
+from Garage import Garage
+from LotSnapshot import load_garage, load_lot, read_snapshot, save_snapshot
+from ParkingLot import ParkingLot
+from SlotStore import ColumnarSlotStore
+
+
+def details(vehicles):
+    return [(slot_number, vehicle.get_type(), vehicle.regnum, vehicle.make, vehicle.model, vehicle.color,
+             getattr(vehicle, "charge", None)) for slot_number, vehicle in vehicles]
+
+
+def sample_lot():
+    lot = ParkingLot()
+    lot.create_parking_lot(4, 3, 7)
+    lot.park_vehicle("A", "Toyota", "Corolla", "Red", False, False)
+    lot.park_vehicle("M", "Honda", "CB500", "Black", False, True)
+    lot.park_vehicle("Ü-1", "Škoda", "Octavia", "Grün", False, False)
+    lot.park_vehicle("E", "Tesla", "Model 3", "Red", True, False)
+    lot.park_vehicle("EM", "Zero", "SR/F", "White", True, True)
+    lot.remove_vehicle(2, False)
+    lot.ev_slots[0].charge = 42.5
+    lot.ev_slots[1].charge = 80
+    return lot
+
+
+@pytest.mark.parametrize("slot_store", [None, ColumnarSlotStore])
+def test_lot_round_trip(tmp_path, slot_store):
+    lot = sample_lot()
+    path = str(tmp_path / "lot.snap")
+    assert save_snapshot(lot, path) == (tmp_path / "lot.snap").stat().st_size
+
+    restored = load_lot(path, slot_store) if slot_store else load_lot(path)
+    assert (restored.level, restored.regular_capacity, restored.ev_capacity) == (7, 4, 3)
+    expected_ev = details(lot.get_all_ev_vehicles())
+    if slot_store is ColumnarSlotStore:
+        # Columnar stores keep whole percentages
+        expected_ev[0] = expected_ev[0][:-1] + (round(42.5),)
+    assert details(restored.get_all_regular_vehicles()) == details(lot.get_all_regular_vehicles())
+    assert details(restored.get_all_ev_vehicles()) == expected_ev
+    # Indexes and free slots are rebuilt
+    assert restored.find_slot_by_registration("Ü-1") == {"slot_number": 3, "type": "regular", "found": True}
+    assert [vehicle.regnum for _, vehicle in restored.find_vehicles_by_color("red")["ev"]] == ["E"]
+    assert restored.park_vehicle("B", "Ford", "Focus", "Blue", False, False) == 2
+
+
+def test_garage_round_trip(tmp_path):
+    garage = Garage()
+    garage.add_level(1, 2, 1)
+    garage.add_level(2, 1, 0)
+    for registration in ("A", "B", "C"):
+        garage.park_vehicle(registration, "Toyota", "Corolla", "Red", False, False)
+    path = str(tmp_path / "garage.snap")
+    save_snapshot(garage, path)
+
+    with pytest.raises(ValueError):
+        load_lot(path)
+    restored = load_garage(path)
+    assert sorted(restored.lots) == [1, 2]
+    assert restored.find_slot_by_registration("C") == {"slot_number": 1, "type": "regular", "found": True, "level": 2}
+    assert sorted(restored.find_vehicles_by_color("RED")) == [1, 2]
+
+
+def test_corrupt_snapshots_are_rejected(tmp_path):
+    path = tmp_path / "lot.snap"
+    save_snapshot(sample_lot(), str(path))
+    data = path.read_bytes()
+
+    flipped = bytearray(data)
+    flipped[len(data) // 2] ^= 0x01
+    path.write_bytes(bytes(flipped))
+    with pytest.raises(ValueError, match="checksum"):
+        read_snapshot(str(path))
+
+    path.write_bytes(data[:6])
+    with pytest.raises(ValueError, match="truncated"):
+        read_snapshot(str(path))
+
+    # A valid checksum over the wrong magic is still refused
+    body = b"XXXX" + data[4:-4]
+    path.write_bytes(body + struct.pack("<I", zlib.crc32(body)))
+    with pytest.raises(ValueError, match="Not a parking lot snapshot"):
+        read_snapshot(str(path))
+
@@ -0,0 +1,26 @@
+from MappedSlotStore import flush_lot, open_mapped_lot
+
+
+def test_reopen_serves_vehicles_on_the_created_level(tmp_path):
+    lot = open_mapped_lot(str(tmp_path))
+    lot.create_parking_lot(3, 2, 4)
+    lot.park_vehicle("A", "Toyota", "Corolla", "Red", False, False)
+    lot.park_vehicle("B", "Honda", "Civic", "Blue", False, False)
+    lot.park_vehicle("E", "Tesla", "Model 3", "White", True, False)
+    lot.remove_vehicle(1, False)
+    flush_lot(lot)
+
+    reopened = open_mapped_lot(str(tmp_path))
+    assert reopened.is_initialized
+    assert (reopened.level, reopened.regular_capacity, reopened.ev_capacity) == (4, 3, 2)
+    assert [(slot_number, vehicle.regnum) for slot_number, vehicle in reopened.get_all_regular_vehicles()] == [(2, "B")]
+    assert [(slot_number, vehicle.regnum) for slot_number, vehicle in reopened.get_all_ev_vehicles()] == [(1, "E")]
+    assert reopened.find_slot_by_registration("B")["slot_number"] == 2
+    # Freed slots are handed out again
+    assert reopened.park_vehicle("C", "Ford", "Focus", "Red", False, False) == 1
+
+
+def test_level_argument_overrides_the_stored_level(tmp_path):
+    open_mapped_lot(str(tmp_path)).create_parking_lot(1, 0, 2)
+    assert open_mapped_lot(str(tmp_path)).level == 2
+    assert open_mapped_lot(str(tmp_path), level=5).level == 5
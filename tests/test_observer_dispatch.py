@@ -0,0 +1,41 @@
+from ObserverDispatch import AsyncObserverDispatcher, BackpressurePolicy
+from ParkingLot import ParkingLot, ParkingObserver
+
+
+class Recorder(ParkingObserver):
+    def __init__(self):
+        self.events = []
+
+    def update(self, event_type, message):
+        self.events.append(message)
+
+
+def test_events_after_close_are_dropped_and_counted():
+    recorder = Recorder()
+    dispatcher = AsyncObserverDispatcher()
+    dispatcher.attach_observer(recorder)
+    lot = ParkingLot()
+    lot.attach_observer(dispatcher)
+    lot.create_parking_lot(2, 0, 1)
+    dispatcher.close()
+
+    # The lot keeps working once its dispatcher is closed
+    assert lot.park_vehicle("A", "Toyota", "Corolla", "Red", False, False) == 1
+    assert lot.remove_vehicle(1, False)
+    assert len(recorder.events) == 1
+    stats = dispatcher.stats[recorder]
+    assert (stats.delivered, stats.dropped, dispatcher.dropped) == (1, 2, 2)
+
+
+def test_drop_oldest_counts_in_delivery_stats():
+    recorder = Recorder()
+    dispatcher = AsyncObserverDispatcher(max_queue=1, policy=BackpressurePolicy.DROP_OLDEST)
+    dispatcher.attach_observer(recorder)
+    with dispatcher._condition:
+        # Worker can't take anything while the condition is held, so the queue overflows
+        for n in range(3):
+            dispatcher.update(None, str(n))
+    dispatcher.close()
+    stats = dispatcher.stats[recorder]
+    assert recorder.events == ["2"]
+    assert (stats.delivered, stats.dropped, dispatcher.dropped) == (1, 2, 2)
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from OccupancySeries import ALL_POOLS, OccupancySeries
+from VehicleIndex import EV_SLOT, REGULAR_SLOT
+
+RESOLUTIONS = (("fine", 1, 120), ("mid", 10, 40), ("coarse", 100, 20))
+CAPACITY = 50
+
+
+def reference(events, seconds, end):
+    # Brute force - bucket -> (time-weighted mean, peak, low) from the raw (time, occupied) steps
+    buckets = {}
+    for (at, value), (until, _) in zip(events, events[1:] + [(end, None)]):
+        while at < until:
+            bucket = int(at // seconds)
+            step_end = min(until, (bucket + 1) * seconds)
+            area, peak, low = buckets.get(bucket, (0.0, -1, float("inf")))
+            buckets[bucket] = (area + value * (step_end - at), max(peak, value), min(low, value))
+            at = step_end
+    return {bucket: (area / seconds, peak, low) for bucket, (area, peak, low) in buckets.items()}
+
+
+def simulate(seed, duration):
+    # Random parks and removes in both pools, with quiet spells long enough to span coarse buckets
+    rng = random.Random(seed)
+    clock = [0.0]
+    occupancy = OccupancySeries(RESOLUTIONS, clock=lambda: clock[0])
+    occupancy.reset(1, [(REGULAR_SLOT, 0, CAPACITY), (EV_SLOT, 0, CAPACITY)])
+    counts = {REGULAR_SLOT: 0, EV_SLOT: 0}
+    events = {REGULAR_SLOT: [(0.0, 0)], EV_SLOT: [(0.0, 0)], ALL_POOLS: [(0.0, 0)]}
+    while True:
+        clock[0] += rng.choice((0.25, 0.5, 1.5, 4.0)) if rng.random() < 0.97 else rng.uniform(50, 250) // 0.25 * 0.25
+        if clock[0] >= duration:
+            break
+        pool = rng.choice((REGULAR_SLOT, EV_SLOT))
+        step = 1 if counts[pool] == 0 or (counts[pool] < CAPACITY and rng.random() < 0.55) else -1
+        counts[pool] += step
+        occupancy.record(1, pool, counts[pool], CAPACITY)
+        events[pool].append((clock[0], counts[pool]))
+        events[ALL_POOLS].append((clock[0], counts[REGULAR_SLOT] + counts[EV_SLOT]))
+    clock[0] = duration
+    return occupancy, events
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_buckets_match_a_replay_of_every_change(seed):
+    duration = 2500.25
+    occupancy, events = simulate(seed, duration)
+    for pool in (REGULAR_SLOT, EV_SLOT, ALL_POOLS):
+        for name, seconds, size in RESOLUTIONS:
+            series = occupancy.series(1, pool, name)
+            expected = reference(events[pool], seconds, duration)
+            closed = series["points"][:-1]
+            # Ring keeps the newest size buckets, all of them closed before the open one
+            assert len(closed) == size
+            assert closed[-1][0] == (int(duration // seconds) - 1) * seconds
+            for start, mean, peak, low in closed:
+                expected_mean, expected_peak, expected_low = expected[start // seconds]
+                assert mean == pytest.approx(expected_mean)
+                assert (peak, low) == (expected_peak, expected_low)
+            # Open bucket - the mean so far, over the part of the bucket that has passed
+            start, mean, peak, low = series["points"][-1]
+            expected_mean, expected_peak, expected_low = expected[start // seconds]
+            assert mean == pytest.approx(expected_mean * seconds / (duration - start))
+            assert (peak, low) == (expected_peak, expected_low)
+
+
+def test_range_queries_return_only_overlapping_buckets():
+    occupancy, _ = simulate(4, 2500.25)
+    points = occupancy.series(1, ALL_POOLS, "mid", 2200, 2300)["points"]
+    assert [start for start, _, _, _ in points] == list(range(2200, 2300, 10))
+    assert occupancy.series(2, ALL_POOLS, "mid") is None
+    with pytest.raises(ValueError):
+        occupancy.series(1, ALL_POOLS, "week")
+
+
+def test_resolutions_must_nest():
+    with pytest.raises(ValueError):
+        OccupancySeries((("fine", 2, 10), ("mid", 5, 10)))
@@ -0,0 +1,77 @@
+import itertools
+import random
+
+import pytest
+
+from ParkingLot import ParkingLot
+from ParkingQuery import AttributeEquals, ChargeAtLeast, ChargeBelow, SlotTypeIs, VehicleTypeIs
+from SlotStore import ColumnarSlotStore, ListSlotStore
+from VehicleIndex import EV_SLOT, REGULAR_SLOT
+
+COLORS = ("Red", "red", "Blue", "WHITE")
+MAKES = ("Toyota", "TESLA", "Honda")
+
+
+def random_lot(slot_store, seed):
+    # Mixed lot with some vehicles removed again, so index posting sets have churned
+    rng = random.Random(seed)
+    lot = ParkingLot(slot_store)
+    lot.create_parking_lot(60, 30, 1)
+    for number in range(100):
+        lot.park_vehicle(f"R{number}", rng.choice(MAKES), "Model", rng.choice(COLORS),
+                         rng.random() < 0.4, rng.random() < 0.3)
+    for slot_number in rng.sample(range(1, 61), 15):
+        lot.remove_vehicle(slot_number, False)
+    for slot_index in lot.ev_slots.occupied_indexes():
+        vehicle = lot.ev_slots[slot_index]
+        vehicle.charge = rng.randrange(101)
+        # Columnar stores hand out copies - write the change back
+        lot.ev_slots[slot_index] = vehicle
+    return lot
+
+
+def full_scan(lot, predicates):
+    return {
+        "regular": [(slot_number, vehicle.regnum) for slot_number, vehicle in lot.get_all_regular_vehicles()
+                    if all(predicate.matches(REGULAR_SLOT, vehicle) for predicate in predicates)],
+        "ev": [(slot_number, vehicle.regnum) for slot_number, vehicle in lot.get_all_ev_vehicles()
+               if all(predicate.matches(EV_SLOT, vehicle) for predicate in predicates)],
+    }
+
+
+PREDICATES = [
+    AttributeEquals("color", "RED"),
+    AttributeEquals("make", "tesla"),
+    AttributeEquals("model", "model"),
+    VehicleTypeIs("Motorcycle"),
+    SlotTypeIs(EV_SLOT),
+    ChargeBelow(40),
+    ChargeAtLeast(20),
+]
+
+
+@pytest.mark.parametrize("slot_store", [ListSlotStore, ColumnarSlotStore])
+def test_planned_queries_match_a_full_scan(slot_store):
+    lot = random_lot(slot_store, 5)
+    for size in range(4):
+        for predicates in itertools.combinations(PREDICATES, size):
+            results = lot.query(*predicates)
+            planned = {pool: [(slot_number, vehicle.regnum) for slot_number, vehicle in results[pool]]
+                       for pool in ("regular", "ev")}
+            assert planned == full_scan(lot, predicates), predicates
+
+
+def test_slot_type_predicates_that_conflict_match_nothing():
+    lot = random_lot(ListSlotStore, 6)
+    results = lot.query(SlotTypeIs(EV_SLOT), SlotTypeIs(REGULAR_SLOT))
+    assert (list(results["regular"]), list(results["ev"])) == ([], [])
+
+
+def test_query_skips_vehicles_removed_after_planning():
+    lot = ParkingLot()
+    lot.create_parking_lot(3, 0, 1)
+    for registration in ("A", "B", "C"):
+        lot.park_vehicle(registration, "Toyota", "Corolla", "Red", False, False)
+    results = lot.query(AttributeEquals("color", "red"))
+    lot.remove_vehicle(2, False)
+    assert [vehicle.regnum for _, vehicle in results["regular"]] == ["A", "C"]
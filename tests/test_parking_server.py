@@ -0,0 +1,83 @@
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+from ParkingServer import MAX_BODY_BYTES, ParkingHTTPServer, ParkingService, RequestError
+
+
+@pytest.fixture
+def service():
+    service = ParkingService()
+    service.create_lot({"regular_capacity": 2, "ev_capacity": 2})
+    return service
+
+
+def test_flags_must_be_json_booleans(service):
+    park = {"registration": "A", "make": "Tesla", "model": "Model 3", "color": "Red"}
+    for value in ("false", "true", 0, 1, None):
+        with pytest.raises(RequestError):
+            service.park({**park, "is_electric": value})
+    with pytest.raises(RequestError):
+        service.remove({"slot_number": 1, "is_ev_slot": "false"})
+    assert service.park({**park, "is_electric": False}) == {"parked": True, "slot_number": 1}
+    assert service.find("A")["type"] == "regular"
+    assert service.remove({"slot_number": 1, "is_ev_slot": False}) == {"removed": True}
+
+
+@pytest.fixture
+def server_port(service):
+    server = ParkingHTTPServer(("127.0.0.1", 0), service)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def test_unexpected_errors_answer_json_500(service, server_port):
+    def broken(body):
+        raise KeyError("boom")
+
+    service.park = broken
+    connection = http.client.HTTPConnection("127.0.0.1", server_port, timeout=5)
+    connection.request("POST", "/park", json.dumps({"registration": "A"}))
+    response = connection.getresponse()
+    assert response.status == 500
+    assert json.loads(response.read()) == {"error": "Internal server error"}
+    # The connection still serves the next request
+    connection.request("GET", "/status")
+    response = connection.getresponse()
+    assert response.status == 200
+    assert json.loads(response.read())["regular"] == []
+    connection.close()
+
+
+@pytest.mark.parametrize("length", ["-1", "abc", str(MAX_BODY_BYTES + 1)])
+def test_invalid_content_length_is_rejected_without_reading(server_port, length):
+    with socket.create_connection(("127.0.0.1", server_port), timeout=5) as client:
+        client.sendall(f"POST /park HTTP/1.1\r\nHost: test\r\nContent-Length: {length}\r\n\r\n".encode())
+        response = http.client.HTTPResponse(client)
+        response.begin()
+        assert response.status == 400
+        assert json.loads(response.read()) == {"error": "Invalid Content-Length"}
+
+
+def test_occupancy_is_opt_in(service):
+    with pytest.raises(RequestError):
+        service.occupancy_series({})
+
+
+def test_occupancy_reports_the_lot_buckets():
+    service = ParkingService(record_occupancy=True)
+    service.create_lot({"regular_capacity": 2, "ev_capacity": 2})
+    service.park({"registration": "A", "make": "Tesla", "model": "Model 3", "color": "Red", "is_electric": True})
+    series = service.occupancy_series({"pool": ["EV"], "resolution": ["second"]})
+    assert (series["pool"], series["capacity"], series["occupied"]) == ("EV", 2, 1)
+    assert series["points"][-1]["peak"] <= 1
+    with pytest.raises(RequestError):
+        service.occupancy_series({"pool": ["garage"]})
+    with pytest.raises(RequestError):
+        service.occupancy_series({"resolution": ["week"]})
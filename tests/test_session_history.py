@@ -0,0 +1,99 @@
+from SessionHistory import SessionHistory
+from Vehicle import VehicleFactory
+from VehicleIndex import EV_SLOT, REGULAR_SLOT
+
+
+def vehicle(registration):
+    return VehicleFactory.create_vehicle(registration, "Toyota", "Corolla", "Red")
+
+
+def history_at(clock):
+    return SessionHistory(chunk_seconds=60, clock=lambda: clock[0])
+
+
+def registrations(sessions):
+    return sorted(session["registration"] for session in sessions)
+
+
+def test_sessions_for_lists_completed_then_open_stays():
+    clock = [10.0]
+    history = history_at(clock)
+    history.record_arrival(REGULAR_SLOT, 0, vehicle("A"))
+    clock[0] = 40.0
+    history.record_departure(REGULAR_SLOT, 0)
+    clock[0] = 50.0
+    history.record_arrival(EV_SLOT, 2, vehicle("A"))
+    clock[0] = 70.0
+
+    first, current = history.sessions_for("A")
+    assert (first["arrived_at"], first["departed_at"], first["dwell"], first["slot_number"]) == (10.0, 40.0, 30.0, 1)
+    assert (current["type"], current["slot_number"], current["departed_at"], current["dwell"]) == (EV_SLOT, 3, None, 20.0)
+    assert history.sessions_for("missing") == []
+
+
+def test_sessions_overlapping_accepts_int_bounds():
+    clock = [10.5]
+    history = history_at(clock)
+    history.record_arrival(REGULAR_SLOT, 0, vehicle("A"))
+    clock[0] = 100.5
+    history.record_arrival(REGULAR_SLOT, 1, vehicle("B"))
+    clock[0] = 200.5
+    history.record_departure(REGULAR_SLOT, 0)
+    history.record_departure(REGULAR_SLOT, 1)
+
+    assert registrations(history.sessions_overlapping(0, 50)) == ["A"]
+    assert registrations(history.sessions_overlapping(0.0, 50.0)) == ["A"]
+    assert registrations(history.sessions_overlapping(150, 160)) == ["A", "B"]
+    assert registrations(history.sessions_overlapping(300, 400)) == []
+
+
+def test_sessions_overlapping_includes_stays_in_progress():
+    clock = [0.0]
+    history = history_at(clock)
+    history.record_arrival(REGULAR_SLOT, 0, vehicle("A"))
+    clock[0] = 100.0
+    history.record_arrival(REGULAR_SLOT, 1, vehicle("B"))
+    clock[0] = 120.0
+    history.record_departure(REGULAR_SLOT, 0)
+    clock[0] = 130.0
+
+    assert registrations(history.sessions_overlapping(10, 50)) == ["A"]
+    assert registrations(history.sessions_overlapping(110, 200)) == ["A", "B"]
+    assert registrations(history.sessions_overlapping(125, 200)) == ["B"]
+
+
+def test_prune_drops_old_chunks_and_postings():
+    clock = [0.0]
+    history = history_at(clock)
+    for n in range(5):
+        clock[0] = n * 60.0
+        history.record_arrival(REGULAR_SLOT, 0, vehicle("A"))
+        clock[0] += 30.0
+        history.record_departure(REGULAR_SLOT, 0)
+
+    assert len(history) == 5
+    assert history.prune(180.0) == 3
+    assert len(history) == 2
+    assert [session["arrived_at"] for session in history.sessions_for("A")] == [180.0, 240.0]
+
+
+def test_open_stay_index_survives_churn():
+    # Many stays through a few slots - the arrival-ordered open list is compacted along the way
+    clock = [0.0]
+    history = history_at(clock)
+    expected_open = {}
+    for n in range(600):
+        clock[0] = float(n)
+        slot_index = n % 7
+        if slot_index in expected_open:
+            history.record_departure(REGULAR_SLOT, slot_index)
+        registration = f"V{n}"
+        history.record_arrival(REGULAR_SLOT, slot_index, vehicle(registration))
+        expected_open[slot_index] = (registration, float(n))
+    clock[0] = 1000.0
+
+    assert len(history._open_stays) <= 2 * len(expected_open) + 64
+    open_sessions = [session for session in history.sessions_overlapping(0, 2000) if session["departed_at"] is None]
+    assert registrations(open_sessions) == sorted(registration for registration, _ in expected_open.values())
+    late = [session for session in history.sessions_overlapping(0, 596) if session["departed_at"] is None]
+    assert registrations(late) == sorted(registration for registration, arrival in expected_open.values() if arrival < 596)
@@ -0,0 +1,52 @@
+import random
+
+from SlotAllocator import SlotAllocator
+
+
+def test_allocate_hands_out_the_lowest_free_slot():
+    allocator = SlotAllocator(4)
+    assert [allocator.allocate() for _ in range(4)] == [0, 1, 2, 3]
+    assert allocator.allocate() == -1
+    assert allocator.release(2) and allocator.release(0)
+    assert allocator.allocate() == 0
+    assert allocator.allocate() == 2
+    assert (allocator.occupied_count, allocator.free_count) == (4, 0)
+
+
+def test_released_slot_is_handed_out_once():
+    allocator = SlotAllocator(3)
+    for _ in range(3):
+        allocator.allocate()
+    assert allocator.release(1)
+    # A second release of a free slot is refused, so the heap holds no duplicate to hand out later
+    assert not allocator.release(1)
+    assert allocator.free_count == 1
+    assert allocator.allocate() == 1
+    assert allocator.allocate() == -1
+
+
+def test_random_operations_match_a_free_set():
+    rng = random.Random(7)
+    allocator = SlotAllocator(40)
+    free = set(range(40))
+    for _ in range(5000):
+        if rng.random() < 0.5:
+            assert allocator.allocate() == (min(free) if free else -1)
+            free.discard(min(free, default=None))
+        else:
+            index = rng.randrange(40)
+            assert allocator.release(index) == (index not in free)
+            free.add(index)
+        assert allocator.free_count == len(free)
+        assert all(allocator.is_free(index) == (index in free) for index in range(40))
+
+
+def test_restore_and_copy():
+    allocator = SlotAllocator()
+    allocator.restore(5, [0, 3])
+    assert (allocator.occupied_count, allocator.free_count) == (2, 3)
+    clone = allocator.copy()
+    assert allocator.allocate() == 1
+    # The copy keeps its own free slots
+    assert [clone.allocate() for _ in range(4)] == [1, 2, 4, -1]
+    assert allocator.allocate() == 2
@@ -0,0 +1,37 @@
+from SqliteSlotStore import open_sqlite_lot
+
+
+def test_reopen_serves_vehicles_on_the_created_level(tmp_path):
+    path = str(tmp_path / "lot.db")
+    lot = open_sqlite_lot(path)
+    lot.create_parking_lot(3, 2, 4)
+    lot.park_vehicle("A", "Toyota", "Corolla", "Red", False, False)
+    lot.park_vehicle("B", "Honda", "Civic", "Blue", False, False)
+    lot.park_vehicle("E", "Tesla", "Model 3", "White", True, False)
+    lot.remove_vehicle(1, False)
+    lot.storage.close()
+
+    reopened = open_sqlite_lot(path)
+    assert reopened.is_initialized
+    assert (reopened.level, reopened.regular_capacity, reopened.ev_capacity) == (4, 3, 2)
+    assert [(slot_number, vehicle.regnum) for slot_number, vehicle in reopened.get_all_regular_vehicles()] == [(2, "B")]
+    assert [(slot_number, vehicle.regnum) for slot_number, vehicle in reopened.get_all_ev_vehicles()] == [(1, "E")]
+    assert reopened.find_slot_by_registration("B")["slot_number"] == 2
+    assert reopened.park_vehicle("C", "Ford", "Focus", "Red", False, False) == 1
+    assert open_sqlite_lot(path, level=5).level == 5
+
+
+
+def test_attribute_search_reads_each_pool_with_one_select():
+    lot = open_sqlite_lot(":memory:")
+    lot.create_parking_lot(50, 5, 1)
+    for n in range(40):
+        lot.park_vehicle(f"R{n}", "Ford", "Focus", "Red" if n % 2 else "Blue", False, False)
+    lot.park_vehicle("E", "Tesla", "Model 3", "RED", True, False)
+    selects = []
+    lot.storage.connection.set_trace_callback(lambda sql: selects.append(sql) if sql.startswith("SELECT") else None)
+
+    found = lot.find_vehicles_by_color("red")
+    assert [slot_number for slot_number, _ in found["regular"]] == list(range(2, 41, 2))
+    assert [vehicle.regnum for _, vehicle in found["ev"]] == ["E"]
+    assert len(selects) == 2
@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("tkinter")
+
+from StatusView import LotStatusRows, build_status_report
+from Vehicle import VehicleFactory
+
+
+def parked(count, prefix, is_electric=False):
+    return [(number + 1, VehicleFactory.create_vehicle(f"{prefix}{number}", "Toyota", "Corolla", "Red", is_electric))
+            for number in range(count)]
+
+
+def test_rows_match_the_text_report():
+    regular, ev = parked(3, "R"), parked(2, "E", True)
+    rows = LotStatusRows(regular, ev, 2)
+    assert len(rows) == 7
+    assert [rows[index] for index in (0, 4)] == [("REGULAR VEHICLES (3)", "title"), ("ELECTRIC VEHICLES (2)", "title")]
+    body = [rows[index][0] for index in (1, 2, 3, 5, 6)]
+    report = build_status_report(regular, ev, 2).splitlines()
+    assert body == [line for line in report if line.startswith(("1 ", "2 ", "3 "))]
+    with pytest.raises(IndexError):
+        rows[7]
+
+
+def test_empty_sections_get_one_row():
+    rows = LotStatusRows([], parked(1, "E", True), 1)
+    assert len(rows) == 4
+    assert rows[1] == ("  (No vehicles parked)", None)
+    assert rows[3][0].split()[:3] == ["1", "1", "E0"]
+
+
+def test_only_requested_rows_are_formatted():
+    # A 100,000 bay lot costs nothing until rows are read
+    class Unformattable:
+        def __getattr__(self, name):
+            raise AssertionError("row formatted")
+
+    regular = [(number + 1, Unformattable()) for number in range(100_000)]
+    rows = LotStatusRows(regular, [], 1)
+    assert len(rows) == 100_003
+    assert rows[100_002] == ("  (No electric vehicles parked)", None)
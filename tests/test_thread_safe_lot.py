@@ -0,0 +1,130 @@
+import sys
+import threading
+import time
+
+from ParkingJournal import recover_lot
+from ParkingLot import ParkingLot
+from SlotStore import ListSlotStore
+
+GATES = 8
+ROUNDS = 300
+KEPT = 5
+
+
+class YieldingSlotStore(ListSlotStore):
+    # Gives up the GIL on every slot write, so gates interleave inside park and remove
+    def __setitem__(self, index, vehicle):
+        time.sleep(0)
+        super().__setitem__(index, vehicle)
+
+
+def run_threads(target):
+    errors = []
+
+    def guarded(number):
+        try:
+            target(number)
+        except Exception as error:
+            errors.append(error)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=guarded, args=(number,)) for number in range(GATES)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+
+
+def run_gates(lot):
+    # Every gate parks and removes its own vehicles in both pools, then leaves KEPT of each parked
+    def gate(number):
+        for round_number in range(ROUNDS):
+            for is_electric in (False, True):
+                registration = f"G{number}-{round_number}-{int(is_electric)}"
+                slot_number = lot.park_vehicle(registration, "Toyota", "Prius", "Red", is_electric, False)
+                assert slot_number > 0
+                if round_number >= ROUNDS - KEPT:
+                    continue
+                assert lot.find_slot_by_registration(registration) == {
+                    "slot_number": slot_number, "type": "EV" if is_electric else "regular", "found": True}
+                assert lot.remove_vehicle(slot_number, is_electric)
+
+    run_threads(gate)
+
+
+def kept_registrations(is_electric):
+    return {f"G{number}-{round_number}-{int(is_electric)}"
+            for number in range(GATES) for round_number in range(ROUNDS - KEPT, ROUNDS)}
+
+
+def occupancy(lot):
+    return ({slot_number: vehicle.regnum for slot_number, vehicle in lot.get_all_regular_vehicles()},
+            {slot_number: vehicle.regnum for slot_number, vehicle in lot.get_all_ev_vehicles()})
+
+
+def test_concurrent_parks_and_removes_stay_consistent():
+    lot = ParkingLot(YieldingSlotStore, thread_safe=True)
+    capacity = GATES * (KEPT + 1)
+    lot.create_parking_lot(capacity, capacity, 1)
+    run_gates(lot)
+
+    regular, ev = occupancy(lot)
+    assert set(regular.values()) == kept_registrations(False)
+    assert set(ev.values()) == kept_registrations(True)
+    for slots, slot_type in ((regular, "regular"), (ev, "EV")):
+        for slot_number, registration in slots.items():
+            assert lot.find_slot_by_registration(registration) == {
+                "slot_number": slot_number, "type": slot_type, "found": True}
+    # Allocators hand out exactly the slots left free
+    parked = [lot.park_vehicle(f"F{n}", "Ford", "Focus", "Blue", False, False) for n in range(capacity)]
+    assert sorted(slot_number for slot_number in parked if slot_number > 0) == sorted(
+        set(range(1, capacity + 1)) - set(regular))
+
+
+def test_concurrent_changes_recover_from_the_journal(tmp_path):
+    lot, journal = recover_lot(str(tmp_path), YieldingSlotStore, thread_safe=True, fsync=False)
+    capacity = GATES * (KEPT + 1)
+    lot.create_parking_lot(capacity, capacity, 1)
+    run_gates(lot)
+    journal.close()
+
+    recovered, journal = recover_lot(str(tmp_path), fsync=False)
+    journal.close()
+    assert occupancy(recovered) == occupancy(lot)
+
+
+def test_gates_racing_for_one_registration_park_it_once():
+    lot = ParkingLot(YieldingSlotStore, thread_safe=True)
+    lot.create_parking_lot(GATES * ROUNDS, 0, 1)
+    parked = [[] for _ in range(GATES)]
+
+    def gate(number):
+        for round_number in range(ROUNDS):
+            if lot.park_vehicle(f"S{round_number}", "Toyota", "Prius", "Red", False, False) > 0:
+                parked[number].append(round_number)
+
+    run_threads(gate)
+    assert sorted(sum(parked, [])) == list(range(ROUNDS))
+    assert sorted(vehicle.regnum for _, vehicle in lot.get_all_regular_vehicles()) == sorted(f"S{n}" for n in range(ROUNDS))
+
+
+def test_attribute_search_skips_slots_refilled_since_the_lookup():
+    lot = ParkingLot(thread_safe=True)
+    lot.create_parking_lot(2, 0, 1)
+    lot.park_vehicle("A", "Toyota", "Prius", "Red", False, False)
+    lot.park_vehicle("B", "Honda", "Civic", "Red", False, False)
+    index = lot.attribute_indexes["color"]
+    # Postings as they were when the search looked them up
+    stale = set(index.lookup("red"))
+    # Another gate removes A and parks a blue car in its slot before the search reads the slots
+    lot.remove_vehicle(1, False)
+    lot.park_vehicle("C", "Ford", "Focus", "Blue", False, False)
+    index.lookup = lambda value: stale
+
+    found = lot.find_vehicles_by_color("red")
+    assert [(slot_number, vehicle.regnum) for slot_number, vehicle in found["regular"]] == [(2, "B")]
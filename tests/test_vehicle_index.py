@@ -0,0 +1,65 @@
+from ParkingLot import ParkingLot
+from VehicleIndex import EV_SLOT, REGULAR_SLOT
+
+
+def park(lot, registration, color="Red", make="Toyota", is_electric=False):
+    return lot.park_vehicle(registration, make, "Corolla", color, is_electric, False)
+
+
+def registrations(matches):
+    return ([(slot_number, vehicle.regnum) for slot_number, vehicle in matches["regular"]],
+            [(slot_number, vehicle.regnum) for slot_number, vehicle in matches["ev"]])
+
+
+def test_registration_index_follows_parks_and_removes():
+    lot = ParkingLot()
+    lot.create_parking_lot(3, 2, 1)
+    assert park(lot, "A") == 1
+    assert park(lot, "E", is_electric=True) == 1
+    assert lot.find_slot_by_registration("A") == {"slot_number": 1, "type": REGULAR_SLOT, "found": True}
+    assert lot.find_slot_by_registration("E") == {"slot_number": 1, "type": EV_SLOT, "found": True}
+
+    # Duplicates are refused in either pool
+    assert park(lot, "A") == -1
+    assert park(lot, "A", is_electric=True) == -1
+    assert lot.remove_vehicle(1, False)
+    assert lot.find_slot_by_registration("A") == {"found": False}
+    assert park(lot, "A", is_electric=True) == 2
+    assert lot.find_slot_by_registration("A") == {"slot_number": 2, "type": EV_SLOT, "found": True}
+
+
+def test_registration_index_is_rebuilt_on_create():
+    lot = ParkingLot()
+    lot.create_parking_lot(2, 0, 1)
+    park(lot, "A")
+    lot.create_parking_lot(2, 0, 1)
+    assert lot.find_slot_by_registration("A") == {"found": False}
+    assert park(lot, "A") == 1
+
+
+def test_attribute_lookups_ignore_case():
+    lot = ParkingLot()
+    lot.create_parking_lot(4, 2, 1)
+    park(lot, "A", color="Red", make="Tesla")
+    park(lot, "B", color="RED", make="Toyota")
+    park(lot, "C", color="Blue", make="TESLA")
+    park(lot, "E", color="red", make="tesla", is_electric=True)
+    for color in ("red", "Red", "rEd"):
+        assert registrations(lot.find_vehicles_by_color(color)) == ([(1, "A"), (2, "B")], [(1, "E")])
+    assert registrations(lot.find_vehicles_by_make("Tesla")) == ([(1, "A"), (3, "C")], [(1, "E")])
+    # Search results keep the vehicle's own spelling
+    assert [vehicle.color for _, vehicle in lot.find_vehicles_by_color("RED")["regular"]] == ["Red", "RED"]
+    assert registrations(lot.find_vehicles_by_color("Green")) == ([], [])
+
+
+def test_attribute_lookups_drop_removed_vehicles():
+    lot = ParkingLot()
+    lot.create_parking_lot(3, 0, 1)
+    park(lot, "A", color="Red")
+    park(lot, "B", color="red")
+    lot.remove_vehicle(1, False)
+    park(lot, "C", color="Blue")
+    assert registrations(lot.find_vehicles_by_color("RED")) == ([(2, "B")], [])
+    assert registrations(lot.find_vehicles_by_color("blue")) == ([(1, "C")], [])
+    lot.remove_vehicle(2, False)
+    assert lot.attribute_indexes["color"].lookup("red") == frozenset()